@@ -36,6 +36,21 @@ if config.config_file_name is not None:
 # This allows Alembic to auto-detect changes to models
 target_metadata = Base.metadata
 
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave objects not declared in the models out of autogenerate.
+
+    The full-text ``search_index`` table (and on SQLite its FTS5 shadow
+    tables, ``search_index_data`` etc.) is created by its migration and
+    ``app.services.search_service``, not ``Base.metadata``; without this
+    autogenerate would emit drop_table for it.
+    """
+    if type_ == "table" and name.startswith("search_index"):
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -58,6 +73,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -81,7 +97,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
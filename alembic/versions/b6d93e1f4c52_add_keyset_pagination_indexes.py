@@ -0,0 +1,45 @@
+"""Add keyset pagination indexes
+
+Revision ID: b6d93e1f4c52
+Revises: e5a1c8f4b270
+Create Date: 2026-10-18 23:12:40.528317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d93e1f4c52'
+down_revision: Union[str, Sequence[str], None] = 'e5a1c8f4b270'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_leads_created_at_id', 'leads', ['created_at', 'id'], unique=False)
+    op.create_index('ix_customers_created_at_id', 'customers', ['created_at', 'id'], unique=False)
+    op.create_index('ix_deals_created_at_id', 'deals', ['created_at', 'id'], unique=False)
+
+    # Task lists sort undated tasks first; SQLite already sorts NULLs first
+    # and does not accept NULLS FIRST in an index definition
+    due_date = 'due_date ASC'
+    if op.get_bind().dialect.name == 'postgresql':
+        due_date = 'due_date ASC NULLS FIRST'
+    op.create_index(
+        'ix_tasks_due_date_created_at_id',
+        'tasks',
+        [sa.text(due_date), sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_due_date_created_at_id', table_name='tasks')
+    op.drop_index('ix_deals_created_at_id', table_name='deals')
+    op.drop_index('ix_customers_created_at_id', table_name='customers')
+    op.drop_index('ix_leads_created_at_id', table_name='leads')
@@ -0,0 +1,63 @@
+"""Add full-text search index
+
+Revision ID: c4f81a7e2d93
+Revises: b6d93e1f4c52
+Create Date: 2026-10-19 09:41:17.604528
+
+Populate it afterwards with:
+    python -m app.services.search_service rebuild
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f81a7e2d93'
+down_revision: Union[str, Sequence[str], None] = 'b6d93e1f4c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+            "entity, entity_id UNINDEXED, owner, title, body, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_table('search_index',
+        sa.Column('entity', sa.String(length=20), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('owner_id', sa.Integer(), nullable=True),
+        sa.Column('title', sa.Text(), server_default='', nullable=False),
+        sa.Column('body', sa.Text(), server_default='', nullable=False),
+        sa.Column(
+            'document',
+            sa.dialects.postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', title), 'A') || "
+                "setweight(to_tsvector('simple', body), 'B')",
+                persisted=True
+            ),
+            nullable=True
+        ),
+        sa.PrimaryKeyConstraint('entity', 'entity_id')
+        )
+        op.create_index('ix_search_index_document', 'search_index', ['document'], unique=False, postgresql_using='gin')
+        op.create_index(
+            'ix_search_index_title_trgm', 'search_index', ['title'], unique=False,
+            postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}
+        )
+        op.create_index('ix_search_index_owner_id', 'search_index', ['owner_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TABLE IF EXISTS search_index")
@@ -0,0 +1,31 @@
+"""Rekey lead match keys with normalized name keys
+
+Revision ID: d1a6f3c8e5b2
+Revises: e5a9c2d7b3f1
+Create Date: 2026-10-21 10:02:37.184529
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1a6f3c8e5b2'
+down_revision: Union[str, Sequence[str], None] = 'e5a9c2d7b3f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keys written before "nm:" keys existed lack them; an empty index is
+    # rebuilt (with every key type) on the next smart match, or with
+    # `python -m app.services.lead_import.match_index rebuild`
+    op.execute("DELETE FROM lead_match_keys")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Older code ignores the extra "nm:" keys
+    pass
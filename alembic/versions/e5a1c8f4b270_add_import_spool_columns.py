@@ -0,0 +1,52 @@
+"""Add import spool columns to import sessions
+
+Revision ID: e5a1c8f4b270
+Revises: 9d2f6b3e8a14
+Create Date: 2026-10-18 22:03:51.174620
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c8f4b270'
+down_revision: Union[str, Sequence[str], None] = '9d2f6b3e8a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # import_sessions is created by the application on startup; if it does
+    # not exist yet it will be created with these columns
+    if not sa.inspect(op.get_bind()).has_table('import_sessions'):
+        return
+
+    with op.batch_alter_table('import_sessions') as batch_op:
+        batch_op.add_column(sa.Column('file_sha256', sa.String(length=64), nullable=True, comment='Spool digest of the uploaded file'))
+        batch_op.add_column(sa.Column('file_size', sa.BigInteger(), nullable=True, comment='Uploaded file size in bytes'))
+        batch_op.add_column(sa.Column('invalid_rows', sa.Integer(), nullable=True, comment='Rows that failed validation'))
+        batch_op.add_column(sa.Column('normalized_ref', sa.String(length=64), nullable=True, comment='Spool digest of the normalized rows (JSON Lines)'))
+        batch_op.add_column(sa.Column('validation_errors_ref', sa.String(length=64), nullable=True, comment='Spool digest of the validation errors (JSON Lines)'))
+        batch_op.create_index(batch_op.f('ix_import_sessions_file_sha256'), ['file_sha256'], unique=False)
+        batch_op.create_index(batch_op.f('ix_import_sessions_normalized_ref'), ['normalized_ref'], unique=False)
+        batch_op.create_index(batch_op.f('ix_import_sessions_validation_errors_ref'), ['validation_errors_ref'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not sa.inspect(op.get_bind()).has_table('import_sessions'):
+        return
+
+    with op.batch_alter_table('import_sessions') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_import_sessions_validation_errors_ref'))
+        batch_op.drop_index(batch_op.f('ix_import_sessions_normalized_ref'))
+        batch_op.drop_index(batch_op.f('ix_import_sessions_file_sha256'))
+        batch_op.drop_column('validation_errors_ref')
+        batch_op.drop_column('normalized_ref')
+        batch_op.drop_column('invalid_rows')
+        batch_op.drop_column('file_size')
+        batch_op.drop_column('file_sha256')
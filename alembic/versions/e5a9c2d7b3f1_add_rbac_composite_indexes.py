@@ -0,0 +1,83 @@
+"""Add composite indexes for owner-scoped list and analytics queries
+
+Revision ID: e5a9c2d7b3f1
+Revises: a8c3e6f1b9d4
+Create Date: 2026-10-20 09:14:52.617203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c2d7b3f1'
+down_revision: Union[str, Sequence[str], None] = 'a8c3e6f1b9d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _task_order():
+    # Same column order as ix_tasks_due_date_created_at_id
+    due_date = 'due_date ASC'
+    if op.get_bind().dialect.name == 'postgresql':
+        due_date = 'due_date ASC NULLS FIRST'
+    return [sa.text(due_date), sa.text('created_at DESC'), sa.text('id DESC')]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Leads: sales users' lists (optionally by status), status-filtered
+    # lists, and the phone lookup of import deduplication
+    op.create_index('ix_leads_assigned_to_id_created_at_id', 'leads', ['assigned_to_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_leads_assigned_to_id_status_created_at_id', 'leads', ['assigned_to_id', 'status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_leads_status_created_at_id', 'leads', ['status', 'created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_leads_phone'), 'leads', ['phone'], unique=False)
+
+    # Deals: sales users' lists and pipeline columns
+    op.create_index('ix_deals_owner_id_created_at_id', 'deals', ['owner_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_deals_owner_id_stage_created_at_id', 'deals', ['owner_id', 'stage', 'created_at', 'id'], unique=False)
+
+    # Customers: sales users' lists
+    op.create_index('ix_customers_assigned_to_id_created_at_id', 'customers', ['assigned_to_id', 'created_at', 'id'], unique=False)
+
+    # Tasks: sales users' lists in list order (optionally by status)
+    op.create_index(
+        'ix_tasks_assigned_to_id_due_date_created_at_id',
+        'tasks',
+        [sa.text('assigned_to_id')] + _task_order(),
+        unique=False
+    )
+    op.create_index(
+        'ix_tasks_assigned_to_id_status_due_date_created_at_id',
+        'tasks',
+        [sa.text('assigned_to_id'), sa.text('status')] + _task_order(),
+        unique=False
+    )
+
+    # Single-column indexes now leading columns of the composites above
+    op.drop_index(op.f('ix_leads_assigned_to_id'), table_name='leads')
+    op.drop_index(op.f('ix_leads_status'), table_name='leads')
+    op.drop_index(op.f('ix_deals_owner_id'), table_name='deals')
+    op.drop_index(op.f('ix_customers_assigned_to_id'), table_name='customers')
+    op.drop_index(op.f('ix_tasks_assigned_to_id'), table_name='tasks')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_tasks_assigned_to_id'), 'tasks', ['assigned_to_id'], unique=False)
+    op.create_index(op.f('ix_customers_assigned_to_id'), 'customers', ['assigned_to_id'], unique=False)
+    op.create_index(op.f('ix_deals_owner_id'), 'deals', ['owner_id'], unique=False)
+    op.create_index(op.f('ix_leads_status'), 'leads', ['status'], unique=False)
+    op.create_index(op.f('ix_leads_assigned_to_id'), 'leads', ['assigned_to_id'], unique=False)
+
+    op.drop_index('ix_tasks_assigned_to_id_status_due_date_created_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_assigned_to_id_due_date_created_at_id', table_name='tasks')
+    op.drop_index('ix_customers_assigned_to_id_created_at_id', table_name='customers')
+    op.drop_index('ix_deals_owner_id_stage_created_at_id', table_name='deals')
+    op.drop_index('ix_deals_owner_id_created_at_id', table_name='deals')
+    op.drop_index(op.f('ix_leads_phone'), table_name='leads')
+    op.drop_index('ix_leads_status_created_at_id', table_name='leads')
+    op.drop_index('ix_leads_assigned_to_id_status_created_at_id', table_name='leads')
+    op.drop_index('ix_leads_assigned_to_id_created_at_id', table_name='leads')
@@ -0,0 +1,32 @@
+"""Add deal pipeline indexes
+
+Revision ID: f2b7d4e9a1c6
+Revises: c4f81a7e2d93
+Create Date: 2026-10-19 11:06:52.318420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7d4e9a1c6'
+down_revision: Union[str, Sequence[str], None] = 'c4f81a7e2d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Pipeline columns: newest deals of a stage and keyset pages within it
+    op.create_index('ix_deals_stage_created_at_id', 'deals', ['stage', 'created_at', 'id'], unique=False)
+    # Pipeline totals: per-stage sums read from the index alone
+    op.create_index('ix_deals_stage_value_probability', 'deals', ['stage', 'value', 'probability'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_deals_stage_value_probability', table_name='deals')
+    op.drop_index('ix_deals_stage_created_at_id', table_name='deals')
@@ -1,16 +1,16 @@
 """
 FastAPI dependencies for dependency injection.
 """
-from typing import Generator
-from fastapi import Depends, HTTPException, status
+from typing import Callable, Generator
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from jwt.exceptions import InvalidTokenError
 
-from app.core.database import SessionLocal
+from app.core.database import SessionLocal, get_async_db
 from app.core.jwt import decode_token, verify_token_type
-from app.crud import user as user_crud
-from app.models.user import User, UserRole
+from app.core.principal import Principal, get_principal, get_principal_async
 from app.schemas.auth import TokenData
 
 
@@ -38,28 +38,22 @@ def get_db() -> Generator[Session, None, None]:
 security = HTTPBearer()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """
-    Dependency that extracts and validates the current user from JWT token.
-    
-    Args:
-        credentials: HTTP Authorization header with Bearer token
-        db: Database session
-        
-    Returns:
-        User: Current authenticated user
-        
-    Raises:
-        HTTPException: If token is invalid or user not found
-    """
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _token_user_id(credentials: HTTPAuthorizationCredentials) -> int:
+    """
+    Validate a bearer access token and return its user ID.
+    
+    Raises:
+        HTTPException: 401 if the token is invalid
+    """
+    credentials_exception = _credentials_exception()
     
     try:
         # Get token from credentials
@@ -87,17 +81,71 @@ def get_current_user(
     except Exception:
         raise credentials_exception
     
-    # Get user from database
-    user = user_crud.get_user(db, user_id=token_data.user_id)
+    return token_data.user_id
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> Principal:
+    """
+    Dependency that extracts and validates the current user from JWT token.
+    
+    The user is read from the principal cache, so the database is only
+    queried on a cache miss. Load the full record with
+    ``current_user.load(db)`` when a handler needs more than id, email,
+    role and is_active.
+    
+    Args:
+        credentials: HTTP Authorization header with Bearer token
+        db: Database session
+        
+    Returns:
+        Principal: Current authenticated user
+        
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    user_id = _token_user_id(credentials)
+    
+    # Get user from the principal cache (database on a miss)
+    user = get_principal(db, user_id=user_id)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    
+    return user
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """
+    ``get_current_user`` for async routes (principal cache miss goes
+    through the async engine).
+    
+    Args:
+        credentials: HTTP Authorization header with Bearer token
+        db: Async database session
+        
+    Returns:
+        Principal: Current authenticated user
+        
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    user_id = _token_user_id(credentials)
+    
+    user = await get_principal_async(db, user_id=user_id)
+    if user is None:
+        raise _credentials_exception()
     
     return user
 
 
 def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """
     Dependency that ensures the current user is active.
     
@@ -105,7 +153,7 @@ def get_current_active_user(
         current_user: User from get_current_user dependency
         
     Returns:
-        User: Current active user
+        Principal: Current active user
         
     Raises:
         HTTPException: If user is inactive
@@ -116,3 +164,40 @@ def get_current_active_user(
             detail="Inactive user"
         )
     return current_user
+
+
+async def get_current_active_user_async(
+    current_user: Principal = Depends(get_current_user_async)
+) -> Principal:
+    """
+    ``get_current_active_user`` for async routes.
+    
+    Raises:
+        HTTPException: If user is inactive
+    """
+    return get_current_active_user(current_user)
+
+
+# Statements a list endpoint may run: user lookup (on a principal cache
+# miss), count, page (with its relationships joined in) and one spare
+LIST_QUERY_BUDGET = 4
+
+
+def query_budget(limit: int) -> Callable[[Request], None]:
+    """
+    Dependency factory declaring the max SQL statements a route may run,
+    checked by QueryBudgetMiddleware after the response is serialized.
+    
+    Usage:
+        @router.get("/", dependencies=[Depends(query_budget(LIST_QUERY_BUDGET))])
+    
+    Args:
+        limit: Max statements per request
+        
+    Returns:
+        Dependency function
+    """
+    def declare_budget(request: Request) -> None:
+        request.state.query_budget = limit
+    
+    return declare_budget
@@ -3,30 +3,34 @@ Analytics and dashboard endpoints.
 """
 from typing import Optional
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import date
 
-from app.api.deps import get_db, get_current_active_user
-from app.models.user import User
+from app.api.deps import get_db, get_async_db, get_current_active_user, get_current_active_user_async
+from app.core.permissions import require_admin
+from app.core.principal import Principal
 from app.schemas.analytics import (
     DashboardOverview,
     LeadAnalytics,
     DealAnalytics,
     SalesPerformance,
+    SalesPerformanceSort,
     TaskAnalytics
 )
 from app.services import analytics_service
+from app.services.analytics_cache import response_cache
 
 
 router = APIRouter()
 
 
 @router.get("/dashboard", response_model=DashboardOverview)
-def get_dashboard(
+async def get_dashboard(
     start_date: Optional[date] = Query(None, description="Start date for filtering"),
     end_date: Optional[date] = Query(None, description="End date for filtering"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user_async)
 ):
     """
     Get dashboard overview with key metrics.
@@ -48,7 +52,7 @@ def get_dashboard(
     
     Returns aggregated KPIs perfect for dashboard cards.
     """
-    return analytics_service.get_dashboard_overview(db, current_user, start_date, end_date)
+    return await analytics_service.get_dashboard_overview_async(db, current_user, start_date, end_date)
 
 
 @router.get("/leads", response_model=LeadAnalytics)
@@ -56,7 +60,7 @@ def get_lead_analytics(
     start_date: Optional[date] = Query(None, description="Start date for filtering"),
     end_date: Optional[date] = Query(None, description="End date for filtering"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get lead analytics with distributions.
@@ -81,7 +85,7 @@ def get_deal_analytics(
     start_date: Optional[date] = Query(None, description="Start date for filtering"),
     end_date: Optional[date] = Query(None, description="End date for filtering"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get deal analytics with pipeline metrics.
@@ -104,8 +108,11 @@ def get_deal_analytics(
 
 @router.get("/sales-performance", response_model=SalesPerformance)
 def get_sales_performance(
+    skip: int = Query(0, ge=0, description="Number of users to skip"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum users to return"),
+    sort_by: Optional[SalesPerformanceSort] = Query(None, description="Metric to sort by (descending)"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get sales performance metrics per user.
@@ -118,12 +125,18 @@ def get_sales_performance(
     - Leads assigned
     - Customers managed
     - Deals owned and total value
-    - Won deals and win rate
+    - Won deals, won value and win rate
     - Active tasks
     
+    **Sorting & pagination**:
+    - sort_by: won_deal_value, win_rate, total_deal_value or deals_owned
+    - skip / limit: Page through large teams (default: 100, max: 500)
+    
     Perfect for leaderboards and team performance comparison.
     """
-    return analytics_service.get_sales_performance(db, current_user)
+    return analytics_service.get_sales_performance(
+        db, current_user, skip=skip, limit=limit, sort_by=sort_by
+    )
 
 
 @router.get("/tasks", response_model=TaskAnalytics)
@@ -131,7 +144,7 @@ def get_task_analytics(
     start_date: Optional[date] = Query(None, description="Start date for filtering"),
     end_date: Optional[date] = Query(None, description="End date for filtering"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get task analytics and distributions.
@@ -148,3 +161,16 @@ def get_task_analytics(
     Perfect for task management dashboards and productivity tracking.
     """
     return analytics_service.get_task_analytics(db, current_user, start_date, end_date)
+
+
+@router.get("/cache-stats")
+def get_cache_stats(current_user: Principal = Depends(require_admin)):
+    """
+    Get analytics response cache statistics.
+    
+    **Permissions**: Admin only
+    
+    Returns hit/miss/invalidation counters, hit ratio and entry count
+    for the current worker process.
+    """
+    return response_cache.stats()
@@ -13,14 +13,14 @@ from app.schemas.auth import (
     UserInfo
 )
 from app.services import auth_service
-from app.models.user import User
+from app.core.principal import Principal
 
 
 router = APIRouter()
 
 
 @router.post("/register", response_model=UserInfo, status_code=status.HTTP_201_CREATED)
-def register(
+async def register(
     user_data: UserRegister,
     db: Session = Depends(get_db)
 ):
@@ -33,13 +33,14 @@ def register(
     - **role**: User role (admin, manager, sales)
     
     Returns the created user information (without password).
+    Responds 503 (with Retry-After) when too many sign-ins are being hashed.
     """
-    user = auth_service.register_user(db=db, user_data=user_data)
+    user = await auth_service.register_user(db=db, user_data=user_data)
     return user
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     credentials: UserLogin,
     db: Session = Depends(get_db)
 ):
@@ -51,9 +52,10 @@ def login(
     
     Returns access token and refresh token.
     The access token should be included in the Authorization header for protected routes.
+    Responds 503 (with Retry-After) when too many sign-ins are being hashed.
     """
     # Authenticate user
-    user = auth_service.authenticate_user(
+    user = await auth_service.authenticate_user(
         db=db,
         email=credentials.email,
         password=credentials.password
@@ -111,7 +113,8 @@ def refresh_token(
 
 @router.get("/me", response_model=UserInfo)
 def get_current_user_info(
-    current_user: User = Depends(get_current_active_user)
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get current authenticated user's information.
@@ -120,4 +123,11 @@ def get_current_user_info(
     
     Returns the currently logged-in user's information.
     """
-    return current_user
+    user = current_user.load(db)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return user
@@ -1,13 +1,18 @@
 """
 Customer management endpoints.
 """
+from functools import partial
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_db, get_current_active_user, query_budget, LIST_QUERY_BUDGET
+from app.core.export import ExportFormat, export_response
+from app.core.pagination import CountMode, next_cursor
 from app.core.permissions import require_admin_or_manager
-from app.models.user import User
+from app.core.principal import Principal
+from app.core.responses import FastJSONResponse
 from app.schemas.customer import (
     CustomerCreate,
     CustomerUpdate,
@@ -18,6 +23,9 @@ from app.schemas.customer import (
     CustomerListResponse
 )
 from app.crud import customer as customer_crud
+from app.crud.loading import response_options
+from app.crud.rows import response_rows
+from app.models.customer import Customer, CustomerInteraction, InteractionType
 from app.services import customer_service
 
 
@@ -28,7 +36,7 @@ router = APIRouter()
 def create_customer(
     customer_in: CustomerCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Create a new customer.
@@ -49,7 +57,7 @@ def create_customer(
 def convert_lead(
     conversion_data: LeadToCustomerConvert,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Convert a lead to a customer.
@@ -71,13 +79,15 @@ def convert_lead(
     return customer
 
 
-@router.get("/", response_model=CustomerListResponse)
+@router.get("/", response_model=CustomerListResponse, dependencies=[Depends(query_budget(LIST_QUERY_BUDGET))])
 def list_customers(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces skip)"),
+    count: CountMode = Query(CountMode.EXACT, description="Total to report: exact, estimate or none"),
     search: Optional[str] = Query(None, description="Search in name, email, and company"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     List customers with filters and pagination.
@@ -92,20 +102,95 @@ def list_customers(
     **Pagination**:
     - skip: Number of records to skip (default: 0)
     - limit: Max records to return (default: 100, max: 500)
+    - cursor: Continue after a previous page's `next_cursor` (ignores skip);
+      stays fast on deep pages and does not shift when rows are added
+    - count: `exact` (default), `estimate` (table statistics or a count
+      cached for a few seconds) or `none` (total is null, e.g. infinite scroll)
     """
+    rows = response_rows(Customer, CustomerResponse)
     customers, total = customer_service.get_customers_for_user(
         db=db,
         user=current_user,
         skip=skip,
         limit=limit,
-        search=search
+        search=search,
+        cursor=cursor,
+        count_mode=count,
+        rows=rows
     )
     
-    return CustomerListResponse(
-        total=total,
-        skip=skip,
-        limit=limit,
-        customers=customers
+    return FastJSONResponse({
+        "total": total,
+        "count_mode": count,
+        "skip": skip,
+        "limit": limit,
+        "customers": rows.to_dicts(customers),
+        "next_cursor": next_cursor(customers, limit)
+    })
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_customers(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="File format: csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip-compress the file"),
+    search: Optional[str] = Query(None, description="Search in name, email, and company"),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Export customers as CSV or NDJSON.
+    
+    **Permissions**:
+    - Admin & Manager: Export all customers
+    - Sales: Export only assigned customers
+    
+    **Filters**:
+    - search: Search in name, email, and company
+    
+    Streams all matching customers in ID order, without pagination:
+    `customers.csv` or `customers.ndjson` (`.gz` with `gzip=true`).
+    """
+    return export_response(
+        partial(customer_service.get_customers_export_query, user=current_user, search=search),
+        customer_service.EXPORT_COLUMNS,
+        export_format,
+        "customers",
+        gzip=gzip
+    )
+
+
+@router.get("/interactions/export", response_class=StreamingResponse)
+def export_customer_interactions(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="File format: csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip-compress the file"),
+    customer_id: Optional[int] = Query(None, description="Filter by customer"),
+    interaction_type: Optional[InteractionType] = Query(None, description="Filter by interaction type"),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Export customer interactions as CSV or NDJSON.
+    
+    **Permissions**:
+    - Admin & Manager: Export all interactions
+    - Sales: Export only interactions of assigned customers
+    
+    **Filters**:
+    - customer_id: Filter by customer
+    - interaction_type: Filter by interaction type
+    
+    Streams all matching interactions in ID order, without pagination:
+    `interactions.csv` or `interactions.ndjson` (`.gz` with `gzip=true`).
+    """
+    return export_response(
+        partial(
+            customer_service.get_interactions_export_query,
+            user=current_user,
+            customer_id=customer_id,
+            interaction_type=interaction_type
+        ),
+        customer_service.INTERACTION_EXPORT_COLUMNS,
+        export_format,
+        "interactions",
+        gzip=gzip
     )
 
 
@@ -113,7 +198,7 @@ def list_customers(
 def get_customer(
     customer_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get a specific customer by ID.
@@ -147,7 +232,7 @@ def update_customer(
     customer_id: int,
     customer_in: CustomerUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Update an existing customer.
@@ -185,7 +270,7 @@ def update_customer(
 def delete_customer(
     customer_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Delete a customer.
@@ -212,7 +297,7 @@ def create_customer_interaction(
     customer_id: int,
     interaction_in: CustomerInteractionCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Add an interaction to a customer.
@@ -249,11 +334,15 @@ def create_customer_interaction(
     return interaction
 
 
-@router.get("/{customer_id}/interactions", response_model=List[CustomerInteractionResponse])
+@router.get(
+    "/{customer_id}/interactions",
+    response_model=List[CustomerInteractionResponse],
+    dependencies=[Depends(query_budget(LIST_QUERY_BUDGET))]
+)
 def get_customer_interactions(
     customer_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get all interactions for a customer.
@@ -279,6 +368,10 @@ def get_customer_interactions(
             detail="You don't have permission to access this customer"
         )
     
-    interactions = customer_crud.get_customer_interactions(db, customer_id=customer_id)
+    interactions = customer_crud.get_customer_interactions(
+        db,
+        customer_id=customer_id,
+        options=response_options(CustomerInteraction, CustomerInteractionResponse)
+    )
     
     return interactions
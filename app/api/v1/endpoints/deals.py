@@ -1,15 +1,21 @@
 """
 Deal/Opportunity management endpoints.
 """
+from functools import partial
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from decimal import Decimal
 
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_db, get_async_db, get_current_active_user, get_current_active_user_async, query_budget, LIST_QUERY_BUDGET
+from app.core.export import ExportFormat, export_response
+from app.core.pagination import CountMode, next_cursor
 from app.core.permissions import require_admin_or_manager
-from app.models.user import User
-from app.models.deal import DealStage
+from app.core.principal import Principal
+from app.core.responses import FastJSONResponse
+from app.models.deal import Deal, DealStage
 from app.schemas.deal import (
     DealCreate,
     DealUpdate,
@@ -18,9 +24,13 @@ from app.schemas.deal import (
     DealAssign,
     DealListResponse,
     PipelineViewResponse,
-    PipelineStageData
+    PipelineStageData,
+    DealBatchRequest
 )
+from app.schemas.common import BatchResponse
 from app.crud import deal as deal_crud
+from app.crud.loading import response_options
+from app.crud.rows import response_rows
 from app.services import deal_service
 
 
@@ -31,7 +41,7 @@ router = APIRouter()
 def create_deal(
     deal_in: DealCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Create a new deal.
@@ -50,10 +60,37 @@ def create_deal(
     return deal
 
 
-@router.get("/pipeline", response_model=PipelineViewResponse)
+@router.post("/batch", response_model=BatchResponse)
+def batch_deals(
+    batch_in: DealBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Apply many deal operations in one request and one transaction.
+    
+    **Permissions**: Each operation is checked like its single-deal endpoint.
+    
+    Each entry of `operations` has an `op`:
+    - `create`: `data` as for POST /deals/
+    - `update`: `id` and `data` as for PUT /deals/{id}
+    - `stage`: `id` and `stage` (probability is updated as for PUT /deals/{id}/stage)
+    - `assign`: `id` and `owner_id` (Admin or Manager only)
+    
+    Operations are applied in order. Rejected operations (unknown deal,
+    missing permission, invalid assignee, ...) are reported in `results`
+    with the status code and error of the single-deal endpoint; the others
+    are committed together. Up to `BATCH_MAX_OPERATIONS` operations per request.
+    """
+    return deal_service.apply_deal_batch(db, batch_in.operations, current_user)
+
+
+@router.get("/pipeline", response_model=PipelineViewResponse, dependencies=[Depends(query_budget(LIST_QUERY_BUDGET))])
 def get_pipeline(
+    per_stage: int = Query(20, ge=1, le=100, description="Maximum deals returned per stage"),
+    summary: bool = Query(False, description="Return stage metrics only, without deals"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get pipeline view (Kanban board data).
@@ -66,13 +103,24 @@ def get_pipeline(
     - Count of deals per stage
     - Total value per stage
     - Weighted value per stage (value * probability)
+    
+    Metrics cover all deals; each stage lists only its newest `per_stage`
+    deals. Load more of a column with
+    `GET /deals?stage=<stage>&cursor=<next_cursor>&count=none`.
+    Set `summary=true` for the header totals alone.
     """
     # Get owner filter based on user role
     from app.models.user import UserRole
     owner_id = None if current_user.role in [UserRole.ADMIN, UserRole.MANAGER] else current_user.id
     
     # Get pipeline data
-    pipeline_data = deal_crud.get_pipeline_view(db, owner_id=owner_id)
+    pipeline_data = deal_crud.get_pipeline_view(
+        db,
+        owner_id=owner_id,
+        per_stage=per_stage,
+        summary_only=summary,
+        options=response_options(Deal, DealResponse)
+    )
     
     # Calculate totals
     total_deals = sum(stage_data["count"] for stage_data in pipeline_data.values())
@@ -93,15 +141,17 @@ def get_pipeline(
     )
 
 
-@router.get("/", response_model=DealListResponse)
-def list_deals(
+@router.get("/", response_model=DealListResponse, dependencies=[Depends(query_budget(LIST_QUERY_BUDGET))])
+async def list_deals(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces skip)"),
+    count: CountMode = Query(CountMode.EXACT, description="Total to report: exact, estimate or none"),
     stage: Optional[DealStage] = Query(None, description="Filter by stage"),
     customer_id: Optional[int] = Query(None, description="Filter by customer"),
     search: Optional[str] = Query(None, description="Search in deal title"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user_async)
 ):
     """
     List deals with filters and pagination.
@@ -118,22 +168,65 @@ def list_deals(
     **Pagination**:
     - skip: Number of records to skip (default: 0)
     - limit: Max records to return (default: 100, max: 500)
+    - cursor: Continue after a previous page's `next_cursor` (ignores skip);
+      stays fast on deep pages and does not shift when rows are added
+    - count: `exact` (default), `estimate` (table statistics or a count
+      cached for a few seconds) or `none` (total is null, e.g. infinite scroll)
     """
-    deals, total = deal_service.get_deals_for_user(
-        db=db,
-        user=current_user,
+    rows = response_rows(Deal, DealResponse)
+    deals, total = await deal_service.get_deals_for_user_async(
+        db,
+        current_user,
         skip=skip,
         limit=limit,
         stage=stage,
         customer_id=customer_id,
-        search=search
+        search=search,
+        cursor=cursor,
+        count_mode=count,
+        rows=rows
     )
     
-    return DealListResponse(
-        total=total,
-        skip=skip,
-        limit=limit,
-        deals=deals
+    return FastJSONResponse({
+        "total": total,
+        "count_mode": count,
+        "skip": skip,
+        "limit": limit,
+        "deals": rows.to_dicts(deals),
+        "next_cursor": next_cursor(deals, limit)
+    })
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_deals(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="File format: csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip-compress the file"),
+    stage: Optional[DealStage] = Query(None, description="Filter by stage"),
+    customer_id: Optional[int] = Query(None, description="Filter by customer"),
+    search: Optional[str] = Query(None, description="Search in deal title"),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Export deals as CSV or NDJSON.
+    
+    **Permissions**:
+    - Admin & Manager: Export all deals
+    - Sales: Export only own deals
+    
+    **Filters**:
+    - stage: Filter by deal stage
+    - customer_id: Filter by customer
+    - search: Search in deal title
+    
+    Streams all matching deals in ID order, without pagination:
+    `deals.csv` or `deals.ndjson` (`.gz` with `gzip=true`).
+    """
+    return export_response(
+        partial(deal_service.get_deals_export_query, user=current_user, stage=stage, customer_id=customer_id, search=search),
+        deal_service.EXPORT_COLUMNS,
+        export_format,
+        "deals",
+        gzip=gzip
     )
 
 
@@ -141,7 +234,7 @@ def list_deals(
 def get_deal(
     deal_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get a specific deal by ID.
@@ -175,7 +268,7 @@ def update_deal(
     deal_id: int,
     deal_in: DealUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Update an existing deal.
@@ -217,7 +310,7 @@ def update_deal(
 def delete_deal(
     deal_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Delete a deal.
@@ -240,7 +333,7 @@ def update_deal_stage(
     deal_id: int,
     stage_update: DealStageUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Update deal stage.
@@ -282,7 +375,7 @@ def assign_deal(
     deal_id: int,
     assign_data: DealAssign,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Assign a deal to a user.
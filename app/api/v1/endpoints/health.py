@@ -10,6 +10,10 @@ import time
 
 from app.api.deps import get_db
 from app.core.config import settings
+from app.core.database import engine, async_engine
+from app.core.db_pool import pool_stats
+from app.core.security import password_hasher
+from app.services import scheduler
 
 router = APIRouter()
 
@@ -95,12 +99,25 @@ def health_status(db: Session = Depends(get_db)):
         for check in checks.values()
     )
     
+    # Periodic job schedule and last run metrics
+    try:
+        jobs = scheduler.job_status(db)
+    except Exception:
+        db.rollback()
+        jobs = []
+    
     response = {
         "status": "healthy" if all_healthy else "degraded",
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "version": settings.VERSION,
         "environment": settings.ENVIRONMENT,
-        "checks": checks
+        "checks": checks,
+        "scheduled_jobs": jobs,
+        "database_pools": {
+            "sync": pool_stats(engine),
+            "async": pool_stats(async_engine.sync_engine)
+        },
+        "password_hashing": password_hasher.stats()
     }
     
     # Add system info in non-production
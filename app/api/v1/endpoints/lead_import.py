@@ -2,18 +2,14 @@
 Smart Lead Import API endpoints.
 Multi-phase import workflow with mapping, normalization, and deduplication.
 """
-import io
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.orm import Session
-import pandas as pd
 
 from app.api.deps import get_db, get_current_active_user
 from app.core.permissions import require_admin_or_manager
-from app.models.user import User
+from app.core.principal import Principal
 from app.models.import_session import ImportSession, ImportStatus
-from app.models.lead import Lead, LeadStatus
-from app.schemas.lead import LeadCreate
 from app.schemas.lead_import import (
     UploadAnalysisResponse,
     MappingSubmission,
@@ -28,12 +24,11 @@ from app.schemas.lead_import import (
     TemplateResponse,
     SessionStatusResponse
 )
+from app.services import job_runner
 from app.services.lead_import.analyzer import AnalyzerService
-from app.services.lead_import.normalizer import NormalizerService
-from app.services.lead_import.deduplicator import DeduplicatorService
+from app.services.lead_import.import_jobs import PREPARE_JOB, EXECUTE_JOB, job_progress
 from app.services.lead_import.session_manager import SessionManager
 from app.services.lead_import.template_manager import TemplateManager
-from app.crud import lead as lead_crud
 
 
 router = APIRouter()
@@ -45,7 +40,7 @@ router = APIRouter()
 def upload_and_analyze(
     file: UploadFile = File(..., description="Excel (.xlsx) or CSV (.csv) file"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Phase 1: Upload file and analyze columns.
@@ -70,7 +65,7 @@ def upload_and_analyze(
     session = session_mgr.create_session(
         user=current_user,
         file_name=analysis["file_name"],
-        file_data=analysis["file_content"],
+        file=file.file,
         analysis_result=analysis
     )
     
@@ -97,7 +92,7 @@ def submit_mapping(
     session_id: int,
     mapping_data: MappingSubmission,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Phase 2: Submit column mappings.
@@ -106,6 +101,9 @@ def submit_mapping(
     
     Define which columns map to which CRM fields.
     Optionally save as reusable template.
+    
+    Normalization and duplicate detection run as a background job; the
+    session moves to 'ready' when done (poll /{session_id}/status).
     """
     session_mgr = SessionManager(db)
     session = session_mgr.get_session(session_id, current_user)
@@ -141,38 +139,8 @@ def submit_mapping(
             )
         )
     
-    # Immediately process normalization
-    normalizer = NormalizerService()
-    
-    # Read file data from session
-    file_type = 'csv' if session.file_name.endswith('.csv') else 'xlsx'
-    if file_type == 'csv':
-        df = pd.read_csv(io.BytesIO(session.file_data))
-    else:
-        df = pd.read_excel(io.BytesIO(session.file_data))
-    
-    # Normalize column names
-    df.columns = df.columns.str.lower().str.strip()
-    data = df.to_dict(orient='records')
-    
-    # Normalize data
-    valid_rows, invalid_rows = normalizer.normalize_data(
-        data=data,
-        mappings=mapping_data.mappings,
-        merge_rules=merge_rules
-    )
-    
-    session_mgr.update_normalized_data(
-        session=session,
-        valid_rows=valid_rows,
-        invalid_rows=invalid_rows
-    )
-    
-    # Run deduplication
-    deduplicator = DeduplicatorService()
-    duplicate_result = deduplicator.detect_all_duplicates(db, valid_rows)
-    
-    session_mgr.update_duplicates(session, duplicate_result)
+    # Normalize and deduplicate in the background; poll /status for progress
+    job_runner.enqueue(db, PREPARE_JOB, session.id)
     
     return MappingResponse(
         session_id=session.id,
@@ -187,7 +155,7 @@ def submit_mapping(
 def get_preview(
     session_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Phase 3: Get normalized data preview.
@@ -199,8 +167,8 @@ def get_preview(
     session_mgr = SessionManager(db)
     session = session_mgr.get_session(session_id, current_user)
     
-    normalized = session.normalized_data or []
-    sample = normalized[:5] if len(normalized) > 5 else normalized
+    sample = list(session_mgr.iter_normalized_rows(session, limit=5))
+    validation_errors = session_mgr.get_validation_errors(session)
     
     # Convert LeadSource enums to strings for JSON
     for row in sample:
@@ -212,8 +180,8 @@ def get_preview(
         status=session.status.value,
         total_rows=session.total_rows,
         valid_rows=session.valid_rows,
-        invalid_count=len(session.validation_errors or []),
-        validation_errors=session.validation_errors or [],
+        invalid_count=session_mgr.get_invalid_count(session),
+        validation_errors=validation_errors,
         sample_normalized=sample
     )
 
@@ -224,7 +192,7 @@ def get_preview(
 def get_duplicates(
     session_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Phase 4: Get duplicate detection results.
@@ -257,14 +225,17 @@ def execute_import(
     session_id: int,
     request: ExecuteImportRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Phase 5: Execute final import.
     
     **Requires**: Admin or Manager role
     
-    Apply duplicate decisions and import leads.
+    Apply duplicate decisions and import leads in the background. Rows
+    are written in batches of IMPORT_BATCH_SIZE, one transaction per
+    batch. Poll /{session_id}/status for progress; once 'completed' it
+    reports the summary and rows that failed.
     """
     session_mgr = SessionManager(db)
     session = session_mgr.get_session(session_id, current_user)
@@ -275,111 +246,14 @@ def execute_import(
             detail=f"Session is in '{session.status.value}' status, expected 'ready'"
         )
     
-    # Store decisions
-    decisions = {k: v.value for k, v in request.duplicate_decisions.items()}
-    session_mgr.update_duplicate_decisions(session, decisions)
-    
-    # Build set of rows to skip
-    skip_rows = set()
-    update_rows = {}  # row_num -> existing_lead_id
-    
-    # Process in-file duplicates (keep first, skip rest)
-    for dup in (session.in_file_duplicates or []):
-        rows = dup.get("rows", [])
-        if len(rows) > 1:
-            skip_rows.update(rows[1:])  # Skip all but first
-    
-    # Process existing duplicates based on decisions
-    for dup in (session.existing_duplicates or []):
-        row_num = str(dup.get("import_row", 0))
-        action = decisions.get(row_num, "skip")
-        
-        if action == "skip":
-            skip_rows.add(dup["import_row"])
-        elif action == "update":
-            update_rows[dup["import_row"]] = dup["existing_lead_id"]
-    
-    # Process smart matches
-    for match in (session.smart_matches or []):
-        row_num = str(match.get("import_row", 0))
-        action = decisions.get(row_num, "skip")
-        
-        if action == "skip":
-            skip_rows.add(match["import_row"])
-        elif action == "update":
-            update_rows[match["import_row"]] = match["existing_lead_id"]
-    
-    # Import leads
-    inserted_ids = []
-    updated_ids = []
-    errors = 0
-    
-    for row in (session.normalized_data or []):
-        row_num = row.get("_row_num", 0)
-        
-        if row_num in skip_rows:
-            continue
-        
-        try:
-            if row_num in update_rows:
-                # Update existing lead
-                lead_id = update_rows[row_num]
-                lead = db.query(Lead).filter(Lead.id == lead_id).first()
-                if lead:
-                    lead.full_name = row.get("full_name", lead.full_name)
-                    lead.email = row.get("email", lead.email)
-                    lead.phone = row.get("phone", lead.phone)
-                    db.commit()
-                    updated_ids.append(lead_id)
-            else:
-                # Create new lead
-                source = row.get("source")
-                if hasattr(source, "value"):
-                    source_value = source
-                else:
-                    from app.models.lead import LeadSource
-                    source_value = LeadSource.OTHER
-                
-                lead_data = LeadCreate(
-                    full_name=row["full_name"],
-                    email=row["email"],
-                    phone=row.get("phone"),
-                    source=source_value,
-                    status=LeadStatus.NEW
-                )
-                
-                lead = lead_crud.create_lead(
-                    db=db,
-                    lead=lead_data,
-                    created_by_id=current_user.id
-                )
-                inserted_ids.append(lead.id)
-                
-        except Exception as e:
-            errors += 1
-    
-    # Complete session
-    result = {
-        "total_rows": session.total_rows,
-        "inserted": len(inserted_ids),
-        "updated": len(updated_ids),
-        "skipped": len(skip_rows),
-        "errors": errors
-    }
-    
-    session_mgr.complete_session(
-        session=session,
-        result=result,
-        inserted_ids=inserted_ids,
-        updated_ids=updated_ids
-    )
+    # Store decisions and queue the import in the same transaction
+    session.duplicate_decisions = {k: v.value for k, v in request.duplicate_decisions.items()}
+    session.status = ImportStatus.IMPORTING
+    job_runner.enqueue(db, EXECUTE_JOB, session.id)
     
     return ExecuteImportResponse(
         session_id=session.id,
-        status=session.status.value,
-        summary=ImportSummary(**result),
-        inserted_lead_ids=inserted_ids,
-        updated_lead_ids=updated_ids
+        status=session.status.value
     )
 
 
@@ -389,14 +263,20 @@ def execute_import(
 def get_session_status(
     session_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Get current status of import session.
+    
+    Includes live progress (rows processed, rate, ETA) of the background
+    job and, once completed, the import summary.
     """
     session_mgr = SessionManager(db)
     session = session_mgr.get_session(session_id, current_user)
     
+    job = session_mgr.get_latest_job(session)
+    result = session.import_result or {}
+    
     return SessionStatusResponse(
         session_id=session.id,
         status=session.status.value,
@@ -404,7 +284,10 @@ def get_session_status(
         total_rows=session.total_rows,
         valid_rows=session.valid_rows,
         error_message=session.error_message,
-        created_at=session.created_at.isoformat()
+        created_at=session.created_at.isoformat(),
+        progress=job_progress(job) if job else None,
+        summary=ImportSummary(**result) if result else None,
+        row_errors=result.get("row_errors", [])
     )
 
 
@@ -412,7 +295,7 @@ def get_session_status(
 def delete_session(
     session_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Delete an import session.
@@ -429,7 +312,7 @@ def delete_session(
 @router.get("/templates", response_model=List[TemplateResponse])
 def list_templates(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """List all available mapping templates."""
     template_mgr = TemplateManager(db)
@@ -441,7 +324,7 @@ def list_templates(
 def create_template(
     template_data: TemplateCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """Create a new mapping template."""
     template_mgr = TemplateManager(db)
@@ -465,7 +348,7 @@ def create_template(
 def get_template(
     template_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """Get a specific template."""
     template_mgr = TemplateManager(db)
@@ -477,7 +360,7 @@ def update_template(
     template_id: int,
     template_data: TemplateUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """Update a template."""
     template_mgr = TemplateManager(db)
@@ -501,7 +384,7 @@ def update_template(
 def delete_template(
     template_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """Delete (archive) a template."""
     template_mgr = TemplateManager(db)
@@ -1,14 +1,20 @@
 """
 Lead management endpoints.
 """
+from functools import partial
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_db, get_async_db, get_current_active_user, get_current_active_user_async, query_budget, LIST_QUERY_BUDGET
+from app.core.export import ExportFormat, export_response
+from app.core.pagination import CountMode, next_cursor
 from app.core.permissions import require_admin_or_manager
-from app.models.user import User
-from app.models.lead import LeadStatus, LeadSource
+from app.core.principal import Principal
+from app.core.responses import FastJSONResponse
+from app.models.lead import Lead, LeadNote, LeadStatus, LeadSource
 from app.schemas.lead import (
     LeadCreate,
     LeadUpdate,
@@ -17,9 +23,13 @@ from app.schemas.lead import (
     LeadStatusUpdate,
     LeadNoteCreate,
     LeadNoteResponse,
-    LeadListResponse
+    LeadListResponse,
+    LeadBatchRequest
 )
+from app.schemas.common import BatchResponse
 from app.crud import lead as lead_crud
+from app.crud.loading import response_options
+from app.crud.rows import response_rows
 from app.services import lead_service
 
 
@@ -31,7 +41,7 @@ router = APIRouter()
 def create_lead(
     lead_in: LeadCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Create a new lead.
@@ -49,15 +59,42 @@ def create_lead(
     return lead
 
 
-@router.get("/", response_model=LeadListResponse)
-def list_leads(
+@router.post("/batch", response_model=BatchResponse)
+def batch_leads(
+    batch_in: LeadBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Apply many lead operations in one request and one transaction.
+    
+    **Permissions**: Each operation is checked like its single-lead endpoint.
+    
+    Each entry of `operations` has an `op`:
+    - `create`: `data` as for POST /leads/
+    - `update`: `id` and `data` as for PUT /leads/{id}
+    - `assign`: `id` and `assigned_to_id` (Admin or Manager only)
+    - `status`: `id` and `status`
+    
+    Operations are applied in order. Rejected operations (unknown lead,
+    missing permission, invalid assignee, ...) are reported in `results`
+    with the status code and error of the single-lead endpoint; the others
+    are committed together. Up to `BATCH_MAX_OPERATIONS` operations per request.
+    """
+    return lead_service.apply_lead_batch(db, batch_in.operations, current_user)
+
+
+@router.get("/", response_model=LeadListResponse, dependencies=[Depends(query_budget(LIST_QUERY_BUDGET))])
+async def list_leads(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces skip)"),
+    count: CountMode = Query(CountMode.EXACT, description="Total to report: exact, estimate or none"),
     status: Optional[LeadStatus] = Query(None, description="Filter by status"),
     source: Optional[LeadSource] = Query(None, description="Filter by source"),
     search: Optional[str] = Query(None, description="Search in name and email"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user_async)
 ):
     """
     List leads with filters and pagination.
@@ -74,22 +111,65 @@ def list_leads(
     **Pagination**:
     - skip: Number of records to skip (default: 0)
     - limit: Max records to return (default: 100, max: 500)
+    - cursor: Continue after a previous page's `next_cursor` (ignores skip);
+      stays fast on deep pages and does not shift when rows are added
+    - count: `exact` (default), `estimate` (table statistics or a count
+      cached for a few seconds) or `none` (total is null, e.g. infinite scroll)
     """
-    leads, total = lead_service.get_leads_for_user(
-        db=db,
-        user=current_user,
+    rows = response_rows(Lead, LeadResponse)
+    leads, total = await lead_service.get_leads_for_user_async(
+        db,
+        current_user,
         skip=skip,
         limit=limit,
         status=status,
         source=source,
-        search=search
+        search=search,
+        cursor=cursor,
+        count_mode=count,
+        rows=rows
     )
     
-    return LeadListResponse(
-        total=total,
-        skip=skip,
-        limit=limit,
-        leads=leads
+    return FastJSONResponse({
+        "total": total,
+        "count_mode": count,
+        "skip": skip,
+        "limit": limit,
+        "leads": rows.to_dicts(leads),
+        "next_cursor": next_cursor(leads, limit)
+    })
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_leads(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="File format: csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip-compress the file"),
+    status: Optional[LeadStatus] = Query(None, description="Filter by status"),
+    source: Optional[LeadSource] = Query(None, description="Filter by source"),
+    search: Optional[str] = Query(None, description="Search in name and email"),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Export leads as CSV or NDJSON.
+    
+    **Permissions**:
+    - Admin & Manager: Export all leads
+    - Sales: Export only assigned leads
+    
+    **Filters**:
+    - status: Filter by lead status
+    - source: Filter by lead source
+    - search: Search in name and email
+    
+    Streams all matching leads in ID order, without pagination:
+    `leads.csv` or `leads.ndjson` (`.gz` with `gzip=true`).
+    """
+    return export_response(
+        partial(lead_service.get_leads_export_query, user=current_user, status=status, source=source, search=search),
+        lead_service.EXPORT_COLUMNS,
+        export_format,
+        "leads",
+        gzip=gzip
     )
 
 
@@ -97,7 +177,7 @@ def list_leads(
 def get_lead(
     lead_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get a specific lead by ID.
@@ -131,7 +211,7 @@ def update_lead(
     lead_id: int,
     lead_in: LeadUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Update an existing lead.
@@ -169,7 +249,7 @@ def update_lead(
 def delete_lead(
     lead_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Delete a lead.
@@ -194,7 +274,7 @@ def assign_lead(
     lead_id: int,
     assign_data: LeadAssign,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Assign a lead to a user.
@@ -225,7 +305,7 @@ def update_lead_status(
     lead_id: int,
     status_update: LeadStatusUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Update lead status.
@@ -263,7 +343,7 @@ def create_lead_note(
     lead_id: int,
     note_in: LeadNoteCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Add a note to a lead.
@@ -294,11 +374,15 @@ def create_lead_note(
     return note
 
 
-@router.get("/{lead_id}/notes", response_model=List[LeadNoteResponse])
+@router.get(
+    "/{lead_id}/notes",
+    response_model=List[LeadNoteResponse],
+    dependencies=[Depends(query_budget(LIST_QUERY_BUDGET))]
+)
 def get_lead_notes(
     lead_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get all notes for a lead.
@@ -324,6 +408,10 @@ def get_lead_notes(
             detail="You don't have permission to access this lead"
         )
     
-    notes = lead_crud.get_lead_notes(db, lead_id=lead_id)
+    notes = lead_crud.get_lead_notes(
+        db,
+        lead_id=lead_id,
+        options=response_options(LeadNote, LeadNoteResponse)
+    )
     
     return notes
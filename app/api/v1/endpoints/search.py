@@ -0,0 +1,59 @@
+"""
+Full-text search endpoint across leads, customers and deals.
+"""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db, get_current_active_user, query_budget, LIST_QUERY_BUDGET
+from app.core.principal import Principal
+from app.schemas.search import SearchEntity, SearchResponse, SearchResult
+from app.services import search_service
+
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SearchResponse, dependencies=[Depends(query_budget(LIST_QUERY_BUDGET))])
+def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    entities: Optional[List[SearchEntity]] = Query(None, description="Record types to search (default: all)"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results to return"),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Ranked search over lead and customer names, emails, phones and
+    companies, and deal titles. Every word matches as a prefix, so it
+    suits typeahead ("jo sm" finds "John Smith").
+    
+    **Permissions**:
+    - Admin & Manager: Search all records
+    - Sales: Only assigned leads and customers, and own deals
+    
+    **Parameters**:
+    - q: Search text
+    - entities: Repeat to restrict, e.g. `entities=lead&entities=customer`
+    - limit: Max results (default: 20, max: 100)
+    """
+    matches = search_service.search(
+        db,
+        current_user,
+        q,
+        entities=[entity.value for entity in entities] if entities else None,
+        limit=limit
+    )
+    
+    return SearchResponse(
+        query=q,
+        results=[
+            SearchResult(
+                entity=match["entity"],
+                id=match["id"],
+                title=match["title"],
+                subtitle=match["body"] or None,
+                score=match["score"]
+            )
+            for match in matches
+        ]
+    )
@@ -1,23 +1,32 @@
 """
 Task management endpoints.
 """
+from functools import partial
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_db, get_async_db, get_current_active_user, get_current_active_user_async, query_budget, LIST_QUERY_BUDGET
+from app.core.export import ExportFormat, export_response
+from app.core.pagination import CountMode, next_cursor, TASK_KEYS
 from app.core.permissions import require_admin_or_manager
-from app.models.user import User
-from app.models.task import TaskPriority, TaskStatus, RelatedEntityType
+from app.core.principal import Principal
+from app.core.responses import FastJSONResponse
+from app.models.task import Task, TaskPriority, TaskStatus, RelatedEntityType
 from app.schemas.task import (
     TaskCreate,
     TaskUpdate,
     TaskResponse,
     TaskStatusUpdate,
     TaskAssign,
-    TaskListResponse
+    TaskListResponse,
+    TaskBatchRequest
 )
+from app.schemas.common import BatchResponse
 from app.crud import task as task_crud
+from app.crud.rows import response_rows
 from app.services import task_service
 
 
@@ -28,7 +37,7 @@ router = APIRouter()
 def create_task(
     task_in: TaskCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Create a new task.
@@ -48,17 +57,44 @@ def create_task(
     return task
 
 
-@router.get("/", response_model=TaskListResponse)
-def list_tasks(
+@router.post("/batch", response_model=BatchResponse)
+def batch_tasks(
+    batch_in: TaskBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Apply many task operations in one request and one transaction.
+    
+    **Permissions**: Each operation is checked like its single-task endpoint.
+    
+    Each entry of `operations` has an `op`:
+    - `create`: `data` as for POST /tasks/
+    - `update`: `id` and `data` as for PUT /tasks/{id}
+    - `status`: `id` and `status`
+    - `assign`: `id` and `assigned_to_id` (Admin or Manager only)
+    
+    Operations are applied in order. Rejected operations (unknown task,
+    missing permission, invalid assignee, ...) are reported in `results`
+    with the status code and error of the single-task endpoint; the others
+    are committed together. Up to `BATCH_MAX_OPERATIONS` operations per request.
+    """
+    return task_service.apply_task_batch(db, batch_in.operations, current_user)
+
+
+@router.get("/", response_model=TaskListResponse, dependencies=[Depends(query_budget(LIST_QUERY_BUDGET))])
+async def list_tasks(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces skip)"),
+    count: CountMode = Query(CountMode.EXACT, description="Total to report: exact, estimate or none"),
     status: Optional[TaskStatus] = Query(None, description="Filter by status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
     related_type: Optional[RelatedEntityType] = Query(None, description="Filter by related entity type"),
     related_id: Optional[int] = Query(None, description="Filter by related entity ID"),
     search: Optional[str] = Query(None, description="Search in task title"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user_async)
 ):
     """
     List tasks with filters and pagination.
@@ -77,26 +113,81 @@ def list_tasks(
     **Pagination**:
     - skip: Number of records to skip (default: 0)
     - limit: Max records to return (default: 100, max: 500)
+    - cursor: Continue after a previous page's `next_cursor` (ignores skip);
+      stays fast on deep pages and does not shift when rows are added
+    - count: `exact` (default), `estimate` (table statistics or a count
+      cached for a few seconds) or `none` (total is null, e.g. infinite scroll)
     
-    **Note**: Overdue tasks are automatically detected and updated.
+    **Note**: Pending tasks past their due date are marked overdue by a
+    periodic background job (see OVERDUE_SWEEP_INTERVAL_SECONDS).
     """
-    tasks, total = task_service.get_tasks_for_user(
-        db=db,
-        user=current_user,
+    rows = response_rows(Task, TaskResponse)
+    tasks, total = await task_service.get_tasks_for_user_async(
+        db,
+        current_user,
         skip=skip,
         limit=limit,
         status=status,
         priority=priority,
         related_type=related_type,
         related_id=related_id,
-        search=search
+        search=search,
+        cursor=cursor,
+        count_mode=count,
+        rows=rows
     )
     
-    return TaskListResponse(
-        total=total,
-        skip=skip,
-        limit=limit,
-        tasks=tasks
+    return FastJSONResponse({
+        "total": total,
+        "count_mode": count,
+        "skip": skip,
+        "limit": limit,
+        "tasks": rows.to_dicts(tasks),
+        "next_cursor": next_cursor(tasks, limit, TASK_KEYS)
+    })
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_tasks(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="File format: csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip-compress the file"),
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    related_type: Optional[RelatedEntityType] = Query(None, description="Filter by related entity type"),
+    related_id: Optional[int] = Query(None, description="Filter by related entity ID"),
+    search: Optional[str] = Query(None, description="Search in task title"),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Export tasks as CSV or NDJSON.
+    
+    **Permissions**:
+    - Admin & Manager: Export all tasks
+    - Sales: Export only assigned tasks
+    
+    **Filters**:
+    - status: Filter by task status
+    - priority: Filter by priority
+    - related_type / related_id: Filter by related entity
+    - search: Search in task title
+    
+    Streams all matching tasks in ID order, without pagination:
+    `tasks.csv` or `tasks.ndjson` (`.gz` with `gzip=true`).
+    """
+    return export_response(
+        partial(
+            task_service.get_tasks_export_query,
+            user=current_user,
+            status=status,
+            priority=priority,
+            related_type=related_type,
+            related_id=related_id,
+            search=search
+        ),
+        task_service.EXPORT_COLUMNS,
+        export_format,
+        "tasks",
+        gzip=gzip
     )
 
 
@@ -104,7 +195,7 @@ def list_tasks(
 def get_task(
     task_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Get a specific task by ID.
@@ -138,7 +229,7 @@ def update_task(
     task_id: int,
     task_in: TaskUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Update an existing task.
@@ -180,7 +271,7 @@ def update_task(
 def delete_task(
     task_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Delete a task.
@@ -203,7 +294,7 @@ def update_task_status(
     task_id: int,
     status_update: TaskStatusUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Update task status.
@@ -239,7 +330,7 @@ def assign_task(
     task_id: int,
     assign_data: TaskAssign,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_manager)
+    current_user: Principal = Depends(require_admin_or_manager)
 ):
     """
     Assign a task to a user.
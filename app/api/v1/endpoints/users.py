@@ -7,9 +7,9 @@ from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.core.permissions import require_admin
+from app.core.principal import Principal
 from app.crud import user as user_crud
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
-from app.models.user import User
 
 
 router = APIRouter()
@@ -47,7 +47,7 @@ def read_users(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """
     Retrieve a list of users with pagination.
@@ -65,7 +65,7 @@ def read_users(
 def read_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """
     Get a specific user by ID.
@@ -88,7 +88,7 @@ def update_user(
     user_id: int,
     user_in: UserUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """
     Update an existing user.
@@ -111,7 +111,7 @@ def update_user(
 def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """
     Delete a user.
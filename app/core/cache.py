@@ -0,0 +1,175 @@
+"""
+Response cache with pluggable storage backends.
+
+``ResponseCache`` adds namespacing, TTLs and hit/miss counters on top of a
+``CacheBackend``. The in-process ``InMemoryLRUCache`` is the default backend;
+a shared backend (e.g. Redis) can be swapped in by implementing the same
+four methods.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+class CacheBackend:
+    """
+    Storage interface used by ``ResponseCache``.
+
+    Implementations must be safe to call from multiple threads.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store a value for ``ttl`` seconds."""
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete every key starting with ``prefix`` and return how many were removed."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError
+
+    def size(self) -> int:
+        """Return the number of stored entries (may include expired ones)."""
+        raise NotImplementedError
+
+
+class InMemoryLRUCache(CacheBackend):
+    """
+    Thread-safe in-process LRU cache with per-entry expiry.
+
+    Entries are only visible to the current process, so with several
+    workers each one keeps its own copy; the TTL bounds how stale a
+    worker can get when another worker invalidates.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class ResponseCache:
+    """
+    Namespaced cache with TTLs and hit/miss counters.
+
+    Args:
+        backend: Storage backend
+        namespace: Prefix added to every key
+        ttl: Default time-to-live in seconds
+        enabled: When False every lookup is computed directly
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        ttl: int = 60,
+        enabled: bool = True
+    ):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[counter] += amount
+
+    def get_or_set(self, key: str, compute: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+        """
+        Return the cached value for ``key``, computing and storing it on a miss.
+
+        Args:
+            key: Cache key (without namespace)
+            compute: Callable producing the value on a miss
+            ttl: Optional TTL override in seconds
+
+        Returns:
+            Cached or freshly computed value
+        """
+        if not self.enabled:
+            return compute()
+
+        value = self.backend.get(self._key(key))
+        if value is not None:
+            self._count("hits")
+            return value
+
+        self._count("misses")
+        value = compute()
+        self.backend.set(self._key(key), value, ttl or self.ttl)
+        return value
+
+    def invalidate(self, prefix: str = "") -> int:
+        """
+        Drop every entry whose key starts with ``prefix``.
+
+        Args:
+            prefix: Key prefix (without namespace); empty clears the namespace
+
+        Returns:
+            Number of entries removed
+        """
+        removed = self.backend.delete_prefix(self._key(prefix))
+        self._count("invalidations")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "ttl_seconds": self.ttl,
+            "entries": self.backend.size(),
+            "hit_ratio": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+            **counters
+        }
@@ -3,7 +3,7 @@ Application configuration settings.
 Uses environment variables for secure configuration management.
 """
 import os
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -28,12 +28,35 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Authenticated user snapshots (id, email, role, active), dropped when
+    # the user is updated or deleted; other workers catch up within the TTL
+    PRINCIPAL_CACHE_TTL: int = 30  # seconds, 0 disables the cache
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    # Password hashing: bcrypt cost (hashes with another cost are rehashed on
+    # login) and the per-process pool running login/registration hashing
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2  # Hashing threads
+    PASSWORD_HASH_MAX_PENDING: int = 32  # Waiting sign-ins beyond this get 503
     
     # Database Settings
     DATABASE_URL: str = "sqlite:///./crm.db"
+    # Async driver URL used by async routes; derived from DATABASE_URL
+    # (sqlite+aiosqlite / postgresql+asyncpg) when unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # Connection pool per engine (see app.core.db_pool). Sync routes run on
+    # 40 worker threads, so keep DB_POOL_SIZE + DB_MAX_OVERFLOW at or above
+    # that or requests wait on the pool
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
-    DB_POOL_RECYCLE: int = 300
+    DB_POOL_RECYCLE: int = 300  # seconds before a connection is replaced
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_PRE_PING: bool = False  # test connections on checkout (a round-trip each)
+    DB_CONNECT_TIMEOUT: int = 10  # seconds (PostgreSQL)
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # PostgreSQL statement_timeout, 0 = none
+    DB_ECHO: bool = False  # log every SQL statement
+    # Fail requests that run more SQL statements than their route's budget
+    # (see app.api.deps.query_budget); over-budget requests are always logged
+    QUERY_BUDGET_ENFORCED: bool = False
     
     # CORS Settings
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8080"]
@@ -41,6 +64,58 @@ class Settings(BaseSettings):
     # Pagination Settings
     DEFAULT_PAGE_SIZE: int = 50
     MAX_PAGE_SIZE: int = 500
+    # Cached totals served by list endpoints with count=estimate
+    LIST_COUNT_CACHE_TTL: int = 30  # seconds
+    LIST_COUNT_CACHE_MAX_ENTRIES: int = 1024
+    
+    # Batch Settings
+    # Operations accepted by one /leads, /deals or /tasks batch request,
+    # all applied in a single transaction
+    BATCH_MAX_OPERATIONS: int = 500
+    
+    # Export Settings
+    # Rows fetched from the database and written to the stream at a time
+    EXPORT_BATCH_SIZE: int = 1000
+    
+    # Response Compression Settings
+    # gzip, or Brotli when the optional brotli package is installed, for
+    # clients sending Accept-Encoding
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller bodies are sent as-is
+    COMPRESSION_CONTENT_TYPES: List[str] = [
+        "application/json",
+        "application/x-ndjson",
+        "text/csv",
+        "text/plain",
+        "text/html",
+    ]
+    COMPRESSION_GZIP_LEVEL: int = 6  # 1 (fastest) to 9
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0 (fastest) to 11
+    # Bodies (or streamed chunks) this large are compressed in a worker
+    # thread instead of on the event loop
+    COMPRESSION_THREAD_MIN_SIZE: int = 65536  # bytes
+    
+    # Analytics Settings
+    # Read analytics from the daily_metrics rollup (run the backfill command first)
+    ANALYTICS_ROLLUP_ENABLED: bool = False
+    # Response cache, invalidated on lead/customer/deal/task/user commits
+    ANALYTICS_CACHE_ENABLED: bool = True
+    ANALYTICS_CACHE_TTL: int = 60  # seconds
+    ANALYTICS_CACHE_MAX_ENTRIES: int = 1024
+    
+    # Lead Import Settings
+    IMPORT_BATCH_SIZE: int = 1000  # Rows written per transaction
+    # Background import jobs (normalize, deduplicate, execute)
+    IMPORT_WORKERS: int = 2  # Worker threads per process
+    IMPORT_JOB_STALE_SECONDS: int = 300  # Running jobs without progress for this long are resumed
+    # Uploaded files and normalized rows (shared by all workers of a deployment)
+    IMPORT_SPOOL_DIR: str = "./data/import_spool"
+    
+    # Scheduler Settings (periodic maintenance jobs, one run per interval across workers)
+    SCHEDULER_ENABLED: bool = True  # Run due jobs from this process
+    SCHEDULER_POLL_SECONDS: int = 30  # How often to check for due jobs
+    SCHEDULER_LEASE_SECONDS: int = 600  # A run not finished after this long is considered dead
+    OVERDUE_SWEEP_INTERVAL_SECONDS: int = 300  # Mark pending past-due tasks overdue
     
     # Rate Limiting (future use)
     RATE_LIMIT_PER_MINUTE: int = 100
@@ -1,22 +1,27 @@
 """
 Database connection and session management using SQLAlchemy.
 Provides database engine, session factory, and dependency injection for FastAPI.
+
+Two engines share the same database:
+
+- ``engine`` / ``SessionLocal``: synchronous, used by sync routes, Alembic,
+  background jobs and scripts
+- ``async_engine`` / ``AsyncSessionLocal``: async driver (aiosqlite or
+  asyncpg), used by async routes so waiting on the database does not hold
+  a worker thread
 """
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from app.core.config import settings
+from app.core.db_pool import engine_options
 
 
-# Create SQLAlchemy engine
-# For SQLite, we need to set check_same_thread=False to allow usage across threads
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    echo=True if settings.ENVIRONMENT == "development" else False,  # Log SQL queries in development
-    pool_pre_ping=True,  # Verify connections before using them
-)
+# Create SQLAlchemy engine (pool, timeouts and logging from the DB_* settings)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
 
 # Create SessionLocal class for database sessions
 # autocommit=False: Don't commit automatically
@@ -47,3 +52,57 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+# ========== Async ==========
+
+# Async driver for each sync backend
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_url(url: str) -> str:
+    """
+    Async driver URL for a database URL.
+    
+    Args:
+        url: Sync URL, e.g. ``sqlite:///./crm.db``
+        
+    Returns:
+        URL using the backend's async driver, e.g. ``sqlite+aiosqlite:///./crm.db``
+    """
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {parsed.get_backend_name()}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+_async_url = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(_async_url, **engine_options(_async_url, is_async=True))
+
+# expire_on_commit=False: attributes stay loaded after commit, since an
+# expired attribute cannot be lazily refreshed during response serialization
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that yields an async database session.
+    
+    Usage:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            return await db.run_sync(crud.get_items)
+    
+    Yields:
+        AsyncSession: SQLAlchemy async session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
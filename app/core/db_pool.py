@@ -0,0 +1,174 @@
+"""
+Connection pool configuration for the database engines.
+
+``engine_options`` turns the DB_* settings into ``create_engine`` /
+``create_async_engine`` arguments for the configured backend:
+
+- PostgreSQL: a queue pool sized by DB_POOL_SIZE / DB_MAX_OVERFLOW,
+  recycled after DB_POOL_RECYCLE seconds, with the connect and statement
+  timeouts passed to the driver (psycopg or asyncpg)
+- SQLite file: the same queue pool (no timeouts; SQLite has none)
+- SQLite in memory: StaticPool, a single shared connection, since each new
+  connection would open a separate empty database
+
+Queue pools are timed: ``pool_stats`` reports checked-out and overflow
+connections and how long checkouts waited (and how many timed out), so
+pool exhaustion shows up on /health instead of only as slow requests.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+from app.core.config import settings
+
+
+class PoolMetrics:
+    """Checkout counters of one pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.wait_seconds * 1000 / attempts, 2) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            }
+
+
+class _TimedPoolMixin:
+    """Times each checkout, including waits for a free connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """QueuePool recording checkout waits."""
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording checkout waits."""
+
+
+def _is_memory_sqlite(url) -> bool:
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def _driver_timeouts(url) -> Dict[str, Any]:
+    """Connect arguments applying the connect and statement timeouts."""
+    connect_args: Dict[str, Any] = {}
+    statement_timeout = settings.DB_STATEMENT_TIMEOUT_MS
+
+    if url.get_driver_name() == "asyncpg":
+        connect_args["timeout"] = settings.DB_CONNECT_TIMEOUT
+        if statement_timeout:
+            connect_args["server_settings"] = {"statement_timeout": str(statement_timeout)}
+    else:
+        # libpq-based drivers (psycopg2, psycopg)
+        connect_args["connect_timeout"] = settings.DB_CONNECT_TIMEOUT
+        if statement_timeout:
+            connect_args["options"] = f"-c statement_timeout={statement_timeout}"
+    return connect_args
+
+
+def engine_options(url: str, is_async: bool = False) -> Dict[str, Any]:
+    """
+    Engine keyword arguments for a database URL.
+
+    Args:
+        url: Database URL the engine is created for
+        is_async: Whether the engine is created with ``create_async_engine``
+
+    Returns:
+        Keyword arguments for ``create_engine`` / ``create_async_engine``
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    options: Dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    connect_args: Dict[str, Any] = {}
+
+    if backend == "sqlite":
+        if not is_async:
+            # Sessions move between threads (threadpool, job workers)
+            connect_args["check_same_thread"] = False
+        if _is_memory_sqlite(parsed):
+            options["poolclass"] = StaticPool
+            options["connect_args"] = connect_args
+            return options
+    elif backend == "postgresql":
+        connect_args.update(_driver_timeouts(parsed))
+
+    options.update(
+        poolclass=TimedAsyncQueuePool if is_async else TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        connect_args=connect_args
+    )
+    return options
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    """
+    Current state and checkout metrics of an engine's pool.
+
+    Args:
+        engine: Sync engine (``async_engine.sync_engine`` for the async one)
+
+    Returns:
+        Dict with the pool class, size, checked-out, idle and overflow
+        connections, plus checkout counts and wait times for timed pools
+    """
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            max_overflow=getattr(pool, "_max_overflow", None),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            # overflow() counts down from -size until the pool is full
+            overflow=max(pool.overflow(), 0),
+        )
+
+    metrics: Optional[PoolMetrics] = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
@@ -21,7 +21,8 @@ def create_error_response(
     code: str,
     message: str,
     status_code: int,
-    details: dict = None
+    details: dict = None,
+    headers: dict = None
 ) -> JSONResponse:
     """
     Create a standardized error response.
@@ -35,7 +36,7 @@ def create_error_response(
         },
         "request_id": request_id
     }
-    return JSONResponse(status_code=status_code, content=content)
+    return JSONResponse(status_code=status_code, content=content, headers=headers)
 
 
 async def crm_exception_handler(request: Request, exc: CRMException) -> JSONResponse:
@@ -72,14 +73,16 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         405: "METHOD_NOT_ALLOWED",
         422: "UNPROCESSABLE_ENTITY",
         429: "TOO_MANY_REQUESTS",
-        500: "INTERNAL_ERROR"
+        500: "INTERNAL_ERROR",
+        503: "SERVICE_UNAVAILABLE"
     }
     
     return create_error_response(
         request_id=request_id,
         code=code_map.get(exc.status_code, "HTTP_ERROR"),
         message=str(exc.detail),
-        status_code=exc.status_code
+        status_code=exc.status_code,
+        headers=exc.headers
     )
 
 
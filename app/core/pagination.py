@@ -0,0 +1,190 @@
+"""
+Keyset (cursor) pagination helpers for list endpoints.
+
+A cursor is an opaque, URL-safe token holding the sort key of the last
+row of a page, e.g. ``(created_at, id)``. The next page is the rows that
+sort after it, which an index on the same columns finds directly, so
+every page costs the same no matter how deep it is.
+
+Totals are computed according to a ``CountMode``: an exact COUNT, an
+estimate (table statistics or a short-lived cached count) or none at all.
+"""
+import base64
+import enum
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import text, tuple_
+from sqlalchemy.orm import Query
+
+from app.core.cache import InMemoryLRUCache, ResponseCache
+from app.core.config import settings
+
+
+# Sort key of lists ordered by newest first
+CREATED_KEYS = ("created_at", "id")
+
+# Sort key of task lists (due date first, undated tasks leading)
+TASK_KEYS = ("due_date", "created_at", "id")
+
+_PARSERS = {
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    int: int,
+}
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode sort key values as an opaque cursor.
+
+    Args:
+        values: Key values (datetime, date, int or None)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+        types: Expected type of each value (values may also be None)
+
+    Returns:
+        Tuple of key values
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("wrong number of values")
+        return tuple(
+            None if value is None else _PARSERS[kind](value)
+            for kind, value in zip(types, payload)
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def next_cursor(items: List[Any], limit: int, keys: Sequence[str] = CREATED_KEYS) -> Optional[str]:
+    """
+    Cursor for the page after ``items``.
+
+    Args:
+        items: Rows of the current page
+        limit: Page size requested
+        keys: Attribute names of the sort key
+
+    Returns:
+        Cursor, or None when the page was not full (no more rows)
+    """
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor([getattr(last, key) for key in keys])
+
+
+def after_cursor(query, model, cursor: str):
+    """
+    Restrict a newest-first (created_at, id) query to rows after a cursor.
+
+    Args:
+        query: Query ordered by created_at DESC, id DESC
+        model: Model with created_at and id columns
+        cursor: Cursor from ``next_cursor``
+
+    Returns:
+        Filtered query
+    """
+    created_at, row_id = decode_cursor(cursor, (datetime, int))
+    return query.filter(tuple_(model.created_at, model.id) < (created_at, row_id))
+
+
+# ========== Totals ==========
+
+class CountMode(str, enum.Enum):
+    """How a list endpoint computes its total."""
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+# Counts served to count=estimate, keyed by the compiled query. Not
+# invalidated on writes: estimates may lag by up to the TTL.
+count_cache = ResponseCache(
+    InMemoryLRUCache(max_entries=settings.LIST_COUNT_CACHE_MAX_ENTRIES),
+    namespace="counts",
+    ttl=settings.LIST_COUNT_CACHE_TTL
+)
+
+
+def _query_key(query: Query) -> str:
+    """Cache key identifying a query's SQL and parameters."""
+    compiled = query.statement.compile()
+    params = sorted((name, repr(value)) for name, value in compiled.params.items())
+    signature = f"{compiled}|{params}"
+    return hashlib.sha1(signature.encode()).hexdigest()
+
+
+def _table_estimate(query: Query) -> Optional[int]:
+    """
+    Row count from the planner statistics of an unfiltered query's table.
+
+    Returns:
+        Estimated row count, or None when the backend keeps no statistics
+        (SQLite) or the table has not been analyzed yet
+    """
+    session = query.session
+    if query.whereclause is not None or session.get_bind().dialect.name != "postgresql":
+        return None
+
+    table = query.column_descriptions[0]["entity"].__table__
+    estimate = session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table.name}
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def count_rows(query: Query, mode: CountMode = CountMode.EXACT) -> Optional[int]:
+    """
+    Total rows matching a list query.
+
+    Args:
+        query: Filtered query, before ordering and pagination
+        mode: exact runs COUNT, estimate uses table statistics or a cached
+            count, none skips counting
+
+    Returns:
+        Row count, or None for CountMode.NONE
+    """
+    if mode == CountMode.NONE:
+        return None
+    if mode == CountMode.EXACT:
+        return query.count()
+
+    estimate = _table_estimate(query)
+    if estimate is not None:
+        return estimate
+    return count_cache.get_or_set(_query_key(query), query.count)
@@ -5,7 +5,8 @@ Provides reusable permission dependencies for protecting API endpoints.
 from typing import List, Callable
 from fastapi import Depends, HTTPException, status
 
-from app.models.user import User, UserRole
+from app.models.user import UserRole
+from app.core.principal import Principal
 from app.api.deps import get_current_active_user
 
 
@@ -23,10 +24,10 @@ def require_role(*allowed_roles: UserRole) -> Callable:
         
     Example:
         @router.get("/special")
-        def special_route(user: User = Depends(require_role(UserRole.ADMIN, UserRole.MANAGER))):
+        def special_route(user: Principal = Depends(require_role(UserRole.ADMIN, UserRole.MANAGER))):
             return {"message": "Only admins and managers can see this"}
     """
-    def role_checker(current_user: User = Depends(get_current_active_user)) -> User:
+    def role_checker(current_user: Principal = Depends(get_current_active_user)) -> Principal:
         """
         Validates that the current user has one of the allowed roles.
         
@@ -34,7 +35,7 @@ def require_role(*allowed_roles: UserRole) -> Callable:
             current_user: Current authenticated user from JWT token
             
         Returns:
-            User: The current user if they have permission
+            Principal: The current user if they have permission
             
         Raises:
             HTTPException: 403 Forbidden if user doesn't have required role
@@ -50,7 +51,7 @@ def require_role(*allowed_roles: UserRole) -> Callable:
     return role_checker
 
 
-def require_admin(current_user: User = Depends(get_current_active_user)) -> User:
+def require_admin(current_user: Principal = Depends(get_current_active_user)) -> Principal:
     """
     Dependency that requires ADMIN role.
     
@@ -60,14 +61,14 @@ def require_admin(current_user: User = Depends(get_current_active_user)) -> User
         current_user: Current authenticated user
         
     Returns:
-        User: The current user if they are an admin
+        Principal: The current user if they are an admin
         
     Raises:
         HTTPException: 403 Forbidden if user is not an admin
         
     Example:
         @router.delete("/users/{user_id}")
-        def delete_user(user_id: int, admin: User = Depends(require_admin)):
+        def delete_user(user_id: int, admin: Principal = Depends(require_admin)):
             # Only admins can delete users
             return {"message": "User deleted"}
     """
@@ -79,7 +80,7 @@ def require_admin(current_user: User = Depends(get_current_active_user)) -> User
     return current_user
 
 
-def require_manager(current_user: User = Depends(get_current_active_user)) -> User:
+def require_manager(current_user: Principal = Depends(get_current_active_user)) -> Principal:
     """
     Dependency that requires MANAGER role.
     
@@ -89,14 +90,14 @@ def require_manager(current_user: User = Depends(get_current_active_user)) -> Us
         current_user: Current authenticated user
         
     Returns:
-        User: The current user if they are a manager
+        Principal: The current user if they are a manager
         
     Raises:
         HTTPException: 403 Forbidden if user is not a manager
         
     Example:
         @router.get("/team-reports")
-        def team_reports(manager: User = Depends(require_manager)):
+        def team_reports(manager: Principal = Depends(require_manager)):
             # Only managers can view team reports
             return {"message": "Team reports"}
     """
@@ -108,7 +109,7 @@ def require_manager(current_user: User = Depends(get_current_active_user)) -> Us
     return current_user
 
 
-def require_sales(current_user: User = Depends(get_current_active_user)) -> User:
+def require_sales(current_user: Principal = Depends(get_current_active_user)) -> Principal:
     """
     Dependency that requires SALES role.
     
@@ -118,14 +119,14 @@ def require_sales(current_user: User = Depends(get_current_active_user)) -> User
         current_user: Current authenticated user
         
     Returns:
-        User: The current user if they are in sales
+        Principal: The current user if they are in sales
         
     Raises:
         HTTPException: 403 Forbidden if user is not in sales
         
     Example:
         @router.post("/leads")
-        def create_lead(lead_data: dict, sales: User = Depends(require_sales)):
+        def create_lead(lead_data: dict, sales: Principal = Depends(require_sales)):
             # Only sales team can create leads
             return {"message": "Lead created"}
     """
@@ -137,7 +138,7 @@ def require_sales(current_user: User = Depends(get_current_active_user)) -> User
     return current_user
 
 
-def require_admin_or_manager(current_user: User = Depends(get_current_active_user)) -> User:
+def require_admin_or_manager(current_user: Principal = Depends(get_current_active_user)) -> Principal:
     """
     Dependency that requires either ADMIN or MANAGER role.
     
@@ -147,14 +148,14 @@ def require_admin_or_manager(current_user: User = Depends(get_current_active_use
         current_user: Current authenticated user
         
     Returns:
-        User: The current user if they are admin or manager
+        Principal: The current user if they are admin or manager
         
     Raises:
         HTTPException: 403 Forbidden if user is neither admin nor manager
         
     Example:
         @router.get("/reports")
-        def view_reports(user: User = Depends(require_admin_or_manager)):
+        def view_reports(user: Principal = Depends(require_admin_or_manager)):
             # Admins and managers can view reports
             return {"message": "Reports data"}
     """
@@ -166,7 +167,7 @@ def require_admin_or_manager(current_user: User = Depends(get_current_active_use
     return current_user
 
 
-def require_manager_or_sales(current_user: User = Depends(get_current_active_user)) -> User:
+def require_manager_or_sales(current_user: Principal = Depends(get_current_active_user)) -> Principal:
     """
     Dependency that requires either MANAGER or SALES role.
     
@@ -176,14 +177,14 @@ def require_manager_or_sales(current_user: User = Depends(get_current_active_use
         current_user: Current authenticated user
         
     Returns:
-        User: The current user if they are manager or sales
+        Principal: The current user if they are manager or sales
         
     Raises:
         HTTPException: 403 Forbidden if user is neither manager nor sales
         
     Example:
         @router.get("/customers")
-        def view_customers(user: User = Depends(require_manager_or_sales)):
+        def view_customers(user: Principal = Depends(require_manager_or_sales)):
             # Managers and sales can view customers
             return {"message": "Customer data"}
     """
@@ -196,12 +197,12 @@ def require_manager_or_sales(current_user: User = Depends(get_current_active_use
 
 
 # Role hierarchy helpers
-def has_any_role(user: User, roles: List[UserRole]) -> bool:
+def has_any_role(user: Principal, roles: List[UserRole]) -> bool:
     """
     Check if user has any of the specified roles.
     
     Args:
-        user: User to check
+        user: Principal to check
         roles: List of roles to check against
         
     Returns:
@@ -210,22 +211,22 @@ def has_any_role(user: User, roles: List[UserRole]) -> bool:
     return user.role in roles
 
 
-def is_admin(user: User) -> bool:
+def is_admin(user: Principal) -> bool:
     """Check if user is an admin."""
     return user.role == UserRole.ADMIN
 
 
-def is_manager(user: User) -> bool:
+def is_manager(user: Principal) -> bool:
     """Check if user is a manager."""
     return user.role == UserRole.MANAGER
 
 
-def is_sales(user: User) -> bool:
+def is_sales(user: Principal) -> bool:
     """Check if user is in sales."""
     return user.role == UserRole.SALES
 
 
-def can_manage_users(user: User) -> bool:
+def can_manage_users(user: Principal) -> bool:
     """
     Check if user has permission to manage other users.
     Currently only admins can manage users.
@@ -233,7 +234,7 @@ def can_manage_users(user: User) -> bool:
     return user.role == UserRole.ADMIN
 
 
-def can_manage_team(user: User) -> bool:
+def can_manage_team(user: Principal) -> bool:
     """
     Check if user can manage a team.
     Admins and managers can manage teams.
@@ -241,7 +242,7 @@ def can_manage_team(user: User) -> bool:
     return user.role in [UserRole.ADMIN, UserRole.MANAGER]
 
 
-def can_access_sales_data(user: User) -> bool:
+def can_access_sales_data(user: Principal) -> bool:
     """
     Check if user can access sales data.
     All roles can access sales data (with different scopes).
@@ -250,7 +251,7 @@ def can_access_sales_data(user: User) -> bool:
 
 
 # Lead-specific permissions
-def can_access_lead(user: User, lead) -> bool:
+def can_access_lead(user: Principal, lead) -> bool:
     """
     Check if user can access a specific lead.
     
@@ -272,7 +273,7 @@ def can_access_lead(user: User, lead) -> bool:
     return False
 
 
-def can_manage_all_leads(user: User) -> bool:
+def can_manage_all_leads(user: Principal) -> bool:
     """
     Check if user can manage all leads (not just assigned ones).
     """
@@ -0,0 +1,90 @@
+"""
+Authenticated principal and its cache.
+
+Authorizing a request only needs the user's id, email, role and active
+flag. ``get_principal`` keeps an immutable snapshot of those per user for
+a short TTL, so most authenticated requests skip the users SELECT.
+``crud.user`` drops a user's snapshot when it updates or deletes the user;
+other processes pick up the change when their snapshot expires.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import InMemoryLRUCache, ResponseCache
+from app.core.config import settings
+from app.models.user import User, UserRole
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Snapshot of the authenticated user.
+
+    Exposes the attributes permission checks and services read from the
+    current user. Handlers needing the full record call ``load``.
+    """
+    id: int
+    email: str
+    role: UserRole
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Snapshot a User."""
+        return cls(id=user.id, email=user.email, role=user.role, is_active=user.is_active)
+
+    def load(self, db: Session) -> Optional[User]:
+        """
+        Load the full User record.
+
+        Args:
+            db: Database session
+
+        Returns:
+            User, or None if it was deleted
+        """
+        return db.get(User, self.id)
+
+
+principal_cache = ResponseCache(
+    InMemoryLRUCache(max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES),
+    namespace="principals",
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+    enabled=settings.PRINCIPAL_CACHE_TTL > 0
+)
+
+
+def _key(user_id: int) -> str:
+    # Trailing separator so invalidating user 1 leaves user 10 alone
+    return f"{user_id}:"
+
+
+def get_principal(db: Session, user_id: int) -> Optional[Principal]:
+    """
+    Get a user's principal, from the cache or the database.
+
+    Args:
+        db: Database session (only used on a cache miss)
+        user_id: User ID
+
+    Returns:
+        Principal, or None if the user does not exist
+    """
+    def load() -> Optional[Principal]:
+        user = db.get(User, user_id)
+        return Principal.from_user(user) if user is not None else None
+
+    return principal_cache.get_or_set(_key(user_id), load)
+
+
+async def get_principal_async(db: AsyncSession, user_id: int) -> Optional[Principal]:
+    """``get_principal`` on an async session."""
+    return await db.run_sync(get_principal, user_id)
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Drop a user's cached principal (call after changing or deleting the user)."""
+    principal_cache.invalidate(_key(user_id))
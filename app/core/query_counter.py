@@ -0,0 +1,63 @@
+"""
+Per-request SQL statement counting.
+
+An engine listener counts the statements executed while a counter is
+active in the current context. The request middleware activates one per
+request, so lazy loads during response serialization are counted too,
+and scripts and tests can measure a block of code with ``count_queries``.
+Counters nest: a block also counts the statements of blocks opened inside
+it, such as the requests it makes through a TestClient.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """Number of statements executed while the counter was active."""
+
+    def __init__(self, parent: Optional["QueryCounter"] = None):
+        self.count = 0
+        self.parent = parent
+
+
+# Counter of the current request (shared with the threadpool that runs
+# sync endpoints, which copies the request's context)
+_current: ContextVar[Optional[QueryCounter]] = ContextVar("query_counter", default=None)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """
+    Count the statements executed inside the block.
+
+    Usage:
+        with count_queries() as counter:
+            client.get("/api/v1/leads/")
+        print(counter.count)
+    """
+    counter = QueryCounter(parent=_current.get())
+    token = _current.set(counter)
+    try:
+        yield counter
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    counter = _current.get()
+    while counter is not None:
+        counter.count += 1
+        counter = counter.parent
+
+
+def register(engine: Engine) -> None:
+    """
+    Count statements executed on an engine.
+    Safe to call more than once.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
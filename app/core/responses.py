@@ -0,0 +1,35 @@
+"""
+Fast JSON responses for endpoints returning plain dicts.
+
+``FastJSONResponse`` encodes its content with orjson, skipping Pydantic
+validation and FastAPI's ``jsonable_encoder``. Its output matches what the
+endpoint's response model would produce for the same data:
+
+- datetimes and dates as ISO 8601 strings (UTC offsets written as ``Z``)
+- Decimal as a string, keeping its exact digits
+- enums as their values
+
+Return it from an endpoint (whose ``response_model`` then only documents
+the shape) with content built by ``app.crud.rows``.
+"""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendering with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        # orjson writes datetime/date natively: naive values without an
+        # offset, aware ones with it (OPT_UTC_Z writes UTC as "Z")
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
@@ -1,12 +1,33 @@
 """
 Security utilities for password hashing and verification.
 Uses bcrypt for secure password hashing.
+
+Hashing costs tens to hundreds of milliseconds of CPU, so request paths
+(login, registration) run it on ``password_hasher``: a small dedicated
+thread pool with a cap on waiting work, which keeps a login burst from
+tying up the threads that serve every other endpoint.
 """
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from app.core.config import settings
 
-# Create password context with bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Create password context with bcrypt. Hashes made with any other cost
+# are reported as needing an update, so they are rehashed on login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS
+)
 
 
 def hash_password(password: str) -> str:
@@ -34,3 +55,107 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: True if password matches, False otherwise
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its hash uses an outdated cost.
+    
+    Args:
+        plain_password: Plain-text password to verify
+        hashed_password: Stored hash
+        
+    Returns:
+        Tuple of (matches, new hash to store or None)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+# ========== Hashing Pool ==========
+
+class PasswordHasher:
+    """
+    Bounded thread pool for password hashing on async request paths.
+
+    At most ``workers`` hashes run at once; up to ``max_pending`` more may
+    wait. Requests beyond that are rejected with 503 instead of queueing
+    without limit.
+
+    Args:
+        workers: Hashing threads
+        max_pending: Calls allowed to wait for a thread
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._counters = {"completed": 0, "rejected": 0, "peak_in_flight": 0, "busy_seconds": 0.0}
+
+    def _timed(self, func: Callable, *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._counters["busy_seconds"] += elapsed
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """
+        Run a hashing function on the pool.
+
+        Raises:
+            HTTPException: 503 if the pool and its queue are full
+        """
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_pending:
+                self._counters["rejected"] += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many concurrent sign-ins, please retry",
+                    headers={"Retry-After": "1"}
+                )
+            self._in_flight += 1
+            self._counters["peak_in_flight"] = max(self._counters["peak_in_flight"], self._in_flight)
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._timed, func, *args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._counters["completed"] += 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a password on the pool."""
+        return await self.run(hash_password, password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify (and possibly rehash) a password on the pool."""
+        return await self.run(verify_and_update_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool size, current load and counters."""
+        with self._lock:
+            counters = dict(self._counters)
+            in_flight = self._in_flight
+        completed = counters["completed"]
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+            "in_flight": in_flight,
+            "peak_in_flight": counters["peak_in_flight"],
+            "completed": completed,
+            "rejected": counters["rejected"],
+            "avg_ms": round(counters["busy_seconds"] * 1000 / completed, 2) if completed else 0.0
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
@@ -0,0 +1,138 @@
+"""
+Content-addressed file spool on local disk.
+
+Blobs are stored under ``<root>/<sha[:2]>/<sha>`` keyed by the SHA-256 of
+their content, so identical uploads are stored once. Files are written to
+a temporary name and renamed into place, and read back through read-only
+memory maps. Every process that serves a session must see the same
+directory (a local disk for one host, a shared mount for several).
+"""
+import hashlib
+import io
+import json
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+
+
+class SpoolStore:
+    """Stores and reads content-addressed blobs in a directory."""
+
+    # Bytes copied per read when storing a stream
+    COPY_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def path(self, digest: str) -> Path:
+        """Location of a blob."""
+        return self.root / digest[:2] / digest
+
+    def exists(self, digest: str) -> bool:
+        """Whether a blob is stored."""
+        return self.path(digest).is_file()
+
+    def _store(self, write) -> Tuple[str, int]:
+        """
+        Run ``write(file, hasher)`` against a temp file, then move the file
+        into place under its digest.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        hasher = hashlib.sha256()
+
+        handle, temp_path = tempfile.mkstemp(dir=self.root, prefix=".incoming-")
+        try:
+            with os.fdopen(handle, "wb") as target:
+                size = write(target, hasher)
+
+            digest = hasher.hexdigest()
+            final_path = self.path(digest)
+            final_path.parent.mkdir(exist_ok=True)
+            os.replace(temp_path, final_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return digest, size
+
+    def put(self, source: BinaryIO) -> Tuple[str, int]:
+        """
+        Store a stream, reading it from its current position to the end.
+
+        Args:
+            source: Binary file object
+
+        Returns:
+            Tuple of (sha256 hex digest, size in bytes)
+        """
+        def write(target, hasher):
+            size = 0
+            while True:
+                block = source.read(self.COPY_BLOCK_SIZE)
+                if not block:
+                    return size
+                hasher.update(block)
+                target.write(block)
+                size += len(block)
+
+        return self._store(write)
+
+    def put_lines(self, records: Iterable[Dict[str, Any]]) -> Tuple[str, int]:
+        """
+        Store records as JSON Lines.
+
+        Args:
+            records: JSON-serializable dicts
+
+        Returns:
+            Tuple of (sha256 hex digest, number of records)
+        """
+        def write(target, hasher):
+            count = 0
+            for record in records:
+                line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+                hasher.update(line)
+                target.write(line)
+                count += 1
+            return count
+
+        return self._store(write)
+
+    def open(self, digest: str) -> BinaryIO:
+        """
+        Open a blob for reading through a read-only memory map.
+        Close the returned object when done (it is a context manager).
+
+        Raises:
+            FileNotFoundError: If the blob is not stored
+        """
+        with open(self.path(digest), "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return io.BytesIO(b"")
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read_lines(self, digest: str, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records stored with ``put_lines``.
+
+        Args:
+            digest: Blob digest
+            limit: Stop after this many records
+        """
+        with self.open(digest) as blob:
+            count = 0
+            for line in iter(blob.readline, b""):
+                if limit is not None and count >= limit:
+                    return
+                yield json.loads(line)
+                count += 1
+
+    def delete(self, digest: str) -> None:
+        """Remove a blob if it exists."""
+        try:
+            self.path(digest).unlink()
+        except FileNotFoundError:
+            pass
@@ -1,10 +1,12 @@
 """
 CRUD operations for Customer model.
 """
-from typing import Optional, List, Tuple
-from sqlalchemy.orm import Session
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy.orm import Query, Session, Load
 from sqlalchemy import or_
 
+from app.core.pagination import CountMode, after_cursor, count_rows
+from app.crud.rows import ResponseRows
 from app.models.customer import Customer, CustomerInteraction, InteractionType
 from app.models.lead import Lead, LeadStatus
 from app.schemas.customer import CustomerCreate, CustomerUpdate, CustomerInteractionCreate
@@ -52,25 +54,21 @@ def get_customer(db: Session, customer_id: int) -> Optional[Customer]:
     return db.query(Customer).filter(Customer.id == customer_id).first()
 
 
-def get_customers(
+def customers_query(
     db: Session,
-    skip: int = 0,
-    limit: int = 100,
     assigned_to_id: Optional[int] = None,
     search: Optional[str] = None
-) -> Tuple[List[Customer], int]:
+) -> Query:
     """
-    Get a list of customers with filters and pagination.
+    Build the filtered (unordered, unpaginated) customers query.
     
     Args:
         db: Database session
-        skip: Number of records to skip
-        limit: Maximum number of records to return
         assigned_to_id: Filter by assigned user
         search: Search in name, email, and company
         
     Returns:
-        Tuple of (list of customers, total count)
+        Query of customers matching the filters
     """
     query = db.query(Customer)
     
@@ -86,11 +84,56 @@ def get_customers(
         )
         query = query.filter(search_filter)
     
+    return query
+
+
+def get_customers(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    assigned_to_id: Optional[int] = None,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count_mode: CountMode = CountMode.EXACT,
+    options: Sequence[Load] = (),
+    rows: Optional[ResponseRows] = None
+) -> Tuple[List[Customer], Optional[int]]:
+    """
+    Get a list of customers with filters and pagination.
+    
+    Args:
+        db: Database session
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        assigned_to_id: Filter by assigned user
+        search: Search in name, email, and company
+        cursor: Return rows after this cursor instead of skipping
+        count_mode: How to compute the total (exact, estimate or none)
+        options: Loader options for the page (e.g. ``response_options``)
+        rows: Select the columns of a response schema (``response_rows``)
+            instead of ORM objects; options are then ignored
+        
+    Returns:
+        Tuple of (list of customers, total count or None)
+    """
+    query = customers_query(
+        db,
+        assigned_to_id=assigned_to_id,
+        search=search
+    )
+    
     # Get total count before pagination
-    total = query.count()
+    total = count_rows(query, count_mode)
     
-    # Apply pagination and ordering
-    customers = query.order_by(Customer.created_at.desc()).offset(skip).limit(limit).all()
+    # Apply loader options (or the row selection), ordering and pagination
+    # (keyset when a cursor is given)
+    query = rows.select(query) if rows else query.options(*options)
+    query = query.order_by(Customer.created_at.desc(), Customer.id.desc())
+    if cursor:
+        query = after_cursor(query, Customer, cursor)
+    else:
+        query = query.offset(skip)
+    customers = query.limit(limit).all()
     
     return customers, total
 
@@ -227,17 +270,56 @@ def create_customer_interaction(
     return db_interaction
 
 
-def get_customer_interactions(db: Session, customer_id: int) -> List[CustomerInteraction]:
+def interactions_query(
+    db: Session,
+    customer_id: Optional[int] = None,
+    interaction_type: Optional[InteractionType] = None,
+    customer_assigned_to_id: Optional[int] = None
+) -> Query:
+    """
+    Build the filtered (unordered) customer interactions query.
+    
+    Args:
+        db: Database session
+        customer_id: Filter by customer
+        interaction_type: Filter by interaction type
+        customer_assigned_to_id: Only interactions of customers assigned to this user
+        
+    Returns:
+        Query of interactions matching the filters
+    """
+    query = db.query(CustomerInteraction)
+    
+    if customer_id:
+        query = query.filter(CustomerInteraction.customer_id == customer_id)
+    
+    if interaction_type:
+        query = query.filter(CustomerInteraction.interaction_type == interaction_type)
+    
+    if customer_assigned_to_id:
+        query = query.join(Customer, CustomerInteraction.customer_id == Customer.id).filter(
+            Customer.assigned_to_id == customer_assigned_to_id
+        )
+    
+    return query
+
+
+def get_customer_interactions(
+    db: Session,
+    customer_id: int,
+    options: Sequence[Load] = ()
+) -> List[CustomerInteraction]:
     """
     Get all interactions for a customer.
     
     Args:
         db: Database session
         customer_id: Customer ID
+        options: Loader options (e.g. ``response_options``)
         
     Returns:
         List of CustomerInteraction objects
     """
-    return db.query(CustomerInteraction).filter(
+    return db.query(CustomerInteraction).options(*options).filter(
         CustomerInteraction.customer_id == customer_id
     ).order_by(CustomerInteraction.created_at.desc()).all()
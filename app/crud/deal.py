@@ -1,29 +1,41 @@
 """
 CRUD operations for Deal model.
 """
-from typing import Optional, List, Tuple, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from typing import Optional, List, Tuple, Dict, Sequence
+from sqlalchemy.orm import Query, Session, Load
+from sqlalchemy import or_, func, select, union_all
 from decimal import Decimal
 from collections import defaultdict
 
+from app.core.pagination import CountMode, after_cursor, count_rows, next_cursor
+from app.crud.rows import ResponseRows
 from app.models.deal import Deal, DealStage
 from app.schemas.deal import DealCreate, DealUpdate
 
 
-def create_deal(db: Session, deal: DealCreate, owner_id: int) -> Deal:
+# Win probability set when a deal moves to a stage
+STAGE_PROBABILITIES = {
+    DealStage.PROSPECTING: 10,
+    DealStage.QUALIFICATION: 25,
+    DealStage.PROPOSAL: 50,
+    DealStage.NEGOTIATION: 75,
+    DealStage.CLOSED_WON: 100,
+    DealStage.CLOSED_LOST: 0
+}
+
+
+def build_deal(deal: DealCreate, owner_id: int) -> Deal:
     """
-    Create a new deal.
+    Build an unsaved Deal from a creation schema.
     
     Args:
-        db: Database session
         deal: Deal creation schema
         owner_id: ID of deal owner (defaults to creator if not specified)
         
     Returns:
-        Created Deal object
+        New Deal object, not yet added to a session
     """
-    db_deal = Deal(
+    return Deal(
         title=deal.title,
         customer_id=deal.customer_id,
         owner_id=deal.owner_id or owner_id,  # Use provided owner or default to creator
@@ -32,6 +44,21 @@ def create_deal(db: Session, deal: DealCreate, owner_id: int) -> Deal:
         probability=deal.probability,
         expected_close_date=deal.expected_close_date
     )
+
+
+def create_deal(db: Session, deal: DealCreate, owner_id: int) -> Deal:
+    """
+    Create a new deal.
+    
+    Args:
+        db: Database session
+        deal: Deal creation schema
+        owner_id: ID of deal owner (defaults to creator if not specified)
+        
+    Returns:
+        Created Deal object
+    """
+    db_deal = build_deal(deal, owner_id)
     
     db.add(db_deal)
     db.commit()
@@ -54,29 +81,25 @@ def get_deal(db: Session, deal_id: int) -> Optional[Deal]:
     return db.query(Deal).filter(Deal.id == deal_id).first()
 
 
-def get_deals(
+def deals_query(
     db: Session,
-    skip: int = 0,
-    limit: int = 100,
     stage: Optional[DealStage] = None,
     customer_id: Optional[int] = None,
     owner_id: Optional[int] = None,
     search: Optional[str] = None
-) -> Tuple[List[Deal], int]:
+) -> Query:
     """
-    Get a list of deals with filters and pagination.
+    Build the filtered (unordered, unpaginated) deals query.
     
     Args:
         db: Database session
-        skip: Number of records to skip
-        limit: Maximum number of records to return
         stage: Filter by stage
         customer_id: Filter by customer
         owner_id: Filter by owner
         search: Search in deal title
         
     Returns:
-        Tuple of (list of deals, total count)
+        Query of deals matching the filters
     """
     query = db.query(Deal)
     
@@ -94,55 +117,195 @@ def get_deals(
         search_filter = Deal.title.ilike(f"%{search}%")
         query = query.filter(search_filter)
     
-    # Get total count before pagination
-    total = query.count()
+    return query
+
+
+def get_deals(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    stage: Optional[DealStage] = None,
+    customer_id: Optional[int] = None,
+    owner_id: Optional[int] = None,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count_mode: CountMode = CountMode.EXACT,
+    options: Sequence[Load] = (),
+    rows: Optional[ResponseRows] = None
+) -> Tuple[List[Deal], Optional[int]]:
+    """
+    Get a list of deals with filters and pagination.
+    
+    Args:
+        db: Database session
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        stage: Filter by stage
+        customer_id: Filter by customer
+        owner_id: Filter by owner
+        search: Search in deal title
+        cursor: Return rows after this cursor instead of skipping
+        count_mode: How to compute the total (exact, estimate or none)
+        options: Loader options for the page (e.g. ``response_options``)
+        rows: Select the columns of a response schema (``response_rows``)
+            instead of ORM objects; options are then ignored
+        
+    Returns:
+        Tuple of (list of deals, total count or None)
+    """
+    query = deals_query(
+        db,
+        stage=stage,
+        customer_id=customer_id,
+        owner_id=owner_id,
+        search=search
+    )
     
-    # Apply pagination and ordering
-    deals = query.order_by(Deal.created_at.desc()).offset(skip).limit(limit).all()
+    # Get total count before pagination
+    total = count_rows(query, count_mode)
+    
+    # Apply loader options (or the row selection), ordering and pagination
+    # (keyset when a cursor is given)
+    query = rows.select(query) if rows else query.options(*options)
+    query = query.order_by(Deal.created_at.desc(), Deal.id.desc())
+    if cursor:
+        query = after_cursor(query, Deal, cursor)
+    else:
+        query = query.offset(skip)
+    deals = query.limit(limit).all()
     
     return deals, total
 
 
-def get_pipeline_view(db: Session, owner_id: Optional[int] = None) -> Dict[str, dict]:
+def get_pipeline_summary(db: Session, owner_id: Optional[int] = None) -> Dict[str, dict]:
     """
-    Get pipeline view grouped by stage.
+    Get per-stage deal count, total value and weighted value (one GROUP BY).
     
     Args:
         db: Database session
         owner_id: Optional filter by owner (for sales users)
         
     Returns:
-        Dictionary with deals grouped by stage
+        Dictionary of stage metrics keyed by stage value, covering every stage
     """
-    query = db.query(Deal)
+    query = db.query(
+        Deal.stage,
+        func.count(Deal.id),
+        func.sum(Deal.value),
+        func.sum(Deal.value * Deal.probability)
+    )
     
-    # Filter by owner if specified (for sales users)
     if owner_id:
         query = query.filter(Deal.owner_id == owner_id)
     
-    # Get all deals
-    all_deals = query.all()
+    totals = {
+        stage: (count, total_value, weighted_total)
+        for stage, count, total_value, weighted_total in query.group_by(Deal.stage)
+    }
     
-    # Group by stage
     pipeline = {}
     
     for stage in DealStage:
-        stage_deals = [deal for deal in all_deals if deal.stage == stage]
-        
-        total_value = sum(Decimal(deal.value) for deal in stage_deals)
-        weighted_value = sum(deal.weighted_value for deal in stage_deals)
+        count, total_value, weighted_total = totals.get(stage, (0, 0, 0))
         
         pipeline[stage.value] = {
             "stage": stage,
-            "count": len(stage_deals),
-            "total_value": total_value,
-            "weighted_value": weighted_value,
-            "deals": stage_deals
+            "count": count,
+            "total_value": Decimal(total_value),
+            # value * probability summed in SQL, scaled like Deal.weighted_value
+            "weighted_value": Decimal(weighted_total) / Decimal(100)
         }
     
     return pipeline
 
 
+def get_top_deals_by_stage(
+    db: Session,
+    per_stage: int,
+    owner_id: Optional[int] = None,
+    options: Sequence[Load] = ()
+) -> Dict[DealStage, List[Deal]]:
+    """
+    Get the newest deals of each stage.
+    
+    One query serves every column of the board: a LIMIT per stage, each an
+    index range scan on (stage, created_at, id), combined with UNION ALL.
+    Unlike ranking with ROW_NUMBER(), this never reads the rest of a stage.
+    
+    Args:
+        db: Database session
+        per_stage: Maximum deals per stage
+        owner_id: Optional filter by owner (for sales users)
+        options: Loader options for the deals (e.g. ``response_options``)
+        
+    Returns:
+        Dictionary of deals (newest first) keyed by stage
+    """
+    columns = []
+    
+    for stage in DealStage:
+        column = select(Deal.id).where(Deal.stage == stage)
+        if owner_id:
+            column = column.where(Deal.owner_id == owner_id)
+        column = column.order_by(Deal.created_at.desc(), Deal.id.desc()).limit(per_stage)
+        # Wrapped so each LIMIT stays inside its own branch of the UNION
+        columns.append(select(column.subquery().c.id))
+    
+    deals = (
+        db.query(Deal)
+        .options(*options)
+        .filter(Deal.id.in_(union_all(*columns)))
+        .order_by(Deal.created_at.desc(), Deal.id.desc())
+        .all()
+    )
+    
+    by_stage = defaultdict(list)
+    for deal in deals:
+        by_stage[deal.stage].append(deal)
+    
+    return by_stage
+
+
+def get_pipeline_view(
+    db: Session,
+    owner_id: Optional[int] = None,
+    per_stage: int = 20,
+    summary_only: bool = False,
+    options: Sequence[Load] = ()
+) -> Dict[str, dict]:
+    """
+    Get pipeline view grouped by stage.
+    
+    Metrics cover every deal of a stage; only the newest ``per_stage`` deals
+    are returned, with a cursor for the rest of the column (usable with
+    ``get_deals(stage=..., cursor=...)``).
+    
+    Args:
+        db: Database session
+        owner_id: Optional filter by owner (for sales users)
+        per_stage: Maximum deals returned per stage
+        summary_only: Return metrics only, without deals
+        options: Loader options for the deals (e.g. ``response_options``)
+        
+    Returns:
+        Dictionary with metrics, deals and next cursor keyed by stage value
+    """
+    pipeline = get_pipeline_summary(db, owner_id=owner_id)
+    
+    if summary_only:
+        return pipeline
+    
+    top_deals = get_top_deals_by_stage(db, per_stage, owner_id=owner_id, options=options)
+    
+    for stage_data in pipeline.values():
+        stage_deals = top_deals.get(stage_data["stage"], [])
+        stage_data["deals"] = stage_deals
+        if stage_data["count"] > len(stage_deals):
+            stage_data["next_cursor"] = next_cursor(stage_deals, per_stage)
+    
+    return pipeline
+
+
 def update_deal(db: Session, deal_id: int, deal_update: DealUpdate) -> Optional[Deal]:
     """
     Update an existing deal.
@@ -194,6 +357,18 @@ def delete_deal(db: Session, deal_id: int) -> bool:
     return True
 
 
+def set_deal_stage(db_deal: Deal, stage: DealStage) -> None:
+    """
+    Move a deal to a stage, auto-updating its probability.
+    
+    Args:
+        db_deal: Deal to update (not committed)
+        stage: New stage
+    """
+    db_deal.stage = stage
+    db_deal.probability = STAGE_PROBABILITIES.get(stage, db_deal.probability)
+
+
 def update_deal_stage(db: Session, deal_id: int, stage: DealStage) -> Optional[Deal]:
     """
     Update deal stage.
@@ -211,19 +386,7 @@ def update_deal_stage(db: Session, deal_id: int, stage: DealStage) -> Optional[D
     if not db_deal:
         return None
     
-    db_deal.stage = stage
-    
-    # Auto-update probability based on stage
-    stage_probabilities = {
-        DealStage.PROSPECTING: 10,
-        DealStage.QUALIFICATION: 25,
-        DealStage.PROPOSAL: 50,
-        DealStage.NEGOTIATION: 75,
-        DealStage.CLOSED_WON: 100,
-        DealStage.CLOSED_LOST: 0
-    }
-    
-    db_deal.probability = stage_probabilities.get(stage, db_deal.probability)
+    set_deal_stage(db_deal, stage)
     
     db.commit()
     db.refresh(db_deal)
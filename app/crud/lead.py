@@ -1,27 +1,28 @@
 """
 CRUD operations for Lead model.
 """
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from typing import Optional, List, Sequence
+from sqlalchemy.orm import Query, Session, Load
 from sqlalchemy import or_, and_
 
+from app.core.pagination import CountMode, after_cursor, count_rows
+from app.crud.rows import ResponseRows
 from app.models.lead import Lead, LeadNote, LeadStatus, LeadSource
 from app.schemas.lead import LeadCreate, LeadUpdate, LeadNoteCreate
 
 
-def create_lead(db: Session, lead: LeadCreate, created_by_id: int) -> Lead:
+def build_lead(lead: LeadCreate, created_by_id: int) -> Lead:
     """
-    Create a new lead.
+    Build an unsaved Lead from a creation schema.
     
     Args:
-        db: Database session
         lead: Lead creation schema
         created_by_id: ID of user creating the lead
         
     Returns:
-        Created Lead object
+        New Lead object, not yet added to a session
     """
-    db_lead = Lead(
+    return Lead(
         full_name=lead.full_name,
         email=lead.email,
         phone=lead.phone,
@@ -30,6 +31,21 @@ def create_lead(db: Session, lead: LeadCreate, created_by_id: int) -> Lead:
         assigned_to_id=lead.assigned_to_id,
         created_by_id=created_by_id
     )
+
+
+def create_lead(db: Session, lead: LeadCreate, created_by_id: int) -> Lead:
+    """
+    Create a new lead.
+    
+    Args:
+        db: Database session
+        lead: Lead creation schema
+        created_by_id: ID of user creating the lead
+        
+    Returns:
+        Created Lead object
+    """
+    db_lead = build_lead(lead, created_by_id)
     
     db.add(db_lead)
     db.commit()
@@ -52,23 +68,19 @@ def get_lead(db: Session, lead_id: int) -> Optional[Lead]:
     return db.query(Lead).filter(Lead.id == lead_id).first()
 
 
-def get_leads(
+def leads_query(
     db: Session,
-    skip: int = 0,
-    limit: int = 100,
     status: Optional[LeadStatus] = None,
     source: Optional[LeadSource] = None,
     assigned_to_id: Optional[int] = None,
     created_by_id: Optional[int] = None,
     search: Optional[str] = None
-) -> tuple[List[Lead], int]:
+) -> Query:
     """
-    Get a list of leads with filters and pagination.
+    Build the filtered (unordered, unpaginated) leads query.
     
     Args:
         db: Database session
-        skip: Number of records to skip
-        limit: Maximum number of records to return
         status: Filter by status
         source: Filter by source
         assigned_to_id: Filter by assigned user
@@ -76,7 +88,7 @@ def get_leads(
         search: Search in name and email
         
     Returns:
-        Tuple of (list of leads, total count)
+        Query of leads matching the filters
     """
     query = db.query(Lead)
     
@@ -100,11 +112,65 @@ def get_leads(
         )
         query = query.filter(search_filter)
     
-    # Get total count before pagination
-    total = query.count()
+    return query
+
+
+def get_leads(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[LeadStatus] = None,
+    source: Optional[LeadSource] = None,
+    assigned_to_id: Optional[int] = None,
+    created_by_id: Optional[int] = None,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count_mode: CountMode = CountMode.EXACT,
+    options: Sequence[Load] = (),
+    rows: Optional[ResponseRows] = None
+) -> tuple[List[Lead], Optional[int]]:
+    """
+    Get a list of leads with filters and pagination.
+    
+    Args:
+        db: Database session
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        status: Filter by status
+        source: Filter by source
+        assigned_to_id: Filter by assigned user
+        created_by_id: Filter by creator
+        search: Search in name and email
+        cursor: Return rows after this cursor instead of skipping
+        count_mode: How to compute the total (exact, estimate or none)
+        options: Loader options for the page (e.g. ``response_options``)
+        rows: Select the columns of a response schema (``response_rows``)
+            instead of ORM objects; options are then ignored
+        
+    Returns:
+        Tuple of (list of leads, total count or None)
+    """
+    query = leads_query(
+        db,
+        status=status,
+        source=source,
+        assigned_to_id=assigned_to_id,
+        created_by_id=created_by_id,
+        search=search
+    )
     
-    # Apply pagination and ordering
-    leads = query.order_by(Lead.created_at.desc()).offset(skip).limit(limit).all()
+    # Get total count before pagination
+    total = count_rows(query, count_mode)
+    
+    # Apply loader options (or the row selection), ordering and pagination
+    # (keyset when a cursor is given)
+    query = rows.select(query) if rows else query.options(*options)
+    query = query.order_by(Lead.created_at.desc(), Lead.id.desc())
+    if cursor:
+        query = after_cursor(query, Lead, cursor)
+    else:
+        query = query.offset(skip)
+    leads = query.limit(limit).all()
     
     return leads, total
 
@@ -236,15 +302,22 @@ def create_lead_note(db: Session, lead_id: int, note: LeadNoteCreate, user_id: i
     return db_note
 
 
-def get_lead_notes(db: Session, lead_id: int) -> List[LeadNote]:
+def get_lead_notes(db: Session, lead_id: int, options: Sequence[Load] = ()) -> List[LeadNote]:
     """
     Get all notes for a lead.
     
     Args:
         db: Database session
         lead_id: Lead ID
+        options: Loader options (e.g. ``response_options``)
         
     Returns:
         List of LeadNote objects
     """
-    return db.query(LeadNote).filter(LeadNote.lead_id == lead_id).order_by(LeadNote.created_at.desc()).all()
+    return (
+        db.query(LeadNote)
+        .options(*options)
+        .filter(LeadNote.lead_id == lead_id)
+        .order_by(LeadNote.created_at.desc())
+        .all()
+    )
@@ -0,0 +1,67 @@
+"""
+Eager-loading options derived from response schemas.
+
+Response schemas serialize relationships (``LeadResponse.assigned_to``,
+``DealResponse.customer``...). Left lazy, each of those is a SELECT per
+row during serialization. ``response_options`` walks a schema's fields
+and returns loader options for every relationship it reads, including
+nested schemas, so a list query fetches everything the response needs
+up front:
+
+- many-to-one relationships are joined into the main query (joinedload)
+- collections are loaded with one extra ``IN`` query (selectinload)
+
+Usage:
+    query.options(*response_options(Lead, LeadResponse))
+"""
+import functools
+import typing
+from typing import Any, Iterator, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import Load, joinedload, selectinload
+
+
+def nested_schema(annotation: Any) -> Optional[type]:
+    """The schema class inside an annotation such as Optional[List[X]]."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for argument in typing.get_args(annotation):
+        schema = nested_schema(argument)
+        if schema is not None:
+            return schema
+    return None
+
+
+def _options(model: type, schema: type, parent: Optional[Load]) -> Iterator[Load]:
+    relationships = inspect(model).relationships
+
+    for name, field in schema.model_fields.items():
+        relationship = relationships.get(name)
+        if relationship is None:
+            continue
+
+        attribute = getattr(model, name)
+        loader = selectinload if relationship.uselist else joinedload
+        option = loader(attribute) if parent is None else getattr(parent, loader.__name__)(attribute)
+        yield option
+
+        nested = nested_schema(field.annotation)
+        if nested is not None:
+            yield from _options(relationship.mapper.class_, nested, option)
+
+
+@functools.lru_cache(maxsize=None)
+def response_options(model: type, schema: type) -> Tuple[Load, ...]:
+    """
+    Loader options for the relationships ``schema`` serializes from ``model``.
+
+    Args:
+        model: ORM model queried
+        schema: Pydantic response schema built from each row
+
+    Returns:
+        Tuple of loader options for ``Query.options``
+    """
+    return tuple(_options(model, schema, None))
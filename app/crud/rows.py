@@ -0,0 +1,147 @@
+"""
+Column selections derived from response schemas.
+
+Building a list response from ORM objects costs far more CPU than its
+SQL: every row becomes an ORM instance (plus one per joined relationship)
+and is then validated field by field into the response schema with
+``from_attributes``. ``response_rows`` walks a response schema once and
+instead selects exactly the columns it reads, as plain row tuples, and
+turns each row straight into the response's dict:
+
+- scalar fields select the model column of the same name
+- many-to-one relationships with a nested schema are outer-joined (one
+  alias each) and become a nested dict, or None when there is no row
+- fields backed by a model property (``Deal.weighted_value``,
+  ``Task.is_overdue``) run that property on the row's column values
+
+The dicts are meant to be encoded as-is (``app.core.responses``), so
+values keep their Python types (enums, dates, Decimal).
+
+Usage:
+    rows = response_rows(Lead, LeadResponse)
+    leads = rows.select(query).all()
+    items = rows.to_dicts(leads)
+"""
+import functools
+from operator import itemgetter
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query, aliased
+
+from app.crud.loading import nested_schema
+
+
+class ResponseRows:
+    """Column selection and row-to-dict conversion for one response schema."""
+
+    def __init__(self, model: type, schema: type):
+        self._columns: List[Any] = []
+        self._indexes: Dict[str, int] = {}
+        self._joins: List[Tuple[Any, Any]] = []
+        self._build = self._plan(model, schema, model, "")
+
+    def _add(self, entity: Any, key: str, label: str) -> int:
+        """Select ``entity.key`` once, returning its position in the row."""
+        if label not in self._indexes:
+            self._indexes[label] = len(self._columns)
+            self._columns.append(getattr(entity, key).label(label))
+        return self._indexes[label]
+
+    def _plan(self, model: type, schema: type, entity: Any, prefix: str) -> Callable[[Sequence[Any]], dict]:
+        mapper = inspect(model)
+        columns = mapper.column_attrs.keys()
+        relationships = mapper.relationships
+        getters = []
+
+        for name, field in schema.model_fields.items():
+            if name in columns:
+                getters.append((name, itemgetter(self._add(entity, name, prefix + name))))
+                continue
+
+            relationship = relationships.get(name)
+            if relationship is not None:
+                nested = nested_schema(field.annotation)
+                if relationship.uselist or nested is None:
+                    raise ValueError(f"{schema.__name__}.{name}: only many-to-one relationships can be selected as rows")
+                target = aliased(relationship.mapper.class_)
+                self._joins.append((target, getattr(entity, name)))
+                getters.append((name, self._nested(relationship.mapper.class_, nested, target, f"{prefix}{name}__")))
+                continue
+
+            attribute = getattr(model, name, None)
+            if isinstance(attribute, property):
+                getters.append((name, self._computed(columns, entity, prefix, attribute.fget)))
+                continue
+
+            raise ValueError(f"{schema.__name__}.{name} has no column, relationship or property on {model.__name__}")
+
+        def build(row):
+            return {name: get(row) for name, get in getters}
+
+        return build
+
+    def _nested(self, model: type, schema: type, entity: Any, prefix: str) -> Callable[[Sequence[Any]], Any]:
+        """Getter of a joined relationship's dict, None when the join found no row."""
+        key = inspect(model).primary_key[0].key
+        primary_key = self._add(entity, key, prefix + key)
+        build = self._plan(model, schema, entity, prefix)
+
+        def get(row):
+            return None if row[primary_key] is None else build(row)
+
+        return get
+
+    def _computed(self, columns: List[str], entity: Any, prefix: str, fget: Callable) -> Callable[[Sequence[Any]], Any]:
+        """Getter running a model property on the row's values of every column."""
+        indexes = [(key, self._add(entity, key, prefix + key)) for key in columns]
+
+        def get(row):
+            return fget(SimpleNamespace(**{key: row[index] for key, index in indexes}))
+
+        return get
+
+    def select(self, query: Query) -> Query:
+        """
+        Restrict a query on the model to the schema's columns.
+
+        Must be applied before ``limit``/``offset`` (it adds joins).
+
+        Args:
+            query: Query on the model, with its filters
+
+        Returns:
+            Query returning rows for ``to_dicts``
+        """
+        for target, relationship in self._joins:
+            query = query.outerjoin(target, relationship.of_type(target))
+        return query.with_entities(*self._columns)
+
+    def to_dicts(self, rows: Sequence[Sequence[Any]]) -> List[dict]:
+        """
+        Convert selected rows to response dicts.
+
+        Args:
+            rows: Rows returned by a query from ``select``
+
+        Returns:
+            One dict per row, keyed like the schema
+        """
+        build = self._build
+        return [build(row) for row in rows]
+
+
+@functools.lru_cache(maxsize=None)
+def response_rows(model: type, schema: type) -> ResponseRows:
+    """
+    Row selection producing ``schema`` dicts for ``model`` queries.
+
+    Args:
+        model: ORM model queried
+        schema: Pydantic response schema each row is returned as
+
+    Returns:
+        Cached ResponseRows for the pair
+    """
+    return ResponseRows(model, schema)
@@ -1,27 +1,32 @@
 """
 CRUD operations for Task model.
 """
-from typing import Optional, List, Tuple
-from sqlalchemy.orm import Session
-from datetime import date
+from typing import Optional, List, Tuple, Sequence, Dict
+from sqlalchemy import and_, or_, tuple_, update
+from sqlalchemy.orm import Query, Session, Load
+from datetime import date, datetime
+from decimal import Decimal
+from collections import defaultdict
 
+from app.core.pagination import CountMode, count_rows, decode_cursor
+from app.crud.rows import ResponseRows
 from app.models.task import Task, TaskPriority, TaskStatus, RelatedEntityType
 from app.schemas.task import TaskCreate, TaskUpdate
+from app.services import analytics_cache, rollup_service
 
 
-def create_task(db: Session, task: TaskCreate, created_by_id: int) -> Task:
+def build_task(task: TaskCreate, created_by_id: int) -> Task:
     """
-    Create a new task.
+    Build an unsaved Task from a creation schema.
     
     Args:
-        db: Database session
         task: Task creation schema
         created_by_id: ID of user creating the task
         
     Returns:
-        Created Task object
+        New Task object, not yet added to a session
     """
-    db_task = Task(
+    return Task(
         title=task.title,
         description=task.description,
         assigned_to_id=task.assigned_to_id,
@@ -32,6 +37,21 @@ def create_task(db: Session, task: TaskCreate, created_by_id: int) -> Task:
         priority=task.priority,
         status=task.status
     )
+
+
+def create_task(db: Session, task: TaskCreate, created_by_id: int) -> Task:
+    """
+    Create a new task.
+    
+    Args:
+        db: Database session
+        task: Task creation schema
+        created_by_id: ID of user creating the task
+        
+    Returns:
+        Created Task object
+    """
+    db_task = build_task(task, created_by_id)
     
     db.add(db_task)
     db.commit()
@@ -54,24 +74,33 @@ def get_task(db: Session, task_id: int) -> Optional[Task]:
     return db.query(Task).filter(Task.id == task_id).first()
 
 
-def get_tasks(
+def _after_cursor(query, cursor: str):
+    """
+    Restrict a task list query to rows after a cursor.
+    Tasks sort by due date (undated first), then newest first.
+    """
+    due_date, created_at, task_id = decode_cursor(cursor, (date, datetime, int))
+    newer = tuple_(Task.created_at, Task.id) < (created_at, task_id)
+
+    if due_date is None:
+        return query.filter(or_(and_(Task.due_date.is_(None), newer), Task.due_date.isnot(None)))
+    return query.filter(or_(and_(Task.due_date == due_date, newer), Task.due_date > due_date))
+
+
+def tasks_query(
     db: Session,
-    skip: int = 0,
-    limit: int = 100,
     status: Optional[TaskStatus] = None,
     priority: Optional[TaskPriority] = None,
     assigned_to_id: Optional[int] = None,
     related_type: Optional[RelatedEntityType] = None,
     related_id: Optional[int] = None,
     search: Optional[str] = None
-) -> Tuple[List[Task], int]:
+) -> Query:
     """
-    Get a list of tasks with filters and pagination.
+    Build the filtered (unordered, unpaginated) tasks query.
     
     Args:
         db: Database session
-        skip: Number of records to skip
-        limit: Maximum number of records to return
         status: Filter by status
         priority: Filter by priority
         assigned_to_id: Filter by assignee
@@ -80,7 +109,7 @@ def get_tasks(
         search: Search in task title
         
     Returns:
-        Tuple of (list of tasks, total count)
+        Query of tasks matching the filters
     """
     query = db.query(Task)
     
@@ -104,11 +133,68 @@ def get_tasks(
         search_filter = Task.title.ilike(f"%{search}%")
         query = query.filter(search_filter)
     
-    # Get total count before pagination
-    total = query.count()
+    return query
+
+
+def get_tasks(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    assigned_to_id: Optional[int] = None,
+    related_type: Optional[RelatedEntityType] = None,
+    related_id: Optional[int] = None,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count_mode: CountMode = CountMode.EXACT,
+    options: Sequence[Load] = (),
+    rows: Optional[ResponseRows] = None
+) -> Tuple[List[Task], Optional[int]]:
+    """
+    Get a list of tasks with filters and pagination.
     
-    # Apply pagination and ordering
-    tasks = query.order_by(Task.due_date.asc().nullsfirst(), Task.created_at.desc()).offset(skip).limit(limit).all()
+    Args:
+        db: Database session
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        status: Filter by status
+        priority: Filter by priority
+        assigned_to_id: Filter by assignee
+        related_type: Filter by related entity type
+        related_id: Filter by related entity ID
+        search: Search in task title
+        cursor: Return rows after this cursor instead of skipping
+        count_mode: How to compute the total (exact, estimate or none)
+        options: Loader options for the page (e.g. ``response_options``)
+        rows: Select the columns of a response schema (``response_rows``)
+            instead of ORM objects; options are then ignored
+        
+    Returns:
+        Tuple of (list of tasks, total count or None)
+    """
+    query = tasks_query(
+        db,
+        status=status,
+        priority=priority,
+        assigned_to_id=assigned_to_id,
+        related_type=related_type,
+        related_id=related_id,
+        search=search
+    )
+    
+    # Get total count before pagination
+    total = count_rows(query, count_mode)
+    
+    # Apply loader options (or the row selection), ordering and pagination
+    # (keyset when a cursor is given)
+    query = rows.select(query) if rows else query.options(*options)
+    query = query.order_by(Task.due_date.asc().nullsfirst(), Task.created_at.desc(), Task.id.desc())
+    if cursor:
+        query = _after_cursor(query, cursor)
+    else:
+        query = query.offset(skip)
+    tasks = query.limit(limit).all()
     
     return tasks, total
 
@@ -214,7 +300,12 @@ def assign_task(db: Session, task_id: int, assigned_to_id: int) -> Optional[Task
 
 def update_overdue_tasks(db: Session) -> int:
     """
-    Update status of overdue tasks.
+    Mark pending tasks past their due date as overdue.
+    
+    Runs as one UPDATE (using the (status, due_date) index) instead of
+    loading the tasks. As the ORM flush listeners do not see it, the
+    analytics rollup is adjusted from the updated rows and cached analytics
+    are dropped here.
     
     Args:
         db: Database session
@@ -222,20 +313,27 @@ def update_overdue_tasks(db: Session) -> int:
     Returns:
         Number of tasks updated
     """
-    today = date.today()
-    
-    # Find pending tasks that are past due date
-    overdue_tasks = db.query(Task).filter(
-        Task.status == TaskStatus.PENDING,
-        Task.due_date < today
+    updated = db.execute(
+        update(Task)
+        .where(Task.status == TaskStatus.PENDING, Task.due_date < date.today())
+        .values(status=TaskStatus.OVERDUE, updated_at=datetime.utcnow())
+        .returning(Task.created_at, Task.assigned_to_id)
+        .execution_options(synchronize_session=False)
     ).all()
     
-    count = 0
-    for task in overdue_tasks:
-        task.status = TaskStatus.OVERDUE
-        count += 1
+    if not updated:
+        db.rollback()
+        return 0
+    
+    # Move each task from the Pending to the Overdue status bucket
+    deltas: Dict[tuple, List] = defaultdict(lambda: [0, Decimal(0)])
+    for created_at, assigned_to_id in updated:
+        day, user_id = created_at.date(), assigned_to_id or 0
+        deltas[(day, user_id, "task", f"status:{TaskStatus.PENDING.value}")][0] -= 1
+        deltas[(day, user_id, "task", f"status:{TaskStatus.OVERDUE.value}")][0] += 1
+    rollup_service.apply_deltas(db.connection(), deltas)
     
-    if count > 0:
-        db.commit()
+    db.commit()
+    analytics_cache.invalidate_entity("task")
     
-    return count
+    return len(updated)
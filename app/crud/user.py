@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import hash_password
+from app.core.principal import invalidate_principal
 
 
 def get_user(db: Session, user_id: int) -> Optional[User]:
@@ -52,19 +53,21 @@ def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
     return db.query(User).offset(skip).limit(limit).all()
 
 
-def create_user(db: Session, user: UserCreate) -> User:
+def create_user(db: Session, user: UserCreate, hashed_password: Optional[str] = None) -> User:
     """
     Create a new user.
     
     Args:
         db: Database session
         user: User creation schema
+        hashed_password: Hash of ``user.password`` if already computed
         
     Returns:
         Created User object
     """
     # Hash the password
-    hashed_password = hash_password(user.password)
+    if hashed_password is None:
+        hashed_password = hash_password(user.password)
     
     # Create user object
     db_user = User(
@@ -116,9 +119,27 @@ def update_user(db: Session, user_id: int, user_update: UserUpdate) -> Optional[
     db.commit()
     db.refresh(db_user)
     
+    # Role/active/email changes must apply to the user's next request
+    invalidate_principal(user_id)
+    
     return db_user
 
 
+def set_password_hash(db: Session, user: User, hashed_password: str) -> None:
+    """
+    Store a new hash of the user's current password (e.g. after a cost change).
+    
+    Args:
+        db: Database session
+        user: User to update (may be detached)
+        hashed_password: New password hash
+    """
+    db.add(user)
+    user.hashed_password = hashed_password
+    db.commit()
+    db.refresh(user)
+
+
 def delete_user(db: Session, user_id: int) -> bool:
     """
     Delete a user.
@@ -137,5 +158,6 @@ def delete_user(db: Session, user_id: int) -> bool:
     
     db.delete(db_user)
     db.commit()
+    invalidate_principal(user_id)
     
     return True
@@ -9,16 +9,40 @@ from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.core.logging_config import setup_logging, get_logger
 from app.core.error_handlers import register_exception_handlers
+from app.middleware.compression_middleware import CompressionMiddleware
 from app.middleware.logging_middleware import RequestLoggingMiddleware
-from app.api.v1.endpoints import users, auth, leads, customers, deals, tasks, analytics, health, lead_import
+from app.middleware.query_budget_middleware import QueryBudgetMiddleware
+from app.api.v1.endpoints import users, auth, leads, customers, deals, tasks, analytics, health, lead_import, search
 from app.models.base import Base
-from app.core.database import engine
+from app.core.database import engine, async_engine
+from app.core import query_counter
+from app.services import rollup_service, analytics_cache, job_runner, search_service, scheduler, task_service
+from app.services.lead_import import match_index, import_jobs
 
 
 # Setup logging before anything else
 setup_logging()
 logger = get_logger(__name__)
 
+# Keep the analytics rollup in sync with lead/customer/deal/task writes
+rollup_service.register_listeners()
+
+# Drop cached analytics responses when the underlying records change
+analytics_cache.register_listeners()
+
+# Keep the lead fuzzy-match index in sync with lead writes
+match_index.register_listeners()
+
+# Keep the full-text search index in sync with lead/customer/deal writes
+# (and create it with the other tables)
+search_service.register_listeners()
+
+# Run lead import phases as background jobs
+import_jobs.register_handlers()
+
+# Periodic maintenance jobs (overdue task sweep)
+task_service.register_jobs()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -36,9 +60,18 @@ async def lifespan(app: FastAPI):
     # Note: In production, use Alembic migrations instead
     Base.metadata.create_all(bind=engine)
     
+    # Start import job workers and resume unfinished jobs
+    job_runner.start()
+    
+    # Start the periodic maintenance job scheduler
+    scheduler.start()
+    
     yield
     
     # Shutdown
+    scheduler.shutdown()
+    job_runner.shutdown()
+    await async_engine.dispose()
     logger.info(f"Shutting down {settings.PROJECT_NAME}")
 
 
@@ -79,6 +112,7 @@ Use `/api/v1/auth/login` to obtain access tokens.
         {"name": "customers", "description": "Customer management and interactions"},
         {"name": "deals", "description": "Deal/Opportunity pipeline management"},
         {"name": "tasks", "description": "Task and follow-up management"},
+        {"name": "search", "description": "Full-text search across leads, customers and deals"},
         {"name": "analytics", "description": "Dashboard and business analytics"},
         {"name": "health", "description": "Health checks and monitoring"},
     ]
@@ -90,6 +124,11 @@ register_exception_handlers(app)
 
 
 # Add middleware (order matters - first added = last executed)
+# Per-request SQL statement counting and query budgets
+query_counter.register(engine)
+query_counter.register(async_engine.sync_engine)
+app.add_middleware(QueryBudgetMiddleware)
+
 # Request logging middleware
 app.add_middleware(RequestLoggingMiddleware)
 
@@ -102,6 +141,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Response compression (outermost, so it sees the final response)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
 
 # Include routers
 # Health check routes (no auth required)
@@ -153,6 +196,13 @@ app.include_router(
     tags=["tasks"]
 )
 
+# Search routes
+app.include_router(
+    search.router,
+    prefix=f"{settings.API_V1_STR}/search",
+    tags=["search"]
+)
+
 # Analytics & Dashboard routes
 app.include_router(
     analytics.router,
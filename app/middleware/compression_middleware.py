@@ -0,0 +1,180 @@
+"""
+Response compression middleware (gzip, or Brotli when installed).
+"""
+import zlib
+from typing import Callable, List, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # optional dependency, gzip only without it
+    brotli = None
+
+
+class _Compressor:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self.compress: Callable[[bytes], bytes] = compressor.process
+            self.finish: Callable[[], bytes] = compressor.finish
+        else:
+            compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, wbits=31)  # gzip container
+            self.compress = compressor.compress
+            self.finish = compressor.flush
+
+    def compress_all(self, data: bytes) -> bytes:
+        return self.compress(data) + self.finish()
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the response encoding from an Accept-Encoding header.
+
+    Brotli is preferred over gzip when the client accepts both (and the
+    brotli package is installed); encodings with ``q=0`` are refused.
+
+    Args:
+        accept_encoding: Header value, e.g. "gzip, deflate, br"
+
+    Returns:
+        "br", "gzip" or None to send the body uncompressed
+    """
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Middleware compressing response bodies for clients that accept it.
+
+    Only responses of an allowed content type (COMPRESSION_CONTENT_TYPES)
+    and at least COMPRESSION_MIN_SIZE bytes are compressed; responses that
+    already carry a Content-Encoding (e.g. gzip exports) pass through.
+    Streaming responses are compressed chunk by chunk as they are sent.
+    Bodies and chunks of COMPRESSION_THREAD_MIN_SIZE bytes or more are
+    compressed in a worker thread so they don't block the event loop.
+
+    Written as a plain ASGI middleware: BaseHTTPMiddleware would buffer
+    streamed exports in memory.
+    """
+
+    def __init__(self, app: ASGIApp, content_types: Optional[List[str]] = None):
+        self.app = app
+        self.content_types = frozenset(
+            content_type.lower() for content_type in (content_types or settings.COMPRESSION_CONTENT_TYPES)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = None
+        if scope["method"] != "HEAD":
+            encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.content_types)
+        await self.app(scope, receive, responder.send)
+
+
+async def _run(function: Callable[[bytes], bytes], data: bytes) -> bytes:
+    """Run a compression step, in a worker thread for large inputs."""
+    if len(data) >= settings.COMPRESSION_THREAD_MIN_SIZE:
+        return await anyio.to_thread.run_sync(function, data)
+    return function(data)
+
+
+class _CompressionResponder:
+    """The ``send`` of one response, compressing its body when eligible."""
+
+    def __init__(self, send: Send, encoding: str, content_types: frozenset):
+        self._send = send
+        self.encoding = encoding
+        self.content_types = content_types
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+            if "content-encoding" in headers or media_type not in self.content_types:
+                self.passthrough = True
+                await self._send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            length = headers.get("content-length")
+            if length is not None and int(length) < settings.COMPRESSION_MIN_SIZE:
+                self.passthrough = True
+                await self._send(message)
+                return
+
+            # Held until the first body message tells whether it streams
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            headers = MutableHeaders(raw=self.start["headers"])
+
+            if not more_body:
+                # Whole body in one message
+                if len(body) < settings.COMPRESSION_MIN_SIZE:
+                    self.passthrough = True
+                    await self._send(self.start)
+                    await self._send(message)
+                    return
+                body = await _run(_Compressor(self.encoding).compress_all, body)
+                headers["Content-Encoding"] = self.encoding
+                headers["Content-Length"] = str(len(body))
+                await self._send(self.start)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+
+            # Streaming: length unknown, compressed as the chunks arrive
+            self.compressor = _Compressor(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            del headers["Content-Length"]
+            await self._send(self.start)
+
+        data = await _run(self.compressor.compress, body) if body else b""
+        if not more_body:
+            data += self.compressor.finish()
+        if data or not more_body:
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
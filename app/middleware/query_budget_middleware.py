@@ -0,0 +1,54 @@
+"""
+Query budget middleware for catching N+1 query regressions.
+"""
+import logging
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.config import settings
+from app.core.query_counter import count_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware counting the SQL statements of each request.
+    
+    Routes declare a budget with the ``query_budget`` dependency. A request
+    over its budget is logged, and fails with a 500 when
+    QUERY_BUDGET_ENFORCED is set (development and CI). The count is
+    returned in an X-Query-Count header when DEBUG is on.
+    """
+    
+    async def dispatch(self, request: Request, call_next) -> Response:
+        with count_queries() as counter:
+            response = await call_next(request)
+        
+        if settings.DEBUG:
+            response.headers["X-Query-Count"] = str(counter.count)
+        
+        budget = getattr(request.state, "query_budget", None)
+        if budget is None or counter.count <= budget:
+            return response
+        
+        message = (
+            f"Query budget exceeded: {request.method} {request.url.path} "
+            f"ran {counter.count} statements (budget {budget})"
+        )
+        logger.warning(
+            message,
+            extra={
+                "request_id": getattr(request.state, "request_id", None),
+                "query_count": counter.count,
+                "query_budget": budget
+            }
+        )
+        
+        if settings.QUERY_BUDGET_ENFORCED:
+            return JSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={"detail": message}
+            )
+        return response
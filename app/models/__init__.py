@@ -8,7 +8,11 @@ from app.models.customer import Customer, CustomerInteraction, InteractionType
 from app.models.deal import Deal, DealStage
 from app.models.task import Task, TaskPriority, TaskStatus, RelatedEntityType
 from app.models.import_session import ImportSession, ImportStatus
+from app.models.import_job import ImportJob, JobStatus
 from app.models.mapping_template import MappingTemplate
+from app.models.daily_metric import DailyMetric
+from app.models.lead_match_key import LeadMatchKey
+from app.models.scheduled_job import ScheduledJob
 
 # Export all models for easy importing
 __all__ = [
@@ -18,5 +22,9 @@ __all__ = [
     "Deal", "DealStage",
     "Task", "TaskPriority", "TaskStatus", "RelatedEntityType",
     "ImportSession", "ImportStatus",
-    "MappingTemplate"
+    "ImportJob", "JobStatus",
+    "MappingTemplate",
+    "DailyMetric",
+    "LeadMatchKey",
+    "ScheduledJob"
 ]
@@ -1,7 +1,7 @@
 """
 Customer model for CRM customer management.
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum, Index
 from sqlalchemy.orm import relationship
 import enum
 
@@ -39,6 +39,13 @@ class Customer(BaseModel):
     """
     __tablename__ = "customers"
     
+    # Matches the (created_at, id) keyset pagination order
+    __table_args__ = (
+        Index("ix_customers_created_at_id", "created_at", "id"),
+        # Sales users' customers (newest first)
+        Index("ix_customers_assigned_to_id_created_at_id", "assigned_to_id", "created_at", "id"),
+    )
+    
     # Customer information
     full_name = Column(
         String(255),
@@ -79,7 +86,6 @@ class Customer(BaseModel):
         Integer,
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
         comment="Assigned account manager ID"
     )
     
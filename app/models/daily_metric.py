@@ -0,0 +1,81 @@
+"""
+DailyMetric model for pre-aggregated analytics rollups.
+"""
+from sqlalchemy import Column, String, Integer, Date, Numeric, UniqueConstraint
+
+from app.models.base import BaseModel
+
+
+class DailyMetric(BaseModel):
+    """
+    Pre-aggregated daily counters used by the analytics endpoints.
+    Inherits id, created_at, and updated_at from BaseModel.
+
+    Each row holds the number (and optional monetary value) of records of
+    an entity that fall into a dimension bucket for one day and one user.
+    Rows are kept up to date incrementally by the rollup service and can be
+    rebuilt from scratch with its backfill command.
+
+    Fields:
+        metric_date: Day the records are bucketed into (UTC)
+        user_id: Owner/assignee of the records (0 when unassigned)
+        entity: Entity name (lead, customer, deal, task)
+        dimension: Bucket name, e.g. "status:New" or "stage:Proposal"
+        count: Number of records in the bucket
+        value: Sum of monetary values in the bucket (deals only)
+    """
+    __tablename__ = "daily_metrics"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "metric_date", "user_id", "entity", "dimension",
+            name="uq_daily_metrics_key"
+        ),
+    )
+
+    metric_date = Column(
+        Date,
+        nullable=False,
+        index=True,
+        comment="Day the records are bucketed into"
+    )
+
+    user_id = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Owner/assignee user ID (0 when unassigned)"
+    )
+
+    entity = Column(
+        String(20),
+        nullable=False,
+        comment="Entity name (lead, customer, deal, task)"
+    )
+
+    dimension = Column(
+        String(100),
+        nullable=False,
+        comment="Dimension bucket, e.g. status:New"
+    )
+
+    count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of records in the bucket"
+    )
+
+    value = Column(
+        Numeric(17, 2),
+        nullable=False,
+        default=0,
+        comment="Sum of monetary values in the bucket"
+    )
+
+    def __repr__(self):
+        """String representation of the DailyMetric model."""
+        return (
+            f"<DailyMetric(date={self.metric_date}, user_id={self.user_id}, "
+            f"entity={self.entity}, dimension={self.dimension}, count={self.count})>"
+        )
@@ -1,7 +1,7 @@
 """
 Deal/Opportunity model for CRM sales pipeline management.
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, Numeric, Date, Enum
+from sqlalchemy import Column, String, Integer, ForeignKey, Numeric, Date, Enum, Index
 from sqlalchemy.orm import relationship
 import enum
 from decimal import Decimal
@@ -40,6 +40,17 @@ class Deal(BaseModel):
     """
     __tablename__ = "deals"
     
+    # Match the (created_at, id) keyset pagination order, overall and
+    # within a pipeline stage; the last one covers the pipeline totals
+    __table_args__ = (
+        Index("ix_deals_created_at_id", "created_at", "id"),
+        Index("ix_deals_stage_created_at_id", "stage", "created_at", "id"),
+        Index("ix_deals_stage_value_probability", "stage", "value", "probability"),
+        # Sales users' deals (newest first, optionally by stage)
+        Index("ix_deals_owner_id_created_at_id", "owner_id", "created_at", "id"),
+        Index("ix_deals_owner_id_stage_created_at_id", "owner_id", "stage", "created_at", "id"),
+    )
+    
     # Deal information
     title = Column(
         String(255),
@@ -60,7 +71,6 @@ class Deal(BaseModel):
         Integer,
         ForeignKey("users.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
         comment="Deal owner (sales user) ID"
     )
     
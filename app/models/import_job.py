@@ -0,0 +1,143 @@
+"""
+ImportJob model for background lead import work.
+Persists queued/running import phases so they survive restarts.
+"""
+import enum
+from sqlalchemy import Column, String, Integer, ForeignKey, Enum, Text, DateTime
+from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy.orm import relationship, backref
+
+from app.models.base import BaseModel
+
+
+class JobStatus(str, enum.Enum):
+    """Status of a background job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ImportJob(BaseModel):
+    """
+    Background job running one or more phases of an import session.
+    Inherits id, created_at, and updated_at from BaseModel.
+
+    Progress is committed in the same transaction as the work it
+    describes, so after a restart a job resumes from ``processed``
+    (and ``checkpoint``) instead of starting over. ``updated_at`` doubles
+    as a heartbeat: running jobs that stop updating are considered
+    abandoned and are picked up again, and ``attempts`` lets the
+    abandoned run notice it has been superseded.
+
+    Fields:
+        session_id: Import session the job works on
+        kind: Handler name, e.g. "import_prepare", "import_execute"
+        status: Queued, running, completed or failed
+        phase: Current step reported to the client
+        payload: Job arguments
+        total: Units of work in the current phase
+        processed: Units of work committed in the current phase
+        resumed_from: Value of processed when the current run started
+        attempts: Number of times the job has been started
+        checkpoint: Handler state committed with the last chunk
+    """
+    __tablename__ = "import_jobs"
+
+    session_id = Column(
+        Integer,
+        ForeignKey("import_sessions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Import session the job works on"
+    )
+
+    kind = Column(
+        String(50),
+        nullable=False,
+        comment="Job handler name"
+    )
+
+    status = Column(
+        Enum(JobStatus),
+        default=JobStatus.QUEUED,
+        nullable=False,
+        index=True,
+        comment="Current status of the job"
+    )
+
+    phase = Column(
+        String(50),
+        nullable=True,
+        comment="Current step of the job"
+    )
+
+    payload = Column(
+        JSON,
+        nullable=True,
+        default=dict,
+        comment="Job arguments"
+    )
+
+    # Progress
+    total = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Units of work in the current phase"
+    )
+
+    processed = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Units of work committed in the current phase"
+    )
+
+    resumed_from = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Processed count when the current run started"
+    )
+
+    attempts = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Number of times the job has been started"
+    )
+
+    checkpoint = Column(
+        JSON,
+        nullable=True,
+        default=dict,
+        comment="Handler state committed with the last chunk"
+    )
+
+    error_message = Column(
+        Text,
+        nullable=True,
+        comment="Error message if status is FAILED"
+    )
+
+    started_at = Column(
+        DateTime,
+        nullable=True,
+        comment="When the current run started"
+    )
+
+    finished_at = Column(
+        DateTime,
+        nullable=True,
+        comment="When the job completed or failed"
+    )
+
+    # Relationships
+    session = relationship(
+        "ImportSession",
+        backref=backref("jobs", cascade="all, delete-orphan")
+    )
+
+    def __repr__(self):
+        return f"<ImportJob(id={self.id}, kind={self.kind}, status={self.status})>"
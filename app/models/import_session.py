@@ -3,9 +3,9 @@ ImportSession model for tracking lead import operations.
 Stores the state and data for each phase of the import workflow.
 """
 import enum
-from sqlalchemy import Column, String, Integer, ForeignKey, Enum, Text, LargeBinary
+from sqlalchemy import Column, String, Integer, BigInteger, ForeignKey, Enum, Text, LargeBinary
 from sqlalchemy.dialects.sqlite import JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 
 from app.models.base import BaseModel
 
@@ -17,6 +17,7 @@ class ImportStatus(str, enum.Enum):
     NORMALIZING = "normalizing"
     DEDUPLICATING = "deduplicating"
     READY = "ready"
+    IMPORTING = "importing"
     COMPLETED = "completed"
     FAILED = "failed"
 
@@ -32,8 +33,15 @@ class ImportSession(BaseModel):
     3. NORMALIZING: Cleaning and validating data
     4. DEDUPLICATING: Finding duplicates
     5. READY: Waiting for user to resolve duplicates
-    6. COMPLETED: Import finished successfully
-    7. FAILED: Import failed with error
+    6. IMPORTING: Writing leads
+    7. COMPLETED: Import finished successfully
+    8. FAILED: Import failed with error
+    
+    Phases 3-6 run as background jobs (see ImportJob).
+    
+    The uploaded file and normalized rows live in the import file spool
+    (see SessionManager); the row only keeps their digests and counts.
+    Large JSON columns are deferred so status reads stay small.
     """
     __tablename__ = "import_sessions"
     
@@ -68,12 +76,26 @@ class ImportSession(BaseModel):
         comment="Original filename"
     )
     
-    file_data = Column(
-        LargeBinary,
+    file_sha256 = Column(
+        String(64),
+        nullable=True,
+        index=True,
+        comment="Spool digest of the uploaded file"
+    )
+    
+    file_size = Column(
+        BigInteger,
         nullable=True,
-        comment="Stored file content for reprocessing"
+        comment="Uploaded file size in bytes"
     )
     
+    # Legacy: sessions created before the file spool keep the file here
+    file_data = deferred(Column(
+        LargeBinary,
+        nullable=True,
+        comment="Stored file content for reprocessing (legacy)"
+    ))
+    
     # Phase 1: Analysis results
     detected_columns = Column(
         JSON,
@@ -131,41 +153,62 @@ class ImportSession(BaseModel):
         comment="Rows that passed validation"
     )
     
-    normalized_data = Column(
+    invalid_rows = Column(
+        Integer,
+        default=0,
+        comment="Rows that failed validation"
+    )
+    
+    normalized_ref = Column(
+        String(64),
+        nullable=True,
+        index=True,
+        comment="Spool digest of the normalized rows (JSON Lines)"
+    )
+    
+    validation_errors_ref = Column(
+        String(64),
+        nullable=True,
+        index=True,
+        comment="Spool digest of the validation errors (JSON Lines)"
+    )
+    
+    # Legacy: sessions created before the file spool keep their rows here
+    normalized_data = deferred(Column(
         JSON,
         nullable=True,
         default=list,
-        comment="Cleaned data after normalization"
-    )
+        comment="Cleaned data after normalization (legacy)"
+    ))
     
-    validation_errors = Column(
+    validation_errors = deferred(Column(
         JSON,
         nullable=True,
         default=list,
-        comment="Rows that failed validation with reasons"
-    )
+        comment="Rows that failed validation with reasons (legacy)"
+    ))
     
     # Phase 4: Duplicate detection
-    in_file_duplicates = Column(
+    in_file_duplicates = deferred(Column(
         JSON,
         nullable=True,
         default=list,
         comment="Duplicates found within the file"
-    )
+    ))
     
-    existing_duplicates = Column(
+    existing_duplicates = deferred(Column(
         JSON,
         nullable=True,
         default=list,
         comment="Matches with existing CRM leads"
-    )
+    ))
     
-    smart_matches = Column(
+    smart_matches = deferred(Column(
         JSON,
         nullable=True,
         default=list,
         comment="Fuzzy matches (same company + similar name)"
-    )
+    ))
     
     # Phase 5: Import results
     duplicate_decisions = Column(
@@ -182,19 +225,19 @@ class ImportSession(BaseModel):
         comment="Final import summary with counts"
     )
     
-    inserted_lead_ids = Column(
+    inserted_lead_ids = deferred(Column(
         JSON,
         nullable=True,
         default=list,
         comment="IDs of newly created leads"
-    )
+    ))
     
-    updated_lead_ids = Column(
+    updated_lead_ids = deferred(Column(
         JSON,
         nullable=True,
         default=list,
         comment="IDs of updated leads"
-    )
+    ))
     
     # Relationships
     user = relationship("User", backref="import_sessions")
@@ -1,7 +1,7 @@
 """
 Lead model for CRM lead management.
 """
-from sqlalchemy import Column, String, Enum, Integer, ForeignKey, Text
+from sqlalchemy import Column, String, Enum, Integer, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 import enum
 
@@ -52,6 +52,17 @@ class Lead(BaseModel):
     """
     __tablename__ = "leads"
     
+    # Matches the (created_at, id) keyset pagination order
+    __table_args__ = (
+        Index("ix_leads_created_at_id", "created_at", "id"),
+        # List filtered by status (newest first)
+        Index("ix_leads_status_created_at_id", "status", "created_at", "id"),
+        # Sales users' leads (newest first, optionally by status); also
+        # covers the per-user analytics aggregates
+        Index("ix_leads_assigned_to_id_created_at_id", "assigned_to_id", "created_at", "id"),
+        Index("ix_leads_assigned_to_id_status_created_at_id", "assigned_to_id", "status", "created_at", "id"),
+    )
+    
     # Lead information
     full_name = Column(
         String(255),
@@ -69,6 +80,7 @@ class Lead(BaseModel):
     phone = Column(
         String(20),
         nullable=True,
+        index=True,
         comment="Lead's phone number"
     )
     
@@ -83,7 +95,6 @@ class Lead(BaseModel):
         Enum(LeadStatus),
         nullable=False,
         default=LeadStatus.NEW,
-        index=True,
         comment="Current status in sales pipeline"
     )
     
@@ -92,7 +103,6 @@ class Lead(BaseModel):
         Integer,
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
         comment="Assigned sales person ID"
     )
     
@@ -0,0 +1,44 @@
+"""
+LeadMatchKey model for the fuzzy duplicate-matching index.
+"""
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
+
+from app.models.base import BaseModel
+
+
+class LeadMatchKey(BaseModel):
+    """
+    Blocking key of a lead's name used to find smart-match candidates.
+    Inherits id, created_at, and updated_at from BaseModel.
+
+    Every lead has a handful of keys (phonetic code, initials/length
+    bucket, MinHash trigrams). Import rows are only compared with leads
+    that share at least one key.
+
+    Fields:
+        lead_id: Indexed lead
+        key: Blocking key, e.g. "ph:J500S530"
+    """
+    __tablename__ = "lead_match_keys"
+
+    __table_args__ = (
+        Index("ix_lead_match_keys_key_lead_id", "key", "lead_id"),
+    )
+
+    lead_id = Column(
+        Integer,
+        ForeignKey("leads.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Indexed lead ID"
+    )
+
+    key = Column(
+        String(64),
+        nullable=False,
+        comment="Blocking key"
+    )
+
+    def __repr__(self):
+        """String representation of the LeadMatchKey model."""
+        return f"<LeadMatchKey(lead_id={self.lead_id}, key={self.key})>"
@@ -0,0 +1,107 @@
+"""
+ScheduledJob model for periodic maintenance jobs.
+Holds each job's lease and run metrics, shared by all worker processes.
+"""
+from sqlalchemy import Column, String, Integer, Text, DateTime, BigInteger
+
+from app.models.base import BaseModel
+
+
+class ScheduledJob(BaseModel):
+    """
+    State of a periodic job registered with the scheduler.
+    Inherits id, created_at, and updated_at from BaseModel.
+
+    A process runs the job only after atomically moving ``next_run_at``
+    forward and taking the lease (``locked_by``/``locked_until``), so with
+    several workers each run happens in one place. The lease expires on its
+    own if the process running the job dies.
+
+    Fields:
+        name: Job name
+        next_run_at: When the job is next due
+        locked_by: Worker running the job (host:pid), null when idle
+        locked_until: Lease expiry of the current run
+        last_started_at: Start of the last run
+        last_finished_at: End of the last run
+        last_duration_ms: Duration of the last run
+        last_result: Value returned by the last run (e.g. rows updated)
+        last_error: Error of the last run, null if it succeeded
+        run_count: Number of completed runs
+        failure_count: Number of failed runs
+    """
+    __tablename__ = "scheduled_jobs"
+
+    name = Column(
+        String(100),
+        unique=True,
+        nullable=False,
+        comment="Job name"
+    )
+
+    next_run_at = Column(
+        DateTime,
+        nullable=False,
+        comment="When the job is next due"
+    )
+
+    # Lease
+    locked_by = Column(
+        String(255),
+        nullable=True,
+        comment="Worker running the job"
+    )
+
+    locked_until = Column(
+        DateTime,
+        nullable=True,
+        comment="Lease expiry of the current run"
+    )
+
+    # Run metrics
+    last_started_at = Column(
+        DateTime,
+        nullable=True,
+        comment="Start of the last run"
+    )
+
+    last_finished_at = Column(
+        DateTime,
+        nullable=True,
+        comment="End of the last run"
+    )
+
+    last_duration_ms = Column(
+        Integer,
+        nullable=True,
+        comment="Duration of the last run in milliseconds"
+    )
+
+    last_result = Column(
+        BigInteger,
+        nullable=True,
+        comment="Value returned by the last run"
+    )
+
+    last_error = Column(
+        Text,
+        nullable=True,
+        comment="Error of the last run"
+    )
+
+    run_count = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Number of completed runs"
+    )
+
+    failure_count = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Number of failed runs"
+    )
+
+    def __repr__(self):
+        return f"<ScheduledJob(name={self.name}, next_run_at={self.next_run_at})>"
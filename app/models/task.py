@@ -1,7 +1,7 @@
 """
 Task model for CRM task and follow-up management.
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Date, Enum
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Date, Enum, Index
 from sqlalchemy.orm import relationship
 import enum
 from datetime import date
@@ -77,7 +77,6 @@ class Task(BaseModel):
         Integer,
         ForeignKey("users.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
         comment="Assigned user ID"
     )
     
@@ -156,3 +155,33 @@ class Task(BaseModel):
             return True
         
         return False
+
+
+# Matches the task list order (due date first, then newest) used for
+# keyset pagination
+Index(
+    "ix_tasks_due_date_created_at_id",
+    Task.due_date,
+    Task.created_at.desc(),
+    Task.id.desc()
+)
+
+# Pending tasks past their due date, found by the overdue sweep
+Index("ix_tasks_status_due_date", Task.status, Task.due_date)
+
+# Sales users' tasks in list order, optionally by status
+Index(
+    "ix_tasks_assigned_to_id_due_date_created_at_id",
+    Task.assigned_to_id,
+    Task.due_date,
+    Task.created_at.desc(),
+    Task.id.desc()
+)
+Index(
+    "ix_tasks_assigned_to_id_status_due_date_created_at_id",
+    Task.assigned_to_id,
+    Task.status,
+    Task.due_date,
+    Task.created_at.desc(),
+    Task.id.desc()
+)
@@ -3,6 +3,7 @@ Pydantic schemas for Analytics and Dashboard responses.
 """
 from typing import Dict, List, Optional
 from decimal import Decimal
+from enum import Enum
 from pydantic import BaseModel, Field
 
 
@@ -69,16 +70,27 @@ class UserPerformance(BaseModel):
     deals_owned: int = Field(..., description="Deals owned by user")
     total_deal_value: Decimal = Field(..., description="Total value of owned deals")
     won_deals: int = Field(..., description="Number of won deals")
+    won_deal_value: Decimal = Field(default=Decimal(0), description="Total value of won deals")
     win_rate: float = Field(..., description="Win rate percentage")
     active_tasks: int = Field(..., description="Active tasks assigned")
 
 
+class SalesPerformanceSort(str, Enum):
+    """Sortable metrics for the sales performance leaderboard (descending)."""
+    WON_VALUE = "won_deal_value"
+    WIN_RATE = "win_rate"
+    TOTAL_DEAL_VALUE = "total_deal_value"
+    DEALS_OWNED = "deals_owned"
+
+
 class SalesPerformance(BaseModel):
     """
     Sales team performance overview.
     """
     users: List[UserPerformance] = Field(..., description="Performance per user")
     total_users: int = Field(..., description="Total number of users")
+    skip: int = Field(default=0, description="Number of skipped users")
+    limit: Optional[int] = Field(default=None, description="Number of users per page")
 
 
 # ========== Task Analytics ==========
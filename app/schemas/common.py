@@ -77,3 +77,25 @@ class ErrorResponse(BaseModel):
     success: bool = False
     error: ErrorDetail
     request_id: Optional[str] = Field(None, description="Request ID for tracking")
+
+
+class BatchItemResult(BaseModel):
+    """
+    Outcome of one operation of a batch request.
+    """
+    index: int = Field(..., description="Position of the operation in the request")
+    op: str = Field(..., description="Operation type")
+    success: bool = Field(..., description="Whether the operation was applied")
+    status_code: int = Field(..., description="HTTP status the single-record endpoint would have returned")
+    id: Optional[int] = Field(None, description="ID of the created or updated record")
+    error: Optional[str] = Field(None, description="Why the operation was rejected")
+
+
+class BatchResponse(BaseModel):
+    """
+    Per-operation results of a batch request, in request order.
+    """
+    total: int = Field(..., description="Number of operations received")
+    succeeded: int = Field(..., description="Operations applied")
+    failed: int = Field(..., description="Operations rejected")
+    results: List[BatchItemResult] = Field(..., description="One result per operation")
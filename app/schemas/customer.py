@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, EmailStr, Field
 
+from app.core.pagination import CountMode
 from app.models.customer import InteractionType
 
 
@@ -131,7 +132,9 @@ class CustomerListResponse(BaseModel):
     """
     Schema for paginated customer list response.
     """
-    total: int = Field(..., description="Total number of customers")
+    total: Optional[int] = Field(..., description="Total number of customers, null when count=none")
+    count_mode: CountMode = Field(CountMode.EXACT, description="How total was computed")
     skip: int = Field(..., description="Number of skipped records")
     limit: int = Field(..., description="Number of records per page")
     customers: List[CustomerResponse] = Field(..., description="List of customers")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
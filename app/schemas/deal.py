@@ -2,10 +2,12 @@
 Pydantic schemas for Deal model validation and serialization.
 """
 from datetime import datetime, date
-from typing import Optional, List, Dict
+from typing import Annotated, Optional, List, Dict, Literal, Union
 from decimal import Decimal
 from pydantic import BaseModel, Field, field_validator
 
+from app.core.config import settings
+from app.core.pagination import CountMode
 from app.models.deal import DealStage
 
 
@@ -104,6 +106,64 @@ class DealResponse(DealBase):
     }
 
 
+# ========== Batch Schemas ==========
+
+class DealBatchCreate(BaseModel):
+    """
+    Batch operation creating a deal.
+    """
+    op: Literal["create"]
+    data: DealCreate
+
+
+class DealBatchUpdate(BaseModel):
+    """
+    Batch operation updating a deal.
+    """
+    op: Literal["update"]
+    id: int = Field(..., description="Deal ID")
+    data: DealUpdate
+
+
+class DealBatchStage(DealStageUpdate):
+    """
+    Batch operation updating deal stage.
+    """
+    op: Literal["stage"]
+    id: int = Field(..., description="Deal ID")
+
+
+class DealBatchAssign(DealAssign):
+    """
+    Batch operation assigning a deal.
+    """
+    op: Literal["assign"]
+    id: int = Field(..., description="Deal ID")
+
+
+DealBatchOperation = Annotated[
+    Union[
+        DealBatchCreate,
+        DealBatchUpdate,
+        DealBatchStage,
+        DealBatchAssign
+    ],
+    Field(discriminator="op")
+]
+
+
+class DealBatchRequest(BaseModel):
+    """
+    Schema for a batch of deal operations applied in one transaction.
+    """
+    operations: List[DealBatchOperation] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BATCH_MAX_OPERATIONS,
+        description="Operations, applied in order"
+    )
+
+
 # ========== Pipeline & List Schemas ==========
 
 class PipelineStageData(BaseModel):
@@ -114,7 +174,14 @@ class PipelineStageData(BaseModel):
     count: int = Field(..., description="Number of deals in this stage")
     total_value: Decimal = Field(..., description="Sum of all deal values in this stage")
     weighted_value: Decimal = Field(..., description="Sum of weighted values")
-    deals: List[DealResponse] = Field(..., description="List of deals in this stage")
+    deals: List[DealResponse] = Field(
+        default_factory=list,
+        description="Newest deals in this stage (empty in summary mode)"
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the rest of the stage (GET /deals?stage=...&cursor=...), null when all deals are shown"
+    )
 
 
 class PipelineViewResponse(BaseModel):
@@ -132,7 +199,9 @@ class DealListResponse(BaseModel):
     """
     Schema for paginated deal list response.
     """
-    total: int = Field(..., description="Total number of deals")
+    total: Optional[int] = Field(..., description="Total number of deals, null when count=none")
+    count_mode: CountMode = Field(CountMode.EXACT, description="How total was computed")
     skip: int = Field(..., description="Number of skipped records")
     limit: int = Field(..., description="Number of records per page")
     deals: List[DealResponse] = Field(..., description="List of deals")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
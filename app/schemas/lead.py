@@ -2,9 +2,11 @@
 Pydantic schemas for Lead model validation and serialization.
 """
 from datetime import datetime
-from typing import Optional, List
+from typing import Annotated, Optional, List, Literal, Union
 from pydantic import BaseModel, EmailStr, Field
 
+from app.core.config import settings
+from app.core.pagination import CountMode
 from app.models.lead import LeadStatus, LeadSource
 
 
@@ -114,13 +116,73 @@ class LeadNoteResponse(BaseModel):
     }
 
 
+# ========== Batch Schemas ==========
+
+class LeadBatchCreate(BaseModel):
+    """
+    Batch operation creating a lead.
+    """
+    op: Literal["create"]
+    data: LeadCreate
+
+
+class LeadBatchUpdate(BaseModel):
+    """
+    Batch operation updating a lead.
+    """
+    op: Literal["update"]
+    id: int = Field(..., description="Lead ID")
+    data: LeadUpdate
+
+
+class LeadBatchAssign(LeadAssign):
+    """
+    Batch operation assigning a lead.
+    """
+    op: Literal["assign"]
+    id: int = Field(..., description="Lead ID")
+
+
+class LeadBatchStatus(LeadStatusUpdate):
+    """
+    Batch operation updating lead status.
+    """
+    op: Literal["status"]
+    id: int = Field(..., description="Lead ID")
+
+
+LeadBatchOperation = Annotated[
+    Union[
+        LeadBatchCreate,
+        LeadBatchUpdate,
+        LeadBatchAssign,
+        LeadBatchStatus
+    ],
+    Field(discriminator="op")
+]
+
+
+class LeadBatchRequest(BaseModel):
+    """
+    Schema for a batch of lead operations applied in one transaction.
+    """
+    operations: List[LeadBatchOperation] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BATCH_MAX_OPERATIONS,
+        description="Operations, applied in order"
+    )
+
+
 # ========== List/Pagination Schemas ==========
 
 class LeadListResponse(BaseModel):
     """
     Schema for paginated lead list response.
     """
-    total: int = Field(..., description="Total number of leads")
+    total: Optional[int] = Field(..., description="Total number of leads, null when count=none")
+    count_mode: CountMode = Field(CountMode.EXACT, description="How total was computed")
     skip: int = Field(..., description="Number of skipped records")
     limit: int = Field(..., description="Number of records per page")
     leads: List[LeadResponse] = Field(..., description="List of leads")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
@@ -142,13 +142,24 @@ class ImportSummary(BaseModel):
     errors: int
 
 
+class ImportRowError(BaseModel):
+    """Error for a single import row."""
+    row: int
+    error: str
+
+
 class ExecuteImportResponse(BaseModel):
-    """Response after import execution."""
+    """
+    Response after import execution.
+    The import runs in the background: summary and IDs are empty until
+    the session status reports 'completed'.
+    """
     session_id: int
     status: str
-    summary: ImportSummary
+    summary: Optional[ImportSummary] = None
     inserted_lead_ids: List[int] = Field(default=[])
     updated_lead_ids: List[int] = Field(default=[])
+    row_errors: List[ImportRowError] = Field(default=[])
     
     model_config = {"from_attributes": True}
 
@@ -192,6 +203,18 @@ class TemplateResponse(BaseModel):
 
 # ========== Session Status ==========
 
+class ImportProgress(BaseModel):
+    """Progress of the session's latest background job."""
+    job_id: int
+    job_status: str = Field(..., description="queued, running, completed or failed")
+    phase: Optional[str] = Field(None, description="normalizing, deduplicating or importing")
+    processed: int = Field(..., description="Rows processed in the current phase")
+    total: int = Field(..., description="Rows in the current phase")
+    rate_per_second: Optional[float] = Field(None, description="Rows per second while running")
+    eta_seconds: Optional[float] = Field(None, description="Estimated seconds until the phase ends")
+    error_message: Optional[str] = None
+
+
 class SessionStatusResponse(BaseModel):
     """Current status of import session."""
     session_id: int
@@ -201,5 +224,8 @@ class SessionStatusResponse(BaseModel):
     valid_rows: int
     error_message: Optional[str]
     created_at: str
+    progress: Optional[ImportProgress] = None
+    summary: Optional[ImportSummary] = None
+    row_errors: List[ImportRowError] = Field(default=[])
     
     model_config = {"from_attributes": True}
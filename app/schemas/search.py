@@ -0,0 +1,32 @@
+"""
+Pydantic schemas for full-text search.
+"""
+from typing import List, Optional
+from enum import Enum
+from pydantic import BaseModel, Field
+
+
+class SearchEntity(str, Enum):
+    """Record types covered by search."""
+    LEAD = "lead"
+    CUSTOMER = "customer"
+    DEAL = "deal"
+
+
+class SearchResult(BaseModel):
+    """
+    Schema for one search match.
+    """
+    entity: SearchEntity = Field(..., description="Record type")
+    id: int = Field(..., description="Record ID")
+    title: str = Field(..., description="Name or deal title")
+    subtitle: Optional[str] = Field(None, description="Email, phone and company")
+    score: float = Field(..., description="Relevance, higher is better")
+
+
+class SearchResponse(BaseModel):
+    """
+    Schema for search results, best match first.
+    """
+    query: str = Field(..., description="Search text")
+    results: List[SearchResult] = Field(..., description="Matches, best first")
@@ -2,9 +2,11 @@
 Pydantic schemas for Task model validation and serialization.
 """
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Annotated, Optional, List, Literal, Union
 from pydantic import BaseModel, Field
 
+from app.core.config import settings
+from app.core.pagination import CountMode
 from app.models.task import TaskPriority, TaskStatus, RelatedEntityType
 
 
@@ -92,13 +94,73 @@ class TaskResponse(TaskBase):
     }
 
 
+# ========== Batch Schemas ==========
+
+class TaskBatchCreate(BaseModel):
+    """
+    Batch operation creating a task.
+    """
+    op: Literal["create"]
+    data: TaskCreate
+
+
+class TaskBatchUpdate(BaseModel):
+    """
+    Batch operation updating a task.
+    """
+    op: Literal["update"]
+    id: int = Field(..., description="Task ID")
+    data: TaskUpdate
+
+
+class TaskBatchStatus(TaskStatusUpdate):
+    """
+    Batch operation updating task status.
+    """
+    op: Literal["status"]
+    id: int = Field(..., description="Task ID")
+
+
+class TaskBatchAssign(TaskAssign):
+    """
+    Batch operation assigning a task.
+    """
+    op: Literal["assign"]
+    id: int = Field(..., description="Task ID")
+
+
+TaskBatchOperation = Annotated[
+    Union[
+        TaskBatchCreate,
+        TaskBatchUpdate,
+        TaskBatchStatus,
+        TaskBatchAssign
+    ],
+    Field(discriminator="op")
+]
+
+
+class TaskBatchRequest(BaseModel):
+    """
+    Schema for a batch of task operations applied in one transaction.
+    """
+    operations: List[TaskBatchOperation] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BATCH_MAX_OPERATIONS,
+        description="Operations, applied in order"
+    )
+
+
 # ========== List/Pagination Schemas ==========
 
 class TaskListResponse(BaseModel):
     """
     Schema for paginated task list response.
     """
-    total: int = Field(..., description="Total number of tasks")
+    total: Optional[int] = Field(..., description="Total number of tasks, null when count=none")
+    count_mode: CountMode = Field(CountMode.EXACT, description="How total was computed")
     skip: int = Field(..., description="Number of skipped records")
     limit: int = Field(..., description="Number of records per page")
     tasks: List[TaskResponse] = Field(..., description="List of tasks")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
@@ -0,0 +1,145 @@
+"""
+Response cache for the analytics endpoints.
+
+Analytics results are cached per report, RBAC scope (a sales user's own
+data or the global view) and query arguments. Entries are invalidated per
+entity when a session commits changes to leads, customers, deals, tasks or
+users, and expire after ``ANALYTICS_CACHE_TTL`` seconds in any case.
+
+To share the cache between workers, assign another ``CacheBackend``
+implementation to ``response_cache.backend`` at startup.
+"""
+import functools
+import inspect
+from typing import Callable, Dict, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import InMemoryLRUCache, ResponseCache
+from app.core.config import settings
+from app.core.principal import Principal
+from app.models.user import User, UserRole
+from app.models.lead import Lead
+from app.models.customer import Customer
+from app.models.deal import Deal
+from app.models.task import Task
+
+
+response_cache = ResponseCache(
+    InMemoryLRUCache(max_entries=settings.ANALYTICS_CACHE_MAX_ENTRIES),
+    namespace="analytics",
+    ttl=settings.ANALYTICS_CACHE_TTL,
+    enabled=settings.ANALYTICS_CACHE_ENABLED
+)
+
+# Entity written -> cached reports that depend on it
+ENTITY_REPORTS: Dict[str, Tuple[str, ...]] = {
+    "lead": ("dashboard", "leads", "sales_performance"),
+    "customer": ("dashboard", "leads", "sales_performance"),
+    "deal": ("dashboard", "deals", "sales_performance"),
+    "task": ("dashboard", "tasks", "sales_performance"),
+    "user": ("sales_performance",),
+}
+
+TRACKED_MODELS = {
+    Lead: "lead",
+    Customer: "customer",
+    Deal: "deal",
+    Task: "task",
+    User: "user",
+}
+
+# Session.info key holding entities written since the last commit
+_DIRTY_KEY = "analytics_cache_dirty"
+
+
+def _scope(current_user: Principal) -> str:
+    """Cache scope matching the RBAC filter used by the analytics service."""
+    if current_user.role == UserRole.SALES:
+        return f"user:{current_user.id}"
+    return "global"
+
+
+def cached(report: str) -> Callable:
+    """
+    Decorator caching an analytics service function.
+
+    The wrapped function must take ``db`` and ``current_user``; every other
+    argument becomes part of the cache key.
+
+    Args:
+        report: Report name used for per-entity invalidation
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            current_user = arguments.pop("current_user")
+            arguments.pop("db")
+
+            params = ":".join(
+                f"{name}={getattr(value, 'value', value)}"
+                for name, value in arguments.items()
+            )
+            key = f"{report}:{_scope(current_user)}:{params}"
+            return response_cache.get_or_set(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_entity(entity: str) -> None:
+    """
+    Drop cached reports that depend on an entity.
+
+    Args:
+        entity: Entity name (lead, customer, deal, task, user)
+    """
+    for report in ENTITY_REPORTS.get(entity, ()):
+        response_cache.invalidate(f"{report}:")
+
+
+# ========== Session Listeners ==========
+
+def _after_flush(session: Session, flush_context) -> None:
+    """Remember which tracked entities were written in this transaction."""
+    dirty = session.info.setdefault(_DIRTY_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        entity = TRACKED_MODELS.get(type(obj))
+        if entity:
+            dirty.add(entity)
+
+
+def _after_commit(session: Session) -> None:
+    """Invalidate reports for entities written by the committed transaction."""
+    for entity in session.info.pop(_DIRTY_KEY, ()):
+        invalidate_entity(entity)
+
+
+def _after_rollback(session: Session) -> None:
+    """Forget written entities when the transaction is rolled back."""
+    session.info.pop(_DIRTY_KEY, None)
+
+
+def register_listeners() -> None:
+    """
+    Register the ORM session listeners that invalidate the cache on commit.
+    Safe to call more than once.
+    """
+    listeners = (
+        ("after_flush", _after_flush),
+        ("after_commit", _after_commit),
+        ("after_rollback", _after_rollback),
+    )
+    for name, listener in listeners:
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
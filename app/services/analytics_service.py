@@ -1,13 +1,16 @@
 """
 Analytics and dashboard service with optimized aggregation queries.
 """
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, extract
+from sqlalchemy import func, case, cast, extract, Numeric
 from typing import Optional, Dict
 from datetime import datetime, date
 from decimal import Decimal
 from collections import defaultdict
 
+from app.core.config import settings
+from app.core.principal import Principal
 from app.models.user import User, UserRole
 from app.models.lead import Lead, LeadStatus, LeadSource
 from app.models.customer import Customer
@@ -18,20 +21,57 @@ from app.schemas.analytics import (
     LeadAnalytics,
     DealAnalytics,
     SalesPerformance,
+    SalesPerformanceSort,
     UserPerformance,
     TaskAnalytics
 )
+from app.services import rollup_service
+from app.services.analytics_cache import cached
 
 
+def _apply_scope(
+    query,
+    created_column,
+    owner_column,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    user_filter: Optional[int]
+):
+    """
+    Apply the date range and RBAC owner filters shared by analytics queries.
+    """
+    if start_date:
+        query = query.filter(created_column >= datetime.combine(start_date, datetime.min.time()))
+    if end_date:
+        query = query.filter(created_column <= datetime.combine(end_date, datetime.max.time()))
+    if user_filter:
+        query = query.filter(owner_column == user_filter)
+    return query
+
+
+def _count_if(condition):
+    """Conditional COUNT expressed as SUM(CASE WHEN condition THEN 1 ELSE 0 END)."""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _sum_if(condition, expression):
+    """Conditional SUM expressed as SUM(CASE WHEN condition THEN expression ELSE 0 END)."""
+    return func.coalesce(func.sum(case((condition, expression), else_=0)), 0)
+
+
+@cached("dashboard")
 def get_dashboard_overview(
     db: Session,
-    current_user: User,
+    current_user: Principal,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None
 ) -> DashboardOverview:
     """
     Get dashboard overview with key metrics.
     
+    Each entity table is scanned exactly once using conditional aggregates,
+    so the number of queries stays constant regardless of data volume.
+    
     Args:
         db: Database session
         current_user: Current user (for RBAC filtering)
@@ -45,83 +85,61 @@ def get_dashboard_overview(
     is_sales = current_user.role == UserRole.SALES
     user_filter = current_user.id if is_sales else None
     
-    # Lead metrics
-    lead_query = db.query(Lead)
-    if start_date:
-        lead_query = lead_query.filter(Lead.created_at >= datetime.combine(start_date, datetime.min.time()))
-    if end_date:
-        lead_query = lead_query.filter(Lead.created_at <= datetime.combine(end_date, datetime.max.time()))
-    if user_filter:
-        lead_query = lead_query.filter(Lead.assigned_to_id == user_filter)
+    closed_stages = [DealStage.CLOSED_WON, DealStage.CLOSED_LOST]
     
-    total_leads = lead_query.count()
-    active_leads = lead_query.filter(Lead.status.notin_([LeadStatus.WON, LeadStatus.LOST])).count()
+    # Lead metrics
+    lead_row = _apply_scope(
+        db.query(
+            func.count(Lead.id),
+            _count_if(Lead.status.notin_([LeadStatus.WON, LeadStatus.LOST]))
+        ),
+        Lead.created_at, Lead.assigned_to_id, start_date, end_date, user_filter
+    ).one()
+    total_leads, active_leads = lead_row
     
     # Customer metrics
-    customer_query = db.query(Customer)
-    if start_date:
-        customer_query = customer_query.filter(Customer.created_at >= datetime.combine(start_date, datetime.min.time()))
-    if end_date:
-        customer_query = customer_query.filter(Customer.created_at <= datetime.combine(end_date, datetime.max.time()))
-    if user_filter:
-        customer_query = customer_query.filter(Customer.assigned_to_id == user_filter)
-    
-    total_customers = customer_query.count()
-    converted_customers = customer_query.filter(Customer.lead_id.isnot(None)).count()
-    
-    # Deal metrics
-    deal_query = db.query(Deal)
-    if start_date:
-        deal_query = deal_query.filter(Deal.created_at >= datetime.combine(start_date, datetime.min.time()))
-    if end_date:
-        deal_query = deal_query.filter(Deal.created_at <= datetime.combine(end_date, datetime.max.time()))
-    if user_filter:
-        deal_query = deal_query.filter(Deal.owner_id == user_filter)
-    
-    total_deals = deal_query.count()
-    won_deals = deal_query.filter(Deal.stage == DealStage.CLOSED_WON).count()
-    lost_deals = deal_query.filter(Deal.stage == DealStage.CLOSED_LOST).count()
-    active_deals = deal_query.filter(Deal.stage.notin_([DealStage.CLOSED_WON, DealStage.CLOSED_LOST])).count()
-    
-    # Revenue metrics
-    total_revenue = db.query(func.sum(Deal.value)).filter(
-        Deal.stage == DealStage.CLOSED_WON
-    )
-    if start_date:
-        total_revenue = total_revenue.filter(Deal.created_at >= datetime.combine(start_date, datetime.min.time()))
-    if end_date:
-        total_revenue = total_revenue.filter(Deal.created_at <= datetime.combine(end_date, datetime.max.time()))
-    if user_filter:
-        total_revenue = total_revenue.filter(Deal.owner_id == user_filter)
-    total_revenue = total_revenue.scalar() or Decimal(0)
-    
-    # Pipeline value (active deals)
-    pipeline_value = db.query(func.sum(Deal.value)).filter(
-        Deal.stage.notin_([DealStage.CLOSED_WON, DealStage.CLOSED_LOST])
-    )
-    if start_date:
-        pipeline_value = pipeline_value.filter(Deal.created_at >= datetime.combine(start_date, datetime.min.time()))
-    if end_date:
-        pipeline_value = pipeline_value.filter(Deal.created_at <= datetime.combine(end_date, datetime.max.time()))
-    if user_filter:
-        pipeline_value = pipeline_value.filter(Deal.owner_id == user_filter)
-    pipeline_value = pipeline_value.scalar() or Decimal(0)
-    
-    # Weighted pipeline
-    active_deals_list = deal_query.filter(Deal.stage.notin_([DealStage.CLOSED_WON, DealStage.CLOSED_LOST])).all()
-    weighted_pipeline = sum(deal.weighted_value for deal in active_deals_list)
+    customer_row = _apply_scope(
+        db.query(
+            func.count(Customer.id),
+            _count_if(Customer.lead_id.isnot(None))
+        ),
+        Customer.created_at, Customer.assigned_to_id, start_date, end_date, user_filter
+    ).one()
+    total_customers, converted_customers = customer_row
+    
+    # Deal, revenue and pipeline metrics
+    is_active_deal = Deal.stage.notin_(closed_stages)
+    deal_row = _apply_scope(
+        db.query(
+            func.count(Deal.id),
+            _count_if(Deal.stage == DealStage.CLOSED_WON),
+            _count_if(Deal.stage == DealStage.CLOSED_LOST),
+            _count_if(is_active_deal),
+            _sum_if(Deal.stage == DealStage.CLOSED_WON, Deal.value),
+            _sum_if(is_active_deal, Deal.value),
+            _sum_if(is_active_deal, cast(Deal.value * Deal.probability / 100.0, Numeric(19, 4)))
+        ),
+        Deal.created_at, Deal.owner_id, start_date, end_date, user_filter
+    ).one()
+    (
+        total_deals,
+        won_deals,
+        lost_deals,
+        active_deals,
+        total_revenue,
+        pipeline_value,
+        weighted_pipeline
+    ) = deal_row
     
     # Task metrics
-    task_query = db.query(Task)
-    if start_date:
-        task_query = task_query.filter(Task.created_at >= datetime.combine(start_date, datetime.min.time()))
-    if end_date:
-        task_query = task_query.filter(Task.created_at <= datetime.combine(end_date, datetime.max.time()))
-    if user_filter:
-        task_query = task_query.filter(Task.assigned_to_id == user_filter)
-    
-    active_tasks = task_query.filter(Task.status == TaskStatus.PENDING).count()
-    overdue_tasks = task_query.filter(Task.status == TaskStatus.OVERDUE).count()
+    task_row = _apply_scope(
+        db.query(
+            _count_if(Task.status == TaskStatus.PENDING),
+            _count_if(Task.status == TaskStatus.OVERDUE)
+        ),
+        Task.created_at, Task.assigned_to_id, start_date, end_date, user_filter
+    ).one()
+    active_tasks, overdue_tasks = task_row
     
     return DashboardOverview(
         total_leads=total_leads,
@@ -132,26 +150,53 @@ def get_dashboard_overview(
         won_deals=won_deals,
         lost_deals=lost_deals,
         active_deals=active_deals,
-        total_revenue=total_revenue,
-        pipeline_value=pipeline_value,
-        weighted_pipeline=weighted_pipeline,
+        total_revenue=Decimal(total_revenue or 0),
+        pipeline_value=Decimal(pipeline_value or 0),
+        weighted_pipeline=Decimal(weighted_pipeline or 0),
         active_tasks=active_tasks,
         overdue_tasks=overdue_tasks
     )
 
 
+async def get_dashboard_overview_async(
+    db: AsyncSession,
+    current_user: Principal,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> DashboardOverview:
+    """
+    ``get_dashboard_overview`` on an async session (cached the same way).
+    
+    Args:
+        db: Async database session
+        current_user: Current user (for RBAC filtering)
+        start_date: Optional start date filter
+        end_date: Optional end date filter
+        
+    Returns:
+        DashboardOverview with aggregated metrics
+    """
+    return await db.run_sync(get_dashboard_overview, current_user, start_date, end_date)
+
+
+@cached("leads")
 def get_lead_analytics(
     db: Session,
-    current_user: User,
+    current_user: Principal,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None
 ) -> LeadAnalytics:
     """
     Get lead analytics with distributions.
+    
+    Reads from the daily metrics rollup when it is enabled.
     """
     is_sales = current_user.role == UserRole.SALES
     user_filter = current_user.id if is_sales else None
     
+    if settings.ANALYTICS_ROLLUP_ENABLED:
+        return _lead_analytics_from_rollup(db, start_date, end_date, user_filter)
+    
     lead_query = db.query(Lead)
     if start_date:
         lead_query = lead_query.filter(Lead.created_at >= datetime.combine(start_date, datetime.min.time()))
@@ -212,18 +257,24 @@ def get_lead_analytics(
     )
 
 
+@cached("deals")
 def get_deal_analytics(
     db: Session,
-    current_user: User,
+    current_user: Principal,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None
 ) -> DealAnalytics:
     """
     Get deal analytics with pipeline metrics.
+    
+    Reads from the daily metrics rollup when it is enabled.
     """
     is_sales = current_user.role == UserRole.SALES
     user_filter = current_user.id if is_sales else None
     
+    if settings.ANALYTICS_ROLLUP_ENABLED:
+        return _deal_analytics_from_rollup(db, start_date, end_date, user_filter)
+    
     deal_query = db.query(Deal)
     if start_date:
         deal_query = deal_query.filter(Deal.created_at >= datetime.combine(start_date, datetime.min.time()))
@@ -295,68 +346,128 @@ def get_deal_analytics(
     )
 
 
+@cached("sales_performance")
 def get_sales_performance(
     db: Session,
-    current_user: User
+    current_user: Principal,
+    skip: int = 0,
+    limit: int = 100,
+    sort_by: Optional[SalesPerformanceSort] = None
 ) -> SalesPerformance:
     """
     Get sales performance metrics per user.
+    
+    Metrics are computed with one GROUP BY query per table and joined
+    in memory by user ID, so the query count does not grow with team size.
+    
+    Args:
+        db: Database session
+        current_user: Current user (for RBAC filtering)
+        skip: Number of users to skip
+        limit: Maximum number of users to return
+        sort_by: Optional metric to sort by (descending)
+        
+    Returns:
+        SalesPerformance with a page of per-user metrics
     """
     # Only admin/manager can see all users
     if current_user.role in [UserRole.ADMIN, UserRole.MANAGER]:
-        users = db.query(User).filter(User.role.in_([UserRole.SALES, UserRole.MANAGER])).all()
+        users = db.query(User).filter(
+            User.role.in_([UserRole.SALES, UserRole.MANAGER])
+        ).order_by(User.id).all()
+        user_filter = None
     else:
-        users = [current_user]
+        users = [current_user.load(db)]
+        user_filter = current_user.id
+    
+    def grouped(query, owner_column):
+        if user_filter:
+            query = query.filter(owner_column == user_filter)
+        return query.group_by(owner_column).all()
+    
+    leads_by_user = dict(grouped(
+        db.query(Lead.assigned_to_id, func.count(Lead.id)),
+        Lead.assigned_to_id
+    ))
+    customers_by_user = dict(grouped(
+        db.query(Customer.assigned_to_id, func.count(Customer.id)),
+        Customer.assigned_to_id
+    ))
+    tasks_by_user = dict(grouped(
+        db.query(Task.assigned_to_id, func.count(Task.id)).filter(Task.status == TaskStatus.PENDING),
+        Task.assigned_to_id
+    ))
+    
+    is_won = Deal.stage == DealStage.CLOSED_WON
+    deals_by_user = {
+        owner_id: (deals_owned, total_value, won_deals, closed_deals, won_value)
+        for owner_id, deals_owned, total_value, won_deals, closed_deals, won_value in grouped(
+            db.query(
+                Deal.owner_id,
+                func.count(Deal.id),
+                func.sum(Deal.value),
+                _count_if(is_won),
+                _count_if(Deal.stage.in_([DealStage.CLOSED_WON, DealStage.CLOSED_LOST])),
+                _sum_if(is_won, Deal.value)
+            ),
+            Deal.owner_id
+        )
+    }
     
     user_performances = []
     
     for user in users:
-        leads_assigned = db.query(Lead).filter(Lead.assigned_to_id == user.id).count()
-        customers_managed = db.query(Customer).filter(Customer.assigned_to_id == user.id).count()
-        deals_owned = db.query(Deal).filter(Deal.owner_id == user.id).count()
-        
-        total_deal_value = db.query(func.sum(Deal.value)).filter(Deal.owner_id == user.id).scalar() or Decimal(0)
-        won_deals = db.query(Deal).filter(Deal.owner_id == user.id, Deal.stage == DealStage.CLOSED_WON).count()
-        
-        closed_deals = db.query(Deal).filter(
-            Deal.owner_id == user.id,
-            Deal.stage.in_([DealStage.CLOSED_WON, DealStage.CLOSED_LOST])
-        ).count()
+        deals_owned, total_deal_value, won_deals, closed_deals, won_deal_value = deals_by_user.get(
+            user.id, (0, None, 0, 0, None)
+        )
         win_rate = (won_deals / closed_deals * 100) if closed_deals > 0 else 0.0
         
-        active_tasks = db.query(Task).filter(Task.assigned_to_id == user.id, Task.status == TaskStatus.PENDING).count()
-        
         user_performances.append(UserPerformance(
             user_id=user.id,
             user_name=user.full_name,
             user_email=user.email,
-            leads_assigned=leads_assigned,
-            customers_managed=customers_managed,
+            leads_assigned=leads_by_user.get(user.id, 0),
+            customers_managed=customers_by_user.get(user.id, 0),
             deals_owned=deals_owned,
-            total_deal_value=total_deal_value,
+            total_deal_value=Decimal(total_deal_value or 0),
             won_deals=won_deals,
+            won_deal_value=Decimal(won_deal_value or 0),
             win_rate=round(win_rate, 2),
-            active_tasks=active_tasks
+            active_tasks=tasks_by_user.get(user.id, 0)
         ))
     
+    if sort_by:
+        user_performances.sort(
+            key=lambda perf: (getattr(perf, sort_by.value), -perf.user_id),
+            reverse=True
+        )
+    
     return SalesPerformance(
-        users=user_performances,
-        total_users=len(user_performances)
+        users=user_performances[skip:skip + limit],
+        total_users=len(user_performances),
+        skip=skip,
+        limit=limit
     )
 
 
+@cached("tasks")
 def get_task_analytics(
     db: Session,
-    current_user: User,
+    current_user: Principal,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None
 ) -> TaskAnalytics:
     """
     Get task analytics.
+    
+    Reads from the daily metrics rollup when it is enabled.
     """
     is_sales = current_user.role == UserRole.SALES
     user_filter = current_user.id if is_sales else None
     
+    if settings.ANALYTICS_ROLLUP_ENABLED:
+        return _task_analytics_from_rollup(db, start_date, end_date, user_filter)
+    
     task_query = db.query(Task)
     if start_date:
         task_query = task_query.filter(Task.created_at >= datetime.combine(start_date, datetime.min.time()))
@@ -398,3 +509,102 @@ def get_task_analytics(
         priority_distribution=priority_distribution,
         tasks_by_entity=tasks_by_entity
     )
+
+
+# ========== Rollup-backed Analytics ==========
+
+def _lead_analytics_from_rollup(
+    db: Session,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    user_filter: Optional[int]
+) -> LeadAnalytics:
+    """
+    Build lead analytics from the daily metrics rollup.
+    """
+    rows = rollup_service.read_metrics(db, "lead", start_date, end_date, user_filter)
+    sources = rollup_service.summarize(rows, "source:")
+    statuses = rollup_service.summarize(rows, "status:")
+    total_leads = sum(count for count, _ in sources.values())
+    
+    # Conversion counts are not date filtered (matches the raw query)
+    customer_rows = rollup_service.read_metrics(db, "customer", user_filter=user_filter)
+    converted_count = sum(count for count, _ in rollup_service.summarize(customer_rows, "converted").values())
+    
+    conversion_rate = (converted_count / total_leads * 100) if total_leads > 0 else 0.0
+    
+    return LeadAnalytics(
+        total_leads=total_leads,
+        conversion_rate=round(conversion_rate, 2),
+        source_distribution={source: count for source, (count, _) in sources.items()},
+        status_distribution={status: count for status, (count, _) in statuses.items()},
+        monthly_leads={
+            month: count
+            for month, (count, _) in rollup_service.summarize_monthly(rows, "source:").items()
+        }
+    )
+
+
+def _deal_analytics_from_rollup(
+    db: Session,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    user_filter: Optional[int]
+) -> DealAnalytics:
+    """
+    Build deal analytics from the daily metrics rollup.
+    """
+    rows = rollup_service.read_metrics(db, "deal", start_date, end_date, user_filter)
+    stages = rollup_service.summarize(rows, "stage:")
+    
+    total_deals = sum(count for count, _ in stages.values())
+    total_value = sum((value for _, value in stages.values()), Decimal(0))
+    average_value = (total_value / total_deals) if total_deals > 0 else Decimal(0)
+    
+    won_count = stages.get(DealStage.CLOSED_WON.value, (0, Decimal(0)))[0]
+    closed_count = won_count + stages.get(DealStage.CLOSED_LOST.value, (0, Decimal(0)))[0]
+    win_rate = (won_count / closed_count * 100) if closed_count > 0 else 0.0
+    
+    return DealAnalytics(
+        total_deals=total_deals,
+        total_value=total_value,
+        average_deal_value=average_value,
+        win_rate=round(win_rate, 2),
+        stage_distribution={stage: count for stage, (count, _) in stages.items()},
+        stage_value_distribution={stage: value for stage, (_, value) in stages.items()},
+        monthly_revenue={
+            month: value
+            for month, (_, value) in rollup_service.summarize_monthly(rows, "won_revenue").items()
+        }
+    )
+
+
+def _task_analytics_from_rollup(
+    db: Session,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    user_filter: Optional[int]
+) -> TaskAnalytics:
+    """
+    Build task analytics from the daily metrics rollup.
+    """
+    rows = rollup_service.read_metrics(db, "task", start_date, end_date, user_filter)
+    statuses = rollup_service.summarize(rows, "status:")
+    
+    def status_count(task_status: TaskStatus) -> int:
+        return statuses.get(task_status.value, (0, Decimal(0)))[0]
+    
+    return TaskAnalytics(
+        total_tasks=sum(count for count, _ in statuses.values()),
+        pending_tasks=status_count(TaskStatus.PENDING),
+        completed_tasks=status_count(TaskStatus.COMPLETED),
+        overdue_tasks=status_count(TaskStatus.OVERDUE),
+        priority_distribution={
+            priority: count
+            for priority, (count, _) in rollup_service.summarize(rows, "priority:").items()
+        },
+        tasks_by_entity={
+            entity: count
+            for entity, (count, _) in rollup_service.summarize(rows, "related:").items()
+        }
+    )
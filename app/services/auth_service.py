@@ -4,18 +4,37 @@ Authentication service containing business logic for authentication operations.
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
 
 from app.models.user import User
 from app.schemas.auth import UserRegister
-from app.core.security import hash_password, verify_password
+from app.core.security import password_hasher
 from app.core.jwt import create_access_token, create_refresh_token, decode_token, verify_token_type
 from app.crud import user as user_crud
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+def _find_user(db: Session, email: str) -> Optional[User]:
+    """
+    Look up a user by email, then end the read transaction.
+    
+    Hashing can wait on the pool for a while; ending the transaction returns
+    the connection to the engine pool meanwhile. The user is detached first
+    so its loaded attributes stay readable.
+    """
+    user = user_crud.get_user_by_email(db, email=email)
+    if user is not None:
+        db.expunge(user)
+    db.rollback()
+    return user
+
+
+async def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """
     Authenticate a user by email and password.
     
+    The password is verified on the hashing pool; a hash made with an
+    outdated bcrypt cost is replaced by one with the configured cost.
+    
     Args:
         db: Database session
         email: User's email address
@@ -23,21 +42,29 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
         
     Returns:
         User object if authentication successful, None otherwise
+        
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated
     """
     # Get user by email
-    user = user_crud.get_user_by_email(db, email=email)
+    user = await run_in_threadpool(_find_user, db, email)
     
     if not user:
         return None
     
     # Verify password
-    if not verify_password(password, user.hashed_password):
+    is_valid, new_hash = await password_hasher.verify_and_update(password, user.hashed_password)
+    if not is_valid:
         return None
     
+    # Rehash with the current cost
+    if new_hash:
+        await run_in_threadpool(user_crud.set_password_hash, db, user, new_hash)
+    
     return user
 
 
-def register_user(db: Session, user_data: UserRegister) -> User:
+async def register_user(db: Session, user_data: UserRegister) -> User:
     """
     Register a new user.
     
@@ -49,10 +76,11 @@ def register_user(db: Session, user_data: UserRegister) -> User:
         Created User object
         
     Raises:
-        HTTPException: If email already exists
+        HTTPException: If email already exists, or 503 if the hashing pool
+            is saturated
     """
     # Check if user with email already exists
-    existing_user = user_crud.get_user_by_email(db, email=user_data.email)
+    existing_user = await run_in_threadpool(_find_user, db, user_data.email)
     
     if existing_user:
         raise HTTPException(
@@ -70,7 +98,10 @@ def register_user(db: Session, user_data: UserRegister) -> User:
         is_active=True
     )
     
-    user = user_crud.create_user(db=db, user=user_create)
+    hashed_password = await password_hasher.hash(user_data.password)
+    user = await run_in_threadpool(
+        user_crud.create_user, db=db, user=user_create, hashed_password=hashed_password
+    )
     return user
 
 
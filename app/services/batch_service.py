@@ -0,0 +1,209 @@
+"""
+Shared mechanics of the /leads, /deals and /tasks batch endpoints.
+
+A batch loads every record and user its operations reference with one
+``IN`` query per model (``fetch_by_ids``), checks each operation against
+those objects with the same rules as the single-record endpoints, and
+applies the accepted ones to ORM objects in one session, committed once.
+Going through the ORM keeps the rollup, search index and analytics cache
+listeners in step, as the single-record writes do.
+
+An operation failing its checks raises the HTTPException its single-record
+endpoint would have raised; ``run_batch`` reports it as that operation's
+result and carries on, so one bad row does not reject the whole batch.
+Any other error (a ValueError from a value the checks let through, a
+database error) is reported the same way, after undoing whatever the
+operation changed before it failed.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.logging_config import get_logger
+from app.schemas.common import BatchItemResult, BatchResponse
+
+
+logger = get_logger(__name__)
+
+
+def referenced_ids(operations: Sequence[BaseModel], field: str) -> Set[int]:
+    """
+    Collect the IDs held in ``field`` of batch operations or their ``data``.
+
+    Args:
+        operations: Batch operations
+        field: Attribute name, e.g. ``id`` or ``assigned_to_id``
+
+    Returns:
+        Set of non-null IDs
+    """
+    ids = set()
+
+    for operation in operations:
+        for source in (operation, getattr(operation, "data", None)):
+            value = getattr(source, field, None)
+            if value is not None:
+                ids.add(value)
+
+    return ids
+
+
+def fetch_by_ids(db: Session, model: Any, ids: Iterable[int]) -> Dict[int, Any]:
+    """
+    Load the rows of a model with the given IDs in one query.
+
+    Args:
+        db: Database session
+        model: Mapped class with an ``id`` primary key
+        ids: IDs to load
+
+    Returns:
+        Dict of ID to object; missing IDs are absent
+    """
+    ids = set(ids)
+
+    if not ids:
+        return {}
+
+    return {row.id: row for row in db.query(model).filter(model.id.in_(ids))}
+
+
+def get_or_404(records: Dict[int, Any], record_id: int, name: str) -> Any:
+    """
+    Get a prefetched record, raising like the single-record endpoints.
+
+    Args:
+        records: Records returned by ``fetch_by_ids``
+        record_id: ID to look up
+        name: Entity name for the error, e.g. "Lead"
+
+    Returns:
+        The record
+
+    Raises:
+        HTTPException: If the record doesn't exist
+    """
+    record = records.get(record_id)
+
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{name} not found"
+        )
+
+    return record
+
+
+def apply_fields(record: Any, update: BaseModel) -> None:
+    """
+    Set the fields provided in an update schema on a record.
+
+    Args:
+        record: ORM object to update (not committed)
+        update: Update schema; only explicitly set fields are applied
+    """
+    for field, value in update.model_dump(exclude_unset=True).items():
+        setattr(record, field, value)
+
+
+def _failed(index: int, operation: BaseModel, status_code: int, error: str) -> BatchItemResult:
+    """Result of a rejected operation."""
+    return BatchItemResult(
+        index=index,
+        op=operation.op,
+        success=False,
+        status_code=status_code,
+        error=error
+    )
+
+
+def run_batch(
+    db: Session,
+    operations: Sequence[BaseModel],
+    apply: Callable[[BaseModel], Any]
+) -> BatchResponse:
+    """
+    Apply batch operations in order and commit them in one transaction.
+
+    ``apply`` checks one operation and applies it to the session, returning
+    the created or updated record. It should raise before changing anything.
+    If it fails with anything but an HTTPException, it may have changed the
+    session halfway: the session is rolled back and the operations accepted
+    so far are applied again, so the failed one leaves nothing behind.
+    Lookups in ``apply`` do not autoflush, so a database error on writing an
+    earlier operation cannot be blamed on a later one.
+
+    Args:
+        db: Database session
+        operations: Batch operations
+        apply: Callback applying one operation
+
+    Returns:
+        BatchResponse with one result per operation, in request order
+
+    Raises:
+        HTTPException: 409 if the database rejects the accepted operations;
+            nothing is applied then
+    """
+    results: List[Optional[BatchItemResult]] = []
+    applied = []
+
+    for index, operation in enumerate(operations):
+        try:
+            with db.no_autoflush:
+                record = apply(operation)
+        except HTTPException as e:
+            results.append(_failed(index, operation, e.status_code, str(e.detail)))
+            continue
+        except Exception as e:
+            if isinstance(e, ValueError):
+                results.append(_failed(index, operation, 422, str(e)))
+            else:
+                logger.exception(f"Batch operation {index} ({operation.op}) failed")
+                results.append(_failed(
+                    index, operation, status.HTTP_500_INTERNAL_SERVER_ERROR, "Operation failed"
+                ))
+
+            # Undo the failed operation's partial changes
+            db.rollback()
+            with db.no_autoflush:
+                applied = [
+                    (applied_index, applied_operation, apply(applied_operation))
+                    for applied_index, applied_operation, _ in applied
+                ]
+            continue
+
+        results.append(None)
+        applied.append((index, operation, record))
+
+    # One flush writes all accepted operations and assigns new IDs
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Batch conflicts with existing data; no operations were applied"
+        )
+
+    for index, operation, record in applied:
+        results[index] = BatchItemResult(
+            index=index,
+            op=operation.op,
+            success=True,
+            status_code=status.HTTP_201_CREATED if operation.op == "create" else status.HTTP_200_OK,
+            id=record.id
+        )
+
+    db.commit()
+
+    succeeded = len(applied)
+    return BatchResponse(
+        total=len(operations),
+        succeeded=succeeded,
+        failed=len(operations) - succeeded,
+        results=results
+    )
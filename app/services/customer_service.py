@@ -4,15 +4,18 @@ Business logic for customer management.
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
-from app.models.customer import Customer
-from app.models.user import User, UserRole
+from app.core.pagination import CountMode
+from app.core.principal import Principal
+from app.crud.rows import ResponseRows
+from app.models.customer import Customer, CustomerInteraction
+from app.models.user import UserRole
 from app.models.lead import Lead, LeadStatus
 from app.crud import customer as customer_crud
 from app.crud import lead as lead_crud
 from app.schemas.customer import CustomerCreate, LeadToCustomerConvert
 
 
-def can_user_access_customer(user: User, customer: Customer) -> bool:
+def can_user_access_customer(user: Principal, customer: Customer) -> bool:
     """
     Check if user can access a specific customer.
     
@@ -38,7 +41,7 @@ def can_user_access_customer(user: User, customer: Customer) -> bool:
     return False
 
 
-def can_user_modify_customer(user: User, customer: Customer) -> bool:
+def can_user_modify_customer(user: Principal, customer: Customer) -> bool:
     """
     Check if user can modify a specific customer.
     
@@ -56,7 +59,7 @@ def can_user_modify_customer(user: User, customer: Customer) -> bool:
     return can_user_access_customer(user, customer)
 
 
-def can_user_delete_customer(user: User) -> bool:
+def can_user_delete_customer(user: Principal) -> bool:
     """
     Check if user can delete customers.
     
@@ -110,7 +113,7 @@ def validate_customer_assignment(db: Session, assigned_to_id: int) -> None:
 def create_customer_with_validation(
     db: Session,
     customer: CustomerCreate,
-    current_user: User
+    current_user: Principal
 ) -> Customer:
     """
     Create a customer with business logic validation.
@@ -118,7 +121,7 @@ def create_customer_with_validation(
     Args:
         db: Database session
         customer: Customer creation data
-        current_user: User creating the customer
+        current_user: Principal creating the customer
         
     Returns:
         Created Customer object
@@ -137,7 +140,7 @@ def create_customer_with_validation(
 def convert_lead_to_customer_with_validation(
     db: Session,
     conversion_data: LeadToCustomerConvert,
-    current_user: User
+    current_user: Principal
 ) -> Customer:
     """
     Convert a lead to a customer with validation.
@@ -145,7 +148,7 @@ def convert_lead_to_customer_with_validation(
     Args:
         db: Database session
         conversion_data: Conversion request data
-        current_user: User performing the conversion
+        current_user: Principal performing the conversion
         
     Returns:
         Created Customer object
@@ -210,10 +213,14 @@ def convert_lead_to_customer_with_validation(
 
 def get_customers_for_user(
     db: Session,
-    user: User,
+    user: Principal,
     skip: int = 0,
     limit: int = 100,
-    search: str = None
+    search: str = None,
+    cursor: str = None,
+    count_mode: CountMode = CountMode.EXACT,
+    options: tuple = (),
+    rows: ResponseRows = None
 ):
     """
     Get customers based on user permissions.
@@ -224,6 +231,10 @@ def get_customers_for_user(
         skip: Pagination skip
         limit: Pagination limit
         search: Search term
+        cursor: Keyset pagination cursor (replaces skip)
+        count_mode: How to compute the total
+        options: Loader options for the response schema
+        rows: Row selection (``response_rows``) to return rows instead of ORM objects
         
     Returns:
         Tuple of (customers, total)
@@ -234,7 +245,11 @@ def get_customers_for_user(
             db,
             skip=skip,
             limit=limit,
-            search=search
+            search=search,
+            cursor=cursor,
+            count_mode=count_mode,
+            options=options,
+            rows=rows
         )
     
     # Sales only see assigned customers
@@ -243,5 +258,92 @@ def get_customers_for_user(
         skip=skip,
         limit=limit,
         search=search,
+        cursor=cursor,
+        count_mode=count_mode,
+        options=options,
+        rows=rows,
         assigned_to_id=user.id
     )
+
+
+# Columns of customer exports, primary key first
+EXPORT_COLUMNS = (
+    Customer.id,
+    Customer.full_name,
+    Customer.email,
+    Customer.phone,
+    Customer.company,
+    Customer.lead_id,
+    Customer.assigned_to_id,
+    Customer.created_by_id,
+    Customer.created_at,
+    Customer.updated_at
+)
+
+# Columns of customer interaction exports, primary key first
+INTERACTION_EXPORT_COLUMNS = (
+    CustomerInteraction.id,
+    CustomerInteraction.customer_id,
+    CustomerInteraction.user_id,
+    CustomerInteraction.interaction_type,
+    CustomerInteraction.subject,
+    CustomerInteraction.description,
+    CustomerInteraction.created_at,
+    CustomerInteraction.updated_at
+)
+
+
+def get_customers_export_query(db: Session, user: Principal, search: str = None):
+    """
+    Build the query of customers a user may export.
+    
+    Args:
+        db: Database session
+        user: Current user
+        search: Search term
+        
+    Returns:
+        Filtered customer query, limited to assigned customers for sales users
+    """
+    # Admin and Manager export all customers
+    if user.role in [UserRole.ADMIN, UserRole.MANAGER]:
+        return customer_crud.customers_query(db, search=search)
+    
+    # Sales only export assigned customers
+    return customer_crud.customers_query(db, search=search, assigned_to_id=user.id)
+
+
+def get_interactions_export_query(
+    db: Session,
+    user: Principal,
+    customer_id: int = None,
+    interaction_type: str = None
+):
+    """
+    Build the query of customer interactions a user may export.
+    
+    Args:
+        db: Database session
+        user: Current user
+        customer_id: Filter by customer
+        interaction_type: Filter by interaction type
+        
+    Returns:
+        Filtered interaction query, limited to assigned customers' interactions
+        for sales users
+    """
+    # Admin and Manager export all interactions
+    if user.role in [UserRole.ADMIN, UserRole.MANAGER]:
+        return customer_crud.interactions_query(
+            db,
+            customer_id=customer_id,
+            interaction_type=interaction_type
+        )
+    
+    # Sales only export interactions of assigned customers
+    return customer_crud.interactions_query(
+        db,
+        customer_id=customer_id,
+        interaction_type=interaction_type,
+        customer_assigned_to_id=user.id
+    )
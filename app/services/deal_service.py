@@ -1,17 +1,26 @@
 """
 Business logic for deal management.
 """
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
+from app.core.pagination import CountMode
+from app.core.principal import Principal
+from app.crud.rows import ResponseRows
+from app.models.customer import Customer
 from app.models.deal import Deal
 from app.models.user import User, UserRole
 from app.crud import deal as deal_crud
 from app.crud import customer as customer_crud
-from app.schemas.deal import DealCreate
+from app.schemas.common import BatchResponse
+from app.schemas.deal import DealCreate, DealBatchOperation
+from app.services import batch_service
 
 
-def can_user_access_deal(user: User, deal: Deal) -> bool:
+def can_user_access_deal(user: Principal, deal: Deal) -> bool:
     """
     Check if user can access a specific deal.
     
@@ -37,7 +46,7 @@ def can_user_access_deal(user: User, deal: Deal) -> bool:
     return False
 
 
-def can_user_modify_deal(user: User, deal: Deal) -> bool:
+def can_user_modify_deal(user: Principal, deal: Deal) -> bool:
     """
     Check if user can modify a specific deal.
     
@@ -55,7 +64,7 @@ def can_user_modify_deal(user: User, deal: Deal) -> bool:
     return can_user_access_deal(user, deal)
 
 
-def can_user_delete_deal(user: User) -> bool:
+def can_user_delete_deal(user: Principal) -> bool:
     """
     Check if user can delete deals.
     
@@ -72,7 +81,7 @@ def can_user_delete_deal(user: User) -> bool:
     return user.role in [UserRole.ADMIN, UserRole.MANAGER]
 
 
-def can_user_assign_deal(user: User) -> bool:
+def can_user_assign_deal(user: Principal) -> bool:
     """
     Check if user can assign deals.
     
@@ -89,21 +98,16 @@ def can_user_assign_deal(user: User) -> bool:
     return user.role in [UserRole.ADMIN, UserRole.MANAGER]
 
 
-def validate_deal_owner(db: Session, owner_id: int) -> None:
+def check_deal_owner(user: Optional[User]) -> None:
     """
-    Validate that the deal owner exists and has appropriate role.
+    Check that a loaded user can own deals.
     
     Args:
-        db: Database session
-        owner_id: User ID to assign as owner
+        user: User to assign as owner, None if not found
         
     Raises:
         HTTPException: If user doesn't exist or doesn't have appropriate role
     """
-    from app.crud import user as user_crud
-    
-    user = user_crud.get_user(db, user_id=owner_id)
-    
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -123,19 +127,32 @@ def validate_deal_owner(db: Session, owner_id: int) -> None:
         )
 
 
-def validate_customer_exists(db: Session, customer_id: int) -> None:
+def validate_deal_owner(db: Session, owner_id: int) -> None:
     """
-    Validate that the customer exists.
+    Validate that the deal owner exists and has appropriate role.
     
     Args:
         db: Database session
-        customer_id: Customer ID
+        owner_id: User ID to assign as owner
         
     Raises:
-        HTTPException: If customer doesn't exist
+        HTTPException: If user doesn't exist or doesn't have appropriate role
     """
-    customer = customer_crud.get_customer(db, customer_id=customer_id)
+    from app.crud import user as user_crud
     
+    check_deal_owner(user_crud.get_user(db, user_id=owner_id))
+
+
+def check_customer_exists(customer: Optional[Customer]) -> None:
+    """
+    Check that a looked-up customer exists.
+    
+    Args:
+        customer: Customer, None if not found
+        
+    Raises:
+        HTTPException: If customer doesn't exist
+    """
     if not customer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -143,10 +160,24 @@ def validate_customer_exists(db: Session, customer_id: int) -> None:
         )
 
 
+def validate_customer_exists(db: Session, customer_id: int) -> None:
+    """
+    Validate that the customer exists.
+    
+    Args:
+        db: Database session
+        customer_id: Customer ID
+        
+    Raises:
+        HTTPException: If customer doesn't exist
+    """
+    check_customer_exists(customer_crud.get_customer(db, customer_id=customer_id))
+
+
 def create_deal_with_validation(
     db: Session,
     deal: DealCreate,
-    current_user: User
+    current_user: Principal
 ) -> Deal:
     """
     Create a deal with business logic validation.
@@ -154,7 +185,7 @@ def create_deal_with_validation(
     Args:
         db: Database session
         deal: Deal creation data
-        current_user: User creating the deal
+        current_user: Principal creating the deal
         
     Returns:
         Created Deal object
@@ -173,14 +204,86 @@ def create_deal_with_validation(
     return deal_crud.create_deal(db, deal, owner_id=current_user.id)
 
 
+def apply_deal_batch(
+    db: Session,
+    operations: List[DealBatchOperation],
+    current_user: Principal
+) -> BatchResponse:
+    """
+    Apply a batch of deal operations in one transaction.
+    
+    Each operation gets the checks of its single-record endpoint (create,
+    update, stage, assign), against deals, customers and owners loaded with
+    one query each. Rejected operations are reported and skipped.
+    
+    Args:
+        db: Database session
+        operations: Deal operations, applied in order
+        current_user: Principal running the batch
+        
+    Returns:
+        BatchResponse with per-operation results
+    """
+    deals = batch_service.fetch_by_ids(db, Deal, batch_service.referenced_ids(operations, "id"))
+    customers = batch_service.fetch_by_ids(db, Customer, batch_service.referenced_ids(operations, "customer_id"))
+    users = batch_service.fetch_by_ids(db, User, batch_service.referenced_ids(operations, "owner_id"))
+    
+    def apply(operation):
+        if operation.op == "create":
+            check_customer_exists(customers.get(operation.data.customer_id))
+            if operation.data.owner_id:
+                check_deal_owner(users.get(operation.data.owner_id))
+            
+            deal = deal_crud.build_deal(operation.data, owner_id=current_user.id)
+            db.add(deal)
+            return deal
+        
+        if operation.op == "assign" and not can_user_assign_deal(current_user):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Admin or Manager access required. Your role: {current_user.role.value}"
+            )
+        
+        deal = batch_service.get_or_404(deals, operation.id, "Deal")
+        
+        if operation.op == "assign":
+            check_deal_owner(users.get(operation.owner_id))
+            deal.owner_id = operation.owner_id
+            return deal
+        
+        if not can_user_modify_deal(current_user, deal):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to modify this deal"
+            )
+        
+        if operation.op == "stage":
+            deal_crud.set_deal_stage(deal, operation.stage)
+            return deal
+        
+        if operation.data.customer_id is not None:
+            check_customer_exists(customers.get(operation.data.customer_id))
+        if operation.data.owner_id is not None:
+            check_deal_owner(users.get(operation.data.owner_id))
+        
+        batch_service.apply_fields(deal, operation.data)
+        return deal
+    
+    return batch_service.run_batch(db, operations, apply)
+
+
 def get_deals_for_user(
     db: Session,
-    user: User,
+    user: Principal,
     skip: int = 0,
     limit: int = 100,
     stage: str = None,
     customer_id: int = None,
-    search: str = None
+    search: str = None,
+    cursor: str = None,
+    count_mode: CountMode = CountMode.EXACT,
+    options: tuple = (),
+    rows: ResponseRows = None
 ):
     """
     Get deals based on user permissions.
@@ -193,6 +296,10 @@ def get_deals_for_user(
         stage: Filter by stage
         customer_id: Filter by customer
         search: Search term
+        cursor: Keyset pagination cursor (replaces skip)
+        count_mode: How to compute the total
+        options: Loader options for the response schema
+        rows: Row selection (``response_rows``) to return rows instead of ORM objects
         
     Returns:
         Tuple of (deals, total)
@@ -205,7 +312,11 @@ def get_deals_for_user(
             limit=limit,
             stage=stage,
             customer_id=customer_id,
-            search=search
+            search=search,
+            cursor=cursor,
+            count_mode=count_mode,
+            options=options,
+            rows=rows
         )
     
     # Sales only see own deals
@@ -216,5 +327,67 @@ def get_deals_for_user(
         stage=stage,
         customer_id=customer_id,
         search=search,
+        cursor=cursor,
+        count_mode=count_mode,
+        options=options,
+        rows=rows,
         owner_id=user.id
     )
+
+
+async def get_deals_for_user_async(db: AsyncSession, user: Principal, **filters):
+    """
+    ``get_deals_for_user`` on an async session, taking the same filters.
+    
+    Args:
+        db: Async database session
+        user: Current user
+        **filters: Pagination, filter and loader arguments of ``get_deals_for_user``
+        
+    Returns:
+        Tuple of (deals, total)
+    """
+    return await db.run_sync(get_deals_for_user, user, **filters)
+
+
+# Columns of deal exports, primary key first
+EXPORT_COLUMNS = (
+    Deal.id,
+    Deal.title,
+    Deal.customer_id,
+    Deal.owner_id,
+    Deal.stage,
+    Deal.value,
+    Deal.probability,
+    Deal.expected_close_date,
+    Deal.created_at,
+    Deal.updated_at
+)
+
+
+def get_deals_export_query(
+    db: Session,
+    user: Principal,
+    stage: str = None,
+    customer_id: int = None,
+    search: str = None
+):
+    """
+    Build the query of deals a user may export.
+    
+    Args:
+        db: Database session
+        user: Current user
+        stage: Filter by stage
+        customer_id: Filter by customer
+        search: Search term
+        
+    Returns:
+        Filtered deal query, limited to own deals for sales users
+    """
+    # Admin and Manager export all deals
+    if user.role in [UserRole.ADMIN, UserRole.MANAGER]:
+        return deal_crud.deals_query(db, stage=stage, customer_id=customer_id, search=search)
+    
+    # Sales only export own deals
+    return deal_crud.deals_query(db, stage=stage, customer_id=customer_id, search=search, owner_id=user.id)
@@ -0,0 +1,336 @@
+"""
+In-process background job runner.
+
+Jobs are rows in ``import_jobs`` executed by a thread pool in each
+application process. Handlers are registered per job kind and report
+progress through a ``JobContext`` in the same transaction as the work it
+describes, so a job interrupted by a restart resumes from its last
+committed chunk.
+
+A sweeper thread in every process heartbeats the jobs it runs, re-queues
+running jobs whose heartbeat went stale (their process died) and picks up
+queued jobs. Claiming a job is an atomic ``queued -> running`` update, so
+with several workers each job runs in one place at a time; a superseded
+run notices on its next progress report and stops.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logging_config import get_logger
+from app.models.import_job import ImportJob, JobStatus
+
+
+logger = get_logger(__name__)
+
+
+class JobAbandoned(Exception):
+    """Raised when another worker has taken over the running job."""
+
+
+class JobContext:
+    """
+    Handle passed to job handlers.
+
+    Attributes:
+        db: Session for the handler's work; progress is written to it too
+        job_id: Job ID
+        session_id: Import session ID
+        payload: Job arguments
+        phase: Phase recorded by the last committed run
+        processed: Units of work committed in that phase
+        checkpoint: Handler state committed with the last chunk
+    """
+
+    def __init__(self, db: Session, job: ImportJob):
+        self.db = db
+        self.job_id = job.id
+        self.session_id = job.session_id
+        self.payload = job.payload or {}
+        self.phase = job.phase
+        self.processed = job.processed
+        self.checkpoint = job.checkpoint or {}
+        self.attempt = job.attempts
+
+    def _write(self, **values: Any) -> None:
+        values["updated_at"] = datetime.utcnow()
+        result = self.db.execute(
+            update(ImportJob)
+            .where(
+                ImportJob.id == self.job_id,
+                ImportJob.attempts == self.attempt,
+                ImportJob.status == JobStatus.RUNNING
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            raise JobAbandoned(f"Job {self.job_id} was taken over by another worker")
+
+    def start_phase(self, phase: str, total: int) -> None:
+        """
+        Record the start of a phase (committed with the caller's next commit).
+
+        Args:
+            phase: Phase name reported to clients
+            total: Units of work in the phase
+        """
+        self._write(
+            phase=phase, total=total, processed=0, resumed_from=0,
+            checkpoint={}, started_at=datetime.utcnow()
+        )
+        self.phase = phase
+        self.processed = 0
+        self.checkpoint = {}
+
+    def progress(self, processed: int, checkpoint: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record progress in the current transaction.
+
+        Call before committing a chunk so the chunk and its progress are
+        committed together.
+
+        Args:
+            processed: Units of work done in the current phase
+            checkpoint: State needed to resume after this point
+
+        Raises:
+            JobAbandoned: If the job was re-queued and claimed elsewhere
+        """
+        values = {"processed": processed}
+        if checkpoint is not None:
+            values["checkpoint"] = checkpoint
+            self.checkpoint = checkpoint
+        self._write(**values)
+        self.processed = processed
+
+
+Handler = Callable[[JobContext], None]
+FailureHandler = Callable[[JobContext, Exception], None]
+
+_handlers: Dict[str, Tuple[Handler, Optional[FailureHandler]]] = {}
+
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_sweeper: Optional[threading.Thread] = None
+_stopping = threading.Event()
+
+# Jobs submitted to this process's pool but not started yet
+_pending: set = set()
+
+# Jobs running in this process: job_id -> attempt
+_running: Dict[int, int] = {}
+
+
+def register_handler(kind: str, handler: Handler, on_failure: Optional[FailureHandler] = None) -> None:
+    """
+    Register the function that runs jobs of a kind.
+
+    Args:
+        kind: Job kind
+        handler: Called with a JobContext; should commit its own work
+        on_failure: Called with the context and error after a failure,
+            in the transaction that marks the job failed
+    """
+    _handlers[kind] = (handler, on_failure)
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.IMPORT_WORKERS,
+                thread_name_prefix="import-job"
+            )
+        return _executor
+
+
+def submit(job_id: int) -> None:
+    """Schedule a queued job on this process's worker pool."""
+    with _lock:
+        if job_id in _pending:
+            return
+        _pending.add(job_id)
+    _pool().submit(_run, job_id)
+
+
+def enqueue(db: Session, kind: str, session_id: int, payload: Optional[Dict[str, Any]] = None) -> ImportJob:
+    """
+    Create a job, commit it with any pending changes and schedule it.
+
+    Args:
+        db: Database session
+        kind: Registered job kind
+        session_id: Import session ID
+        payload: Job arguments
+
+    Returns:
+        Created ImportJob
+    """
+    job = ImportJob(
+        session_id=session_id,
+        kind=kind,
+        status=JobStatus.QUEUED,
+        payload=payload or {}
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    submit(job.id)
+    return job
+
+
+def _claim(db: Session, job_id: int) -> Optional[ImportJob]:
+    now = datetime.utcnow()
+    result = db.execute(
+        update(ImportJob)
+        .where(ImportJob.id == job_id, ImportJob.status == JobStatus.QUEUED)
+        .values(
+            status=JobStatus.RUNNING,
+            attempts=ImportJob.attempts + 1,
+            resumed_from=ImportJob.processed,
+            started_at=now,
+            updated_at=now
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    if result.rowcount == 0:
+        return None
+    return db.get(ImportJob, job_id)
+
+
+def _finish(context: JobContext, status: JobStatus, error: Optional[str] = None) -> None:
+    context._write(status=status, error_message=error, finished_at=datetime.utcnow())
+
+
+def _run(job_id: int) -> None:
+    with _lock:
+        _pending.discard(job_id)
+
+    db = SessionLocal()
+    try:
+        job = _claim(db, job_id)
+        if job is None:
+            return
+
+        context = JobContext(db, job)
+        with _lock:
+            _running[job_id] = context.attempt
+
+        handler, on_failure = _handlers.get(job.kind, (None, None))
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job kind '{job.kind}'")
+            handler(context)
+            _finish(context, JobStatus.COMPLETED)
+            db.commit()
+        except JobAbandoned:
+            db.rollback()
+            logger.warning(f"Import job {job_id} superseded by another worker")
+        except Exception as e:
+            db.rollback()
+            logger.exception(f"Import job {job_id} failed")
+            try:
+                _finish(context, JobStatus.FAILED, str(e))
+                if on_failure:
+                    on_failure(context, e)
+                db.commit()
+            except JobAbandoned:
+                db.rollback()
+    finally:
+        with _lock:
+            _running.pop(job_id, None)
+        db.close()
+
+
+# ========== Recovery ==========
+
+def sweep() -> int:
+    """
+    Heartbeat local jobs, re-queue stale ones and submit queued jobs.
+
+    Returns:
+        Number of queued jobs submitted
+    """
+    now = datetime.utcnow()
+    stale_before = now - timedelta(seconds=settings.IMPORT_JOB_STALE_SECONDS)
+
+    with _lock:
+        running = dict(_running)
+
+    db = SessionLocal()
+    try:
+        for job_id, attempt in running.items():
+            db.execute(
+                update(ImportJob)
+                .where(ImportJob.id == job_id, ImportJob.attempts == attempt)
+                .values(updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+
+        db.execute(
+            update(ImportJob)
+            .where(ImportJob.status == JobStatus.RUNNING, ImportJob.updated_at < stale_before)
+            .values(status=JobStatus.QUEUED, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+        queued = [
+            job_id for (job_id,) in
+            db.query(ImportJob.id)
+            .filter(ImportJob.status == JobStatus.QUEUED)
+            .order_by(ImportJob.id)
+            .all()
+        ]
+    finally:
+        db.close()
+
+    for job_id in queued:
+        submit(job_id)
+    return len(queued)
+
+
+def _sweep_loop() -> None:
+    interval = max(1, settings.IMPORT_JOB_STALE_SECONDS // 5)
+    while not _stopping.wait(interval):
+        try:
+            sweep()
+        except Exception:
+            logger.exception("Import job sweep failed")
+
+
+def start() -> None:
+    """Resume outstanding jobs and start the sweeper thread."""
+    global _sweeper
+    _stopping.clear()
+    sweep()
+
+    with _lock:
+        if _sweeper is None or not _sweeper.is_alive():
+            _sweeper = threading.Thread(target=_sweep_loop, name="import-job-sweeper", daemon=True)
+            _sweeper.start()
+
+
+def shutdown() -> None:
+    """
+    Stop the sweeper and the worker pool.
+    Queued jobs stay in the table; running ones resume after their
+    heartbeat goes stale.
+    """
+    global _executor
+    _stopping.set()
+    with _lock:
+        executor, _executor = _executor, None
+        _pending.clear()
+    if executor:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -4,6 +4,8 @@ Lead Import services package for Smart Lead Import System.
 from app.services.lead_import.analyzer import AnalyzerService
 from app.services.lead_import.normalizer import NormalizerService
 from app.services.lead_import.deduplicator import DeduplicatorService
+from app.services.lead_import.match_index import MatchIndexService
+from app.services.lead_import.import_executor import ImportExecutor
 from app.services.lead_import.session_manager import SessionManager
 from app.services.lead_import.template_manager import TemplateManager
 
@@ -11,6 +13,8 @@ __all__ = [
     "AnalyzerService",
     "NormalizerService", 
     "DeduplicatorService",
+    "MatchIndexService",
+    "ImportExecutor",
     "SessionManager",
     "TemplateManager"
 ]
@@ -2,9 +2,11 @@
 Analyzer service for Phase 1: Upload & Analysis.
 Handles file parsing, column detection, and auto-mapping suggestions.
 """
-import io
+import codecs
+import csv
 import hashlib
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 from fastapi import UploadFile, HTTPException, status
 
@@ -29,7 +31,23 @@ PHONE_PATTERN = r'^[\+]?[\d\s\-\(\)]{7,20}$'
 
 
 class AnalyzerService:
-    """Service for analyzing uploaded files and suggesting mappings."""
+    """
+    Service for analyzing uploaded files and suggesting mappings.
+    
+    Files are streamed in chunks rather than parsed whole: columns and
+    mapping suggestions come from the first SAMPLE_ROWS rows, row and
+    empty-cell counts from a streaming pass.
+    """
+    
+    # Bytes used to sniff a CSV encoding and delimiter
+    SNIFF_BYTES = 64 * 1024
+    CSV_DELIMITERS = ",;\t|"
+    
+    # Rows kept for mapping suggestions and sample rows
+    SAMPLE_ROWS = 1000
+    
+    # Rows per chunk when streaming a file
+    CHUNK_ROWS = 10000
     
     @staticmethod
     def validate_file(file: UploadFile) -> str:
@@ -51,73 +69,270 @@ class AnalyzerService:
                 detail="Unsupported file type. Please upload .csv or .xlsx file."
             )
     
-    @staticmethod
-    def read_file(file_content: bytes, file_type: str) -> pd.DataFrame:
+    @classmethod
+    def detect_encoding(cls, source: BinaryIO) -> str:
         """
-        Read file content into DataFrame.
+        Detect a CSV file's encoding from its first block.
+        
+        Only the first SNIFF_BYTES are checked, so a file that turns out
+        not to be UTF-8 further on is handled by ``iter_chunks``.
         
         Args:
-            file_content: Raw file bytes
-            file_type: 'csv' or 'xlsx'
+            source: Seekable binary file
             
         Returns:
-            Pandas DataFrame
+            'utf-8' if the first block decodes as UTF-8, else 'latin-1'
         """
+        source.seek(0)
+        head = source.read(cls.SNIFF_BYTES)
+        source.seek(0)
+        
+        # Not final: a character cut off at the end of the block is fine
         try:
-            if file_type == 'csv':
-                # Try different encodings
-                for encoding in ['utf-8', 'latin-1', 'cp1252']:
-                    try:
-                        df = pd.read_csv(io.BytesIO(file_content), encoding=encoding)
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                else:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Unable to decode CSV file. Please use UTF-8 encoding."
-                    )
+            codecs.getincrementaldecoder("utf-8")().decode(head)
+        except UnicodeDecodeError:
+            return "latin-1"
+        return "utf-8"
+    
+    @classmethod
+    def sniff_delimiter(cls, source: BinaryIO, encoding: str) -> str:
+        """
+        Sniff a CSV file's delimiter from its first block.
+        
+        Args:
+            source: Seekable binary file
+            encoding: File encoding
+            
+        Returns:
+            Delimiter character (',' if it cannot be determined)
+        """
+        source.seek(0)
+        head = source.read(cls.SNIFF_BYTES).decode(encoding, errors="ignore")
+        source.seek(0)
+        
+        # Leave out the last line, it may be cut off mid-row
+        lines = head.splitlines()
+        if len(lines) > 1:
+            lines = lines[:-1]
+        
+        try:
+            return csv.Sniffer().sniff("\n".join(lines), delimiters=cls.CSV_DELIMITERS).delimiter
+        except csv.Error:
+            return ","
+    
+    @staticmethod
+    def _excel_header(values: Tuple[Any, ...]) -> List[str]:
+        """Column names the way pandas names them (Unnamed: N, name.1 for repeats)."""
+        columns = []
+        seen = {}
+        for position, value in enumerate(values):
+            name = f"Unnamed: {position}" if value is None else str(value)
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
             else:
-                df = pd.read_excel(io.BytesIO(file_content))
+                seen[name] = 0
+            columns.append(name)
+        return columns
+    
+    @staticmethod
+    def _excel_cell(value: Any) -> Any:
+        """Excel cell as text (NaN when empty), integral floats without '.0'."""
+        if value is None:
+            return np.nan
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value)
+    
+    @classmethod
+    def _iter_excel_chunks(cls, source: BinaryIO, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        """Stream the first worksheet of an .xlsx workbook in read-only mode."""
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(source, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = cls._excel_header(header)
+            width = len(columns)
+            
+            batch = []
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+                values = [cls._excel_cell(value) for value in row[:width]]
+                values.extend([np.nan] * (width - len(values)))
+                batch.append(values)
+                if len(batch) >= chunk_rows:
+                    yield pd.DataFrame(batch, columns=columns, dtype=object)
+                    batch = []
+            
+            if batch:
+                yield pd.DataFrame(batch, columns=columns, dtype=object)
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _iter_csv_chunks(
+        source: BinaryIO,
+        encoding: str,
+        delimiter: str,
+        chunk_rows: int
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a CSV file from the start as DataFrames of text cells."""
+        source.seek(0)
+        with pd.read_csv(
+            source,
+            encoding=encoding,
+            sep=delimiter,
+            dtype=str,
+            chunksize=chunk_rows
+        ) as reader:
+            yield from reader
+    
+    @classmethod
+    def iter_chunks(
+        cls,
+        source: BinaryIO,
+        file_type: str,
+        chunk_rows: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a file as DataFrames of at most ``chunk_rows`` rows.
+        
+        Cells are read as text (empty cells as NaN), so every chunk parses
+        the same way whatever values it happens to contain.
+        
+        Args:
+            source: Seekable binary file
+            file_type: 'csv' or 'xlsx'
+            chunk_rows: Rows per chunk (default CHUNK_ROWS)
             
-            return df
+        Yields:
+            DataFrames with the file's column headers
+        """
+        chunk_rows = chunk_rows or cls.CHUNK_ROWS
+        
+        if file_type == 'csv':
+            encoding = cls.detect_encoding(source)
+            delimiter = cls.sniff_delimiter(source, encoding)
+            done = 0
+            try:
+                for chunk in cls._iter_csv_chunks(source, encoding, delimiter, chunk_rows):
+                    yield chunk
+                    done += len(chunk)
+            except UnicodeDecodeError:
+                # Not UTF-8 past the sniffed block: read the rest as latin-1
+                # (which decodes anything), skipping the rows already yielded
+                for chunk in cls._iter_csv_chunks(source, "latin-1", delimiter, chunk_rows):
+                    if done >= len(chunk):
+                        done -= len(chunk)
+                        continue
+                    yield chunk.iloc[done:]
+                    done = 0
+            return
+        
+        # .xlsx files are zip archives and can be streamed; legacy .xls cannot
+        source.seek(0)
+        is_zip = source.read(2) == b"PK"
+        source.seek(0)
+        
+        if is_zip:
+            yield from cls._iter_excel_chunks(source, chunk_rows)
+        else:
+            df = pd.read_excel(source, dtype=str)
+            for start in range(0, len(df), chunk_rows):
+                yield df.iloc[start:start + chunk_rows]
+    
+    @classmethod
+    def scan(cls, source: BinaryIO, file_type: str) -> Tuple[pd.DataFrame, int, pd.Series]:
+        """
+        Read a file in one streaming pass.
+        
+        Args:
+            source: Seekable binary file
+            file_type: 'csv' or 'xlsx'
+            
+        Returns:
+            Tuple of (first SAMPLE_ROWS rows, total row count,
+            non-empty cell count per column)
+        """
+        sample = []
+        sampled = 0
+        total_rows = 0
+        non_empty = None
+        
+        try:
+            for chunk in cls.iter_chunks(source, file_type):
+                counts = chunk.notna().sum()
+                non_empty = counts if non_empty is None else non_empty + counts
+                
+                if sampled < cls.SAMPLE_ROWS:
+                    sample.append(chunk.head(cls.SAMPLE_ROWS - sampled))
+                    sampled += len(sample[-1])
+                
+                total_rows += len(chunk)
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to read file: {str(e)}"
             )
+        finally:
+            source.seek(0)
+        
+        if not sample:
+            return pd.DataFrame(), 0, pd.Series(dtype=int)
+        
+        return pd.concat(sample), total_rows, non_empty
     
     @staticmethod
-    def clean_columns(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+    def clean_columns(
+        df: pd.DataFrame,
+        total_rows: Optional[int] = None,
+        non_empty: Optional[pd.Series] = None
+    ) -> Tuple[pd.DataFrame, List[str]]:
         """
         Clean and normalize column names, remove empty columns.
         
+        Args:
+            df: Data (or a sample of it)
+            total_rows: Row count of the whole file (default len(df))
+            non_empty: Non-empty cells per column in the whole file
+                (default counted from df)
+        
         Returns:
             Tuple of (cleaned DataFrame, list of removed columns)
         """
-        removed = []
+        if non_empty is None:
+            non_empty = df.notna().sum()
+            total_rows = len(df)
         
         # Normalize column names
         df.columns = df.columns.astype(str).str.strip().str.lower()
         
-        # Remove unnamed columns
-        unnamed_cols = [col for col in df.columns if col.startswith('unnamed')]
-        if unnamed_cols:
-            df = df.drop(columns=unnamed_cols)
-            removed.extend(unnamed_cols)
-        
-        # Remove completely empty columns
-        empty_cols = df.columns[df.isna().all()].tolist()
-        if empty_cols:
-            df = df.drop(columns=empty_cols)
-            removed.extend(empty_cols)
-        
-        # Remove columns with > 90% empty values
-        threshold = len(df) * 0.1
-        sparse_cols = [col for col in df.columns if df[col].notna().sum() < threshold]
-        if sparse_cols:
-            df = df.drop(columns=sparse_cols)
-            removed.extend(sparse_cols)
+        unnamed_cols = []
+        empty_cols = []
+        sparse_cols = []
+        threshold = total_rows * 0.1
+        
+        for col, count in zip(df.columns, non_empty.tolist()):
+            if col.startswith('unnamed'):
+                # Remove unnamed columns
+                unnamed_cols.append(col)
+            elif count == 0:
+                # Remove completely empty columns
+                empty_cols.append(col)
+            elif count < threshold:
+                # Remove columns with > 90% empty values
+                sparse_cols.append(col)
+        
+        removed = unnamed_cols + empty_cols + sparse_cols
+        if removed:
+            df = df.drop(columns=removed)
         
         return df, removed
     
@@ -207,21 +422,18 @@ class AnalyzerService:
         Returns:
             Analysis results with columns, mappings, and samples
         """
-        # Validate and read file
+        # Validate file and read it in one streaming pass
         file_type = self.validate_file(file)
-        file_content = file.file.read()
-        file.file.seek(0)  # Reset for potential reuse
-        
-        df = self.read_file(file_content, file_type)
+        df, total_rows, non_empty = self.scan(file.file, file_type)
         
-        if df.empty:
+        if total_rows == 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File is empty or contains no data rows."
             )
         
-        # Clean columns
-        df, removed_columns = self.clean_columns(df)
+        # Clean columns (emptiness judged on the whole file)
+        df, removed_columns = self.clean_columns(df, total_rows, non_empty)
         
         if len(df.columns) == 0:
             raise HTTPException(
@@ -237,8 +449,7 @@ class AnalyzerService:
         
         return {
             "file_name": file.filename,
-            "file_content": file_content,
-            "total_rows": len(df),
+            "total_rows": total_rows,
             "detected_columns": columns,
             "removed_columns": removed_columns,
             "suggested_mappings": suggestions,
@@ -7,6 +7,7 @@ from difflib import SequenceMatcher
 from sqlalchemy.orm import Session
 
 from app.models.lead import Lead
+from app.services.lead_import.match_index import MatchIndexService
 
 
 class DeduplicatorService:
@@ -182,9 +183,11 @@ class DeduplicatorService:
     ) -> List[Dict[str, Any]]:
         """
         Find potential matches using fuzzy logic.
-        Same company + similar name (>85% match).
+        Similar name (>85% match) among leads sharing a blocking key.
         
-        Only checks rows not already caught by exact matches.
+        Only checks rows not already caught by exact matches. Candidates
+        come from the match index across all leads, and the best-scoring
+        candidate is reported for each row.
         
         Returns:
             List of smart matches with similarity score
@@ -203,42 +206,68 @@ class DeduplicatorService:
         if not rows_with_company:
             return []
         
-        # Get companies from import data
-        companies = list(set(row.get("company", "").lower() for row in rows_with_company if row.get("company")))
+        MatchIndexService.ensure_built(db)
+        candidates = MatchIndexService.find_candidates(
+            db,
+            {idx: row.get("full_name") for idx, row in enumerate(rows_with_company)}
+        )
         
-        # Query leads from those companies
-        # Note: This assumes Lead model has a company field or we match via Customer
-        # For now, we'll do name-only fuzzy matching
-        all_leads = db.query(Lead).limit(1000).all()  # Limit for performance
-        
-        for row in rows_with_company:
-            row_num = row.get("_row_num", 0)
-            name = row.get("full_name", "")
+        # Score candidates within blocks; cheap upper bounds first
+        best_matches: Dict[int, Tuple[float, int]] = {}
+        matcher = SequenceMatcher(None)
+        for idx, leads in candidates.items():
+            name = (rows_with_company[idx].get("full_name") or "").lower().strip()
+            if not name:
+                continue
+            matcher.set_seq2(name)
+            
+            best = None
+            for lead_id, lead_name in sorted(leads.items()):
+                matcher.set_seq1((lead_name or "").lower().strip())
+                if (
+                    matcher.real_quick_ratio() < cls.NAME_SIMILARITY_THRESHOLD
+                    or matcher.quick_ratio() < cls.NAME_SIMILARITY_THRESHOLD
+                ):
+                    continue
+                similarity = matcher.ratio()
+                if similarity >= cls.NAME_SIMILARITY_THRESHOLD and (best is None or similarity > best[0]):
+                    best = (similarity, lead_id)
             
-            for lead in all_leads:
-                similarity = cls.name_similarity(name, lead.full_name)
-                
-                if similarity >= cls.NAME_SIMILARITY_THRESHOLD:
-                    smart_matches.append({
-                        "import_row": row_num,
-                        "import_data": {
-                            "full_name": row.get("full_name"),
-                            "email": row.get("email"),
-                            "phone": row.get("phone")
-                        },
-                        "existing_lead_id": lead.id,
-                        "existing_lead": {
-                            "id": lead.id,
-                            "full_name": lead.full_name,
-                            "email": lead.email,
-                            "phone": lead.phone,
-                            "status": lead.status.value
-                        },
-                        "match_type": "smart",
-                        "similarity": round(similarity * 100, 1),
-                        "reason": f"Similar name ({round(similarity * 100)}% match)"
-                    })
-                    break  # Only first match per row
+            if best:
+                best_matches[idx] = best
+        
+        if not best_matches:
+            return []
+        
+        lead_ids = list({lead_id for _, lead_id in best_matches.values()})
+        leads_by_id = {}
+        for start in range(0, len(lead_ids), MatchIndexService.QUERY_CHUNK_SIZE):
+            chunk = lead_ids[start:start + MatchIndexService.QUERY_CHUNK_SIZE]
+            for lead in db.query(Lead).filter(Lead.id.in_(chunk)).all():
+                leads_by_id[lead.id] = lead
+        
+        for idx, (similarity, lead_id) in sorted(best_matches.items()):
+            row = rows_with_company[idx]
+            lead = leads_by_id[lead_id]
+            smart_matches.append({
+                "import_row": row.get("_row_num", 0),
+                "import_data": {
+                    "full_name": row.get("full_name"),
+                    "email": row.get("email"),
+                    "phone": row.get("phone")
+                },
+                "existing_lead_id": lead.id,
+                "existing_lead": {
+                    "id": lead.id,
+                    "full_name": lead.full_name,
+                    "email": lead.email,
+                    "phone": lead.phone,
+                    "status": lead.status.value
+                },
+                "match_type": "smart",
+                "similarity": round(similarity * 100, 1),
+                "reason": f"Similar name ({round(similarity * 100)}% match)"
+            })
         
         return smart_matches
     
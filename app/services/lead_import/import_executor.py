@@ -0,0 +1,346 @@
+"""
+Import executor for Phase 5: Execute Import.
+Applies duplicate decisions and writes leads in batched transactions.
+"""
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.import_session import ImportSession
+from app.models.lead import Lead, LeadSource, LeadStatus
+from app.models.user import User
+from app.schemas.lead import LeadCreate
+from app.services import analytics_cache, rollup_service, search_service
+from app.services.lead_import.match_index import MatchIndexService
+from app.services.lead_import.session_manager import SessionManager
+
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+def append_ranges(ranges: List[List[int]], ids: List[int]) -> List[List[int]]:
+    """Add IDs to a list of [first, last] ranges, merging consecutive IDs."""
+    ranges = [list(pair) for pair in ranges]
+    for value in ids:
+        if ranges and ranges[-1][1] + 1 == value:
+            ranges[-1][1] = value
+        else:
+            ranges.append([value, value])
+    return ranges
+
+
+def expand_ranges(ranges: List[List[int]]) -> List[int]:
+    """Expand [first, last] ranges back into a list of IDs."""
+    return [value for first, last in ranges for value in range(first, last + 1)]
+
+
+class ImportExecutor:
+    """
+    Writes normalized import rows as leads in chunks.
+
+    Rows are validated up front, then each chunk is inserted (or updated)
+    with a single executemany inside its own transaction. If a chunk
+    fails, its rows are retried one by one so errors are reported per row.
+    The write state can be persisted with every chunk commit, so an
+    interrupted import resumes after the last committed chunk.
+
+    Bulk statements bypass the ORM unit of work, so the analytics rollup,
+    fuzzy-match index and analytics cache are updated explicitly.
+    """
+
+    UPDATE_FIELDS = ("full_name", "email", "phone")
+
+    def __init__(self, db: Session, user: User, batch_size: int = None):
+        self.db = db
+        self.user = user
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+
+    @staticmethod
+    def plan(session: ImportSession, decisions: Dict[str, str]) -> Tuple[Set[int], Dict[int, int]]:
+        """
+        Turn duplicate detection results and user decisions into actions.
+
+        Returns:
+            Tuple of (rows_to_skip, row_num -> existing_lead_id to update)
+        """
+        skip_rows = set()
+        update_rows = {}
+
+        # Process in-file duplicates (keep first, skip rest)
+        for dup in (session.in_file_duplicates or []):
+            rows = dup.get("rows", [])
+            if len(rows) > 1:
+                skip_rows.update(rows[1:])  # Skip all but first
+
+        # Process existing duplicates and smart matches based on decisions
+        for match in (session.existing_duplicates or []) + (session.smart_matches or []):
+            row_num = str(match.get("import_row", 0))
+            action = decisions.get(row_num, "skip")
+
+            if action == "skip":
+                skip_rows.add(match["import_row"])
+            elif action == "update":
+                update_rows[match["import_row"]] = match["existing_lead_id"]
+
+        return skip_rows, update_rows
+
+    @staticmethod
+    def _parse_source(value: Any) -> LeadSource:
+        """Source from normalized data (an enum, or its value after JSON storage)."""
+        try:
+            return LeadSource(value)
+        except ValueError:
+            return LeadSource.OTHER
+
+    def prepare(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        skip_rows: Set[int],
+        update_rows: Dict[int, int]
+    ) -> Tuple[List[Tuple[int, Dict]], List[Tuple[int, Dict]], List[Dict[str, Any]]]:
+        """
+        Validate rows and build column mappings.
+
+        Returns:
+            Tuple of (inserts, updates, errors) where inserts/updates are
+            (row_num, mapping) pairs and errors are {"row", "error"} dicts
+        """
+        inserts = []
+        updates = []
+        errors = []
+        now = datetime.utcnow()
+
+        for row in rows:
+            row_num = row.get("_row_num", 0)
+
+            if row_num in skip_rows:
+                continue
+
+            if row_num in update_rows:
+                mapping = {"id": update_rows[row_num], "updated_at": now}
+                for field in self.UPDATE_FIELDS:
+                    if field in row:
+                        mapping[field] = row[field]
+                updates.append((row_num, mapping))
+                continue
+
+            try:
+                lead = LeadCreate(
+                    full_name=row.get("full_name"),
+                    email=row.get("email"),
+                    phone=row.get("phone"),
+                    source=self._parse_source(row.get("source")),
+                    status=LeadStatus.NEW
+                )
+            except ValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(part) for part in error["loc"])
+                errors.append({"row": row_num, "error": f"{field}: {error['msg']}"})
+                continue
+
+            inserts.append((row_num, {
+                "full_name": lead.full_name,
+                "email": lead.email,
+                "phone": lead.phone,
+                "source": lead.source,
+                "status": lead.status,
+                "assigned_to_id": lead.assigned_to_id,
+                "created_by_id": self.user.id,
+                "created_at": now,
+                "updated_at": now
+            }))
+
+        return inserts, updates, errors
+
+    def _insert_rows(self, mappings: List[Dict[str, Any]]) -> List[int]:
+        """Insert rows with one statement, returning IDs in parameter order."""
+        dialect = self.db.get_bind().dialect
+
+        if dialect.insert_executemany_returning_sort_by_parameter_order:
+            result = self.db.execute(
+                insert(Lead).returning(Lead.id, sort_by_parameter_order=True),
+                mappings
+            )
+            ids = list(result.scalars())
+        else:
+            mappings = [dict(mapping) for mapping in mappings]
+            self.db.bulk_insert_mappings(Lead, mappings, return_defaults=True)
+            ids = [mapping["id"] for mapping in mappings]
+
+        connection = self.db.connection()
+        rollup_service.record_inserted(connection, Lead, mappings)
+        MatchIndexService.index_leads(
+            connection,
+            [(lead_id, mapping["full_name"]) for lead_id, mapping in zip(ids, mappings)]
+        )
+        search_service.index_records(connection, Lead, ids)
+        return ids
+
+    def _update_rows(self, mappings: List[Dict[str, Any]]) -> List[int]:
+        """Update existing leads, ignoring ones that no longer exist."""
+        ids = {mapping["id"] for mapping in mappings}
+        existing = {
+            lead_id for (lead_id,) in
+            self.db.query(Lead.id).filter(Lead.id.in_(ids)).all()
+        }
+        mappings = [mapping for mapping in mappings if mapping["id"] in existing]
+        if not mappings:
+            return []
+
+        self.db.bulk_update_mappings(Lead, mappings)
+
+        renamed = [
+            (mapping["id"], mapping["full_name"])
+            for mapping in mappings
+            if "full_name" in mapping
+        ]
+        connection = self.db.connection()
+        MatchIndexService.index_leads(connection, renamed)
+        updated = [mapping["id"] for mapping in mappings]
+        search_service.index_records(connection, Lead, updated)
+        return updated
+
+    def _commit(self, state: Dict[str, Any], on_progress: Optional[ProgressCallback]) -> Dict[str, Any]:
+        """Commit the current transaction together with the progress it makes."""
+        if on_progress:
+            on_progress(state)
+        self.db.commit()
+        return state
+
+    @staticmethod
+    def _advance(
+        state: Dict[str, Any],
+        key: str,
+        ids: List[int],
+        errors: List[Dict[str, Any]],
+        count: int
+    ) -> Dict[str, Any]:
+        return {
+            **state,
+            "done": state["done"] + count,
+            key: append_ranges(state[key], ids),
+            "row_errors": state["row_errors"] + errors
+        }
+
+    def _run_chunk(
+        self,
+        chunk: List[Tuple[int, Dict]],
+        write,
+        key: str,
+        state: Dict[str, Any],
+        on_progress: Optional[ProgressCallback]
+    ) -> Dict[str, Any]:
+        """
+        Write a chunk in one transaction, isolating failing rows on error.
+
+        Returns:
+            Write state after the chunk
+        """
+        try:
+            ids = write([mapping for _, mapping in chunk])
+            return self._commit(self._advance(state, key, ids, [], len(chunk)), on_progress)
+        except SQLAlchemyError:
+            self.db.rollback()
+
+        for row_num, mapping in chunk:
+            try:
+                ids = write([mapping])
+                errors = []
+            except SQLAlchemyError as e:
+                self.db.rollback()
+                ids = []
+                errors = [{"row": row_num, "error": str(e.orig if hasattr(e, "orig") else e)}]
+            state = self._commit(self._advance(state, key, ids, errors, 1), on_progress)
+
+        return state
+
+    def write(
+        self,
+        inserts: List[Tuple[int, Dict]],
+        updates: List[Tuple[int, Dict]],
+        state: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Write prepared rows in chunks, one transaction per chunk.
+
+        Args:
+            inserts: (row_num, mapping) pairs from prepare()
+            updates: (row_num, mapping) pairs from prepare()
+            state: State committed by an interrupted run; rows it covers
+                are not written again
+            on_progress: Called with the new state inside each chunk's
+                transaction, before it commits
+
+        Returns:
+            Write state: {"done", "inserted_ids", "updated_ids", "row_errors"}
+            with IDs stored as [first, last] ranges (see expand_ranges)
+        """
+        state = state or {"done": 0, "inserted_ids": [], "updated_ids": [], "row_errors": []}
+
+        offset = 0
+        for key, rows, write in (
+            ("inserted_ids", inserts, self._insert_rows),
+            ("updated_ids", updates, self._update_rows)
+        ):
+            begin = min(len(rows), max(0, state["done"] - offset))
+            for start in range(begin, len(rows), self.batch_size):
+                chunk = rows[start:start + self.batch_size]
+                state = self._run_chunk(chunk, write, key, state, on_progress)
+            offset += len(rows)
+
+        if state["inserted_ids"] or state["updated_ids"]:
+            analytics_cache.invalidate_entity("lead")
+
+        return state
+
+    @staticmethod
+    def summarize(
+        session: ImportSession,
+        skip_rows: Set[int],
+        errors: List[Dict[str, Any]],
+        state: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build the import result from validation errors and write state.
+
+        Returns:
+            Result dict with counts, inserted/updated IDs and row errors
+        """
+        inserted_ids = expand_ranges(state["inserted_ids"])
+        updated_ids = expand_ranges(state["updated_ids"])
+        row_errors = sorted(errors + state["row_errors"], key=lambda error: error["row"])
+
+        return {
+            "total_rows": session.total_rows,
+            "inserted": len(inserted_ids),
+            "updated": len(updated_ids),
+            "skipped": len(skip_rows),
+            "errors": len(row_errors),
+            "inserted_ids": inserted_ids,
+            "updated_ids": updated_ids,
+            "row_errors": row_errors
+        }
+
+    def execute(self, session: ImportSession, decisions: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Import the session's normalized rows.
+
+        Args:
+            session: Import session in READY status
+            decisions: Row number -> duplicate action
+
+        Returns:
+            Result dict with counts, inserted/updated IDs and row errors
+        """
+        skip_rows, update_rows = self.plan(session, decisions)
+        inserts, updates, errors = self.prepare(
+            SessionManager(self.db).iter_normalized_rows(session), skip_rows, update_rows
+        )
+        state = self.write(inserts, updates)
+        return self.summarize(session, skip_rows, errors, state)
@@ -0,0 +1,221 @@
+"""
+Background jobs for the lead import workflow.
+
+- ``import_prepare``: Phases 3-4, normalize the file and detect duplicates
+- ``import_execute``: Phase 5, write leads in chunks
+
+Both resume after a restart from the last committed chunk. Preparation
+spools the normalized rows of each chunk and checkpoints the rows done
+with the chunk digests; a resumed run skips those rows of the file and
+joins the spooled chunks into the session's output at the end. Execution
+continues after the last chunk of leads it wrote. Clients follow progress
+through the session status endpoint.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+
+from app.models.import_job import ImportJob, JobStatus
+from app.models.import_session import ImportSession, ImportStatus
+from app.models.user import User
+from app.services import job_runner
+from app.services.job_runner import JobContext
+from app.services.lead_import.analyzer import AnalyzerService
+from app.services.lead_import.normalizer import NormalizerService
+from app.services.lead_import.deduplicator import DeduplicatorService
+from app.services.lead_import.import_executor import ImportExecutor
+from app.services.lead_import.session_manager import SessionManager, spool
+
+
+PREPARE_JOB = "import_prepare"
+EXECUTE_JOB = "import_execute"
+
+
+def file_type(session: ImportSession) -> str:
+    """'csv' or 'xlsx' from the session's file name."""
+    return 'csv' if session.file_name.lower().endswith('.csv') else 'xlsx'
+
+
+def _get_session(context: JobContext) -> ImportSession:
+    session = context.db.get(ImportSession, context.session_id)
+    if session is None:
+        raise ValueError(f"Import session {context.session_id} no longer exists")
+    return session
+
+
+def _put_chunk(context: JobContext, start_row: int, valid: List[Dict], invalid: List[Dict]) -> str:
+    """
+    Spool the normalized rows of one chunk, returning the blob digest.
+
+    The header record makes the blob specific to this job, so the same
+    file prepared by another session never shares (or deletes) it.
+    """
+    header = {"job_id": context.job_id, "start_row": start_row}
+    records = [header]
+    records.extend({"valid": row} for row in valid)
+    records.extend({"invalid": row} for row in invalid)
+    digest, _ = spool.put_lines(records)
+    return digest
+
+
+def _read_chunks(digests: List[str], kind: str) -> Iterator[Dict]:
+    """Rows of one kind ("valid" or "invalid") from spooled chunks, in order."""
+    for digest in digests:
+        for record in spool.read_lines(digest):
+            if kind in record:
+                yield record[kind]
+
+
+def run_prepare(context: JobContext) -> None:
+    """Normalize the mapped file, then detect duplicates (NORMALIZING -> READY)."""
+    db = context.db
+    session = _get_session(context)
+    session_mgr = SessionManager(db)
+
+    if session.status == ImportStatus.NORMALIZING:
+        mappings = session.user_mappings or {}
+        merge_rules = session.merge_rules or []
+        kind = file_type(session)
+        normalizer = NormalizerService()
+
+        if context.phase == "normalizing" and context.checkpoint:
+            # Resume after the last committed chunk
+            processed = context.checkpoint["rows"]
+            chunks = list(context.checkpoint["chunks"])
+        else:
+            processed = 0
+            chunks = []
+            context.start_phase("normalizing", session.total_rows or 0)
+            db.commit()
+
+        with session_mgr.open_file(session) as source:
+            skip = processed
+            for chunk in AnalyzerService.iter_chunks(source, kind):
+                if skip >= len(chunk):
+                    skip -= len(chunk)
+                    continue
+                chunk = chunk.iloc[skip:]
+                skip = 0
+
+                chunk.columns = chunk.columns.astype(str).str.strip().str.lower()
+                valid, invalid = normalizer.normalize_dataframe(
+                    df=chunk,
+                    mappings=mappings,
+                    merge_rules=merge_rules,
+                    start_row=processed + 2
+                )
+                chunks.append(_put_chunk(context, processed + 2, valid, invalid))
+                processed += len(chunk)
+
+                # The chunk is kept only once its checkpoint is committed
+                context.progress(processed, {"rows": processed, "chunks": chunks})
+                db.commit()
+
+        session_mgr.update_normalized_data(
+            session=session,
+            valid_rows=_read_chunks(chunks, "valid"),
+            invalid_rows=_read_chunks(chunks, "invalid")
+        )
+
+    if session.status == ImportStatus.DEDUPLICATING:
+        if context.phase == "normalizing":
+            # Chunks joined into the session's output (also after a restart
+            # between that commit and this cleanup)
+            for digest in context.checkpoint.get("chunks", []):
+                spool.delete(digest)
+
+        rows = session_mgr.get_normalized_rows(session)
+        context.start_phase("deduplicating", len(rows))
+        db.commit()
+
+        duplicate_result = DeduplicatorService().detect_all_duplicates(db, rows)
+
+        context.progress(len(rows))
+        session_mgr.update_duplicates(session, duplicate_result)
+
+
+def run_execute(context: JobContext) -> None:
+    """Write the session's rows in chunks, then complete it (IMPORTING -> COMPLETED)."""
+    db = context.db
+    session = _get_session(context)
+
+    if session.status != ImportStatus.IMPORTING:
+        return
+
+    session_mgr = SessionManager(db)
+    executor = ImportExecutor(db, db.get(User, session.user_id))
+    skip_rows, update_rows = executor.plan(session, session.duplicate_decisions or {})
+    inserts, updates, errors = executor.prepare(
+        session_mgr.iter_normalized_rows(session), skip_rows, update_rows
+    )
+
+    if context.phase != "importing":
+        context.start_phase("importing", len(inserts) + len(updates))
+        db.commit()
+
+    state = executor.write(
+        inserts,
+        updates,
+        state=context.checkpoint or None,
+        on_progress=lambda state: context.progress(state["done"], state)
+    )
+    outcome = executor.summarize(session, skip_rows, errors, state)
+
+    session_mgr.complete_session(
+        session=session,
+        result={
+            "total_rows": outcome["total_rows"],
+            "inserted": outcome["inserted"],
+            "updated": outcome["updated"],
+            "skipped": outcome["skipped"],
+            "errors": outcome["errors"],
+            "row_errors": outcome["row_errors"]
+        },
+        inserted_ids=outcome["inserted_ids"],
+        updated_ids=outcome["updated_ids"]
+    )
+
+
+def fail_session(context: JobContext, error: Exception) -> None:
+    """Mark the job's session as failed (committed by the job runner)."""
+    session = context.db.get(ImportSession, context.session_id)
+    if session is not None:
+        session.status = ImportStatus.FAILED
+        session.error_message = str(error)
+
+
+def job_progress(job: ImportJob) -> Dict[str, Any]:
+    """
+    Progress report for a job, with throughput and ETA of the current run.
+
+    Args:
+        job: Import job
+
+    Returns:
+        Dict matching the ImportProgress schema
+    """
+    rate = None
+    eta = None
+
+    if job.status == JobStatus.RUNNING and job.started_at:
+        elapsed = (datetime.utcnow() - job.started_at).total_seconds()
+        done = job.processed - job.resumed_from
+        if elapsed > 0 and done > 0:
+            rate = round(done / elapsed, 2)
+            eta = round(max(job.total - job.processed, 0) / rate, 1)
+
+    return {
+        "job_id": job.id,
+        "job_status": job.status.value,
+        "phase": job.phase,
+        "processed": job.processed,
+        "total": job.total,
+        "rate_per_second": rate,
+        "eta_seconds": eta,
+        "error_message": job.error_message
+    }
+
+
+def register_handlers() -> None:
+    """Register the import job handlers with the job runner."""
+    job_runner.register_handler(PREPARE_JOB, run_prepare, on_failure=fail_session)
+    job_runner.register_handler(EXECUTE_JOB, run_execute, on_failure=fail_session)
@@ -0,0 +1,325 @@
+"""
+Fuzzy-match index for smart duplicate detection.
+
+Each lead name is reduced to a few blocking keys stored in
+``lead_match_keys``:
+
+- ``nm:``  normalized name (lowercase tokens)
+- ``ph:``  phonetic code (Soundex of every name token)
+- ``in:``  leading letters of the first and last token plus a length bucket
+- ``mh0:`` .. ``mh2:`` MinHash bands over the name's character trigrams
+
+Import rows look up leads sharing any of their keys and are only scored
+against those candidates. A key shared by very many leads (a common name)
+contributes only its first ``MAX_BLOCK_SIZE`` leads, which bounds the work
+per row; the normalized name key still finds a lead with the same name.
+The index is kept current by ORM flush listeners and can be rebuilt with:
+
+    python -m app.services.lead_import.match_index rebuild
+"""
+import argparse
+import re
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+
+from app.models.lead import Lead
+from app.models.lead_match_key import LeadMatchKey
+
+
+# Soundex digit for each consonant
+_SOUNDEX_CODES = {
+    letter: digit
+    for digit, letters in (
+        ("1", "bfpv"), ("2", "cgjkqsxz"), ("3", "dt"),
+        ("4", "l"), ("5", "mn"), ("6", "r")
+    )
+    for letter in letters
+}
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Fixed (multiplier, offset) hash permutations: one list per MinHash band
+_MINHASH_PERMUTATIONS = (
+    ((2654435761, 97), (2246822519, 7919)),
+    ((3266489917, 104729), (668265263, 1299709)),
+    ((374761393, 15485863), (2869860233, 32452843)),
+)
+
+
+class MatchIndexService:
+    """Builds, maintains and queries the lead name blocking index."""
+
+    # Name length bucket width for initials keys
+    LENGTH_BUCKET = 3
+
+    # MinHash bands per name and trigram picks per band
+    MINHASH_BANDS = 3
+    MINHASH_BAND_SIZE = 2
+
+    # Leads fetched per key; larger blocks are cut to their lowest lead IDs
+    MAX_BLOCK_SIZE = 1000
+
+    # Max values per IN (...) clause
+    QUERY_CHUNK_SIZE = 500
+
+    @staticmethod
+    def tokens(name: Optional[str]) -> List[str]:
+        """Split a name into lowercase word tokens."""
+        if not name:
+            return []
+        return _TOKEN_PATTERN.findall(name.lower())
+
+    @staticmethod
+    def soundex(token: str) -> str:
+        """
+        American Soundex code of a token.
+        Tokens without ASCII letters are returned as-is (truncated).
+        """
+        letters = [c for c in token if "a" <= c <= "z"]
+        if not letters:
+            return token[:4]
+
+        code = letters[0].upper()
+        previous = _SOUNDEX_CODES.get(letters[0])
+        for letter in letters[1:]:
+            digit = _SOUNDEX_CODES.get(letter)
+            if digit and digit != previous:
+                code += digit
+                if len(code) == 4:
+                    break
+            if letter not in "hw":
+                previous = digit
+
+        return code.ljust(4, "0")
+
+    @staticmethod
+    def trigrams(tokens: List[str]) -> Set[str]:
+        """Character trigrams of the padded, space-joined tokens."""
+        text = f" {' '.join(tokens)} "
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    @classmethod
+    def _keys(cls, name: Optional[str], bucket_offsets: Tuple[int, ...]) -> List[str]:
+        tokens = cls.tokens(name)
+        if not tokens:
+            return []
+
+        keys = [
+            "nm:" + " ".join(tokens),
+            "ph:" + "".join(cls.soundex(token) for token in tokens)
+        ]
+
+        initials = tokens[0][:2] + tokens[-1][0]
+        bucket = len("".join(tokens)) // cls.LENGTH_BUCKET
+        keys.extend(f"in:{initials}{bucket + offset}" for offset in bucket_offsets)
+
+        hashed = [(zlib.crc32(gram.encode()), gram) for gram in cls.trigrams(tokens)]
+        for band in range(cls.MINHASH_BANDS):
+            picks = []
+            for multiplier, offset in _MINHASH_PERMUTATIONS[band]:
+                _, pick = min(
+                    ((value * multiplier + offset) & 0xFFFFFFFF, gram)
+                    for value, gram in hashed
+                )
+                picks.append(pick)
+            keys.append(f"mh{band}:" + "|".join(picks))
+
+        return [key[:64] for key in keys]
+
+    @classmethod
+    def index_keys(cls, name: Optional[str]) -> List[str]:
+        """Keys stored for a lead name."""
+        return cls._keys(name, (0,))
+
+    @classmethod
+    def probe_keys(cls, name: Optional[str]) -> List[str]:
+        """Keys looked up for an import row (neighbouring length buckets too)."""
+        return cls._keys(name, (-1, 0, 1))
+
+    # ========== Maintenance ==========
+
+    @classmethod
+    def index_leads(cls, connection, leads: Iterable[Tuple[int, Optional[str]]]) -> int:
+        """
+        Replace the keys of the given leads.
+
+        Args:
+            connection: Connection participating in the current transaction
+            leads: (lead_id, full_name) pairs; a None name only removes keys
+
+        Returns:
+            Number of keys written
+        """
+        leads = list(leads)
+        if not leads:
+            return 0
+
+        table = LeadMatchKey.__table__
+        lead_ids = [lead_id for lead_id, _ in leads]
+        for start in range(0, len(lead_ids), cls.QUERY_CHUNK_SIZE):
+            connection.execute(
+                table.delete().where(table.c.lead_id.in_(lead_ids[start:start + cls.QUERY_CHUNK_SIZE]))
+            )
+
+        now = datetime.utcnow()
+        rows = [
+            {"lead_id": lead_id, "key": key, "created_at": now, "updated_at": now}
+            for lead_id, name in leads
+            for key in cls.index_keys(name)
+        ]
+        if rows:
+            connection.execute(table.insert(), rows)
+
+        return len(rows)
+
+    @classmethod
+    def rebuild(cls, db: Session, batch_size: int = 5000, commit: bool = True) -> int:
+        """
+        Rebuild the whole index from the leads table.
+
+        Args:
+            db: Database session
+            batch_size: Leads processed per batch
+            commit: Commit the session when done; otherwise the keys are
+                written in the session's transaction and committed with it
+
+        Returns:
+            Number of keys written
+        """
+        connection = db.connection()
+        connection.execute(LeadMatchKey.__table__.delete())
+
+        written = 0
+        batch = []
+        for lead_id, full_name in db.query(Lead.id, Lead.full_name).yield_per(batch_size):
+            batch.append((lead_id, full_name))
+            if len(batch) >= batch_size:
+                written += cls.index_leads(connection, batch)
+                batch = []
+        written += cls.index_leads(connection, batch)
+
+        if commit:
+            db.commit()
+        return written
+
+    @classmethod
+    def ensure_built(cls, db: Session) -> None:
+        """
+        Build the index on first use if leads exist but no keys do.
+        The keys are committed with the caller's transaction.
+        """
+        if db.query(LeadMatchKey.id).first() is None and db.query(Lead.id).first() is not None:
+            cls.rebuild(db, commit=False)
+
+    # ========== Lookup ==========
+
+    @classmethod
+    def find_candidates(
+        cls,
+        db: Session,
+        names: Dict[int, str]
+    ) -> Dict[int, Dict[int, str]]:
+        """
+        Find leads sharing a blocking key with each name.
+
+        Args:
+            db: Database session
+            names: Row key -> name to match
+
+        Returns:
+            Row key -> {lead_id: lead_full_name}
+        """
+        rows_by_key: Dict[str, List[int]] = defaultdict(list)
+        for row_key, name in names.items():
+            for key in cls.probe_keys(name):
+                rows_by_key[key].append(row_key)
+
+        keys = list(rows_by_key)
+        small, large = [], []
+        for start in range(0, len(keys), cls.QUERY_CHUNK_SIZE):
+            chunk = keys[start:start + cls.QUERY_CHUNK_SIZE]
+            for key, size in (
+                db.query(LeadMatchKey.key, func.count(LeadMatchKey.id))
+                .filter(LeadMatchKey.key.in_(chunk))
+                .group_by(LeadMatchKey.key)
+                .all()
+            ):
+                (small if size <= cls.MAX_BLOCK_SIZE else large).append(key)
+
+        candidate_query = (
+            db.query(LeadMatchKey.key, Lead.id, Lead.full_name)
+            .join(Lead, Lead.id == LeadMatchKey.lead_id)
+        )
+        results = []
+        for start in range(0, len(small), cls.QUERY_CHUNK_SIZE):
+            chunk = small[start:start + cls.QUERY_CHUNK_SIZE]
+            results.extend(candidate_query.filter(LeadMatchKey.key.in_(chunk)).all())
+
+        # Common keys: the first leads of the block, a range scan on (key, lead_id)
+        for key in large:
+            results.extend(
+                candidate_query
+                .filter(LeadMatchKey.key == key)
+                .order_by(LeadMatchKey.lead_id)
+                .limit(cls.MAX_BLOCK_SIZE)
+                .all()
+            )
+
+        candidates: Dict[int, Dict[int, str]] = defaultdict(dict)
+        for key, lead_id, full_name in results:
+            for row_key in rows_by_key[key]:
+                candidates[row_key][lead_id] = full_name
+
+        return candidates
+
+
+# ========== Incremental Maintenance ==========
+
+def _after_flush(session: Session, flush_context) -> None:
+    """Re-key leads that were inserted, renamed or deleted in this flush."""
+    leads = []
+
+    for obj in session.new:
+        if isinstance(obj, Lead):
+            leads.append((obj.id, obj.full_name))
+
+    for obj in session.dirty:
+        if isinstance(obj, Lead) and inspect(obj).attrs.full_name.history.has_changes():
+            leads.append((obj.id, obj.full_name))
+
+    for obj in session.deleted:
+        if isinstance(obj, Lead):
+            leads.append((obj.id, None))
+
+    if leads:
+        MatchIndexService.index_leads(session.connection(), leads)
+
+
+def register_listeners() -> None:
+    """
+    Register the ORM session listener that keeps the index up to date.
+    Safe to call more than once.
+    """
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+
+
+if __name__ == "__main__":
+    from app.core.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Lead fuzzy-match index maintenance")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        written = MatchIndexService.rebuild(db, batch_size=args.batch_size)
+        print(f"Indexed {written} match keys")
+    finally:
+        db.close()
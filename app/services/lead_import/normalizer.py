@@ -4,6 +4,7 @@ Handles data validation, normalization, and transformation.
 """
 import re
 from typing import List, Dict, Any, Tuple, Optional
+import numpy as np
 import pandas as pd
 
 from app.models.lead import LeadSource
@@ -286,3 +287,286 @@ class NormalizerService:
                 valid_rows.append(normalized)
         
         return valid_rows, invalid_rows
+    
+    # ========== Vectorized Normalization ==========
+    
+    @staticmethod
+    def _text(series: pd.Series) -> pd.Series:
+        """Stringify every cell the way str() does on the record values."""
+        return series.astype(object).map(str).astype(object)
+    
+    @staticmethod
+    def _nones(index: pd.Index) -> pd.Series:
+        """Object column of None values."""
+        return pd.Series([None] * len(index), index=index, dtype=object)
+    
+    @classmethod
+    def _factorize(cls, series: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+        """
+        Split a column into codes and its stripped distinct values.
+        
+        Imported columns repeat heavily (sources, companies, names), so
+        string work is done once per distinct value and broadcast back
+        with ``_broadcast``. Missing cells get code -1.
+        
+        Returns:
+            Tuple of (codes, stripped_distinct_values)
+        """
+        if pd.api.types.infer_dtype(series, skipna=True) != "string":
+            # 1, 1.0 and True hash alike but stringify differently
+            series = cls._text(series).where(series.notna(), None)
+        codes, uniques = pd.factorize(series)
+        return codes, cls._text(pd.Series(uniques, dtype=object)).str.strip()
+    
+    @staticmethod
+    def _broadcast(codes: np.ndarray, results: pd.Series, na_value: Any, index: pd.Index) -> pd.Series:
+        """Expand per-distinct-value results back to rows."""
+        values = np.empty(len(results) + 1, dtype=object)
+        values[:-1] = results.to_numpy(dtype=object)
+        values[-1] = na_value  # code -1
+        return pd.Series(values[codes], index=index, dtype=object)
+    
+    @classmethod
+    def _join(cls, parts: List[Tuple[pd.Series, pd.Series]], separator: str, index: pd.Index) -> pd.Series:
+        """Join the usable parts of each row with a separator (None if no part)."""
+        joined = cls._nones(index)
+        for text, usable in parts:
+            first = usable & joined.isna()
+            both = usable & ~first
+            joined[both] = joined[both] + separator + text[both]
+            joined[first] = text[first]
+        return joined
+    
+    @staticmethod
+    def _collapse_title(text: pd.Series) -> pd.Series:
+        """Collapse internal whitespace and title case."""
+        return text.str.split().str.join(' ').str.title()
+    
+    def _map_fields(
+        self,
+        df: pd.DataFrame,
+        mappings: Dict[str, str],
+        merge_rules: List[Dict]
+    ) -> Dict[str, Tuple[pd.Series, pd.Series]]:
+        """
+        Map columns to CRM fields and apply merge rules.
+        
+        Returns:
+            Dict of field -> (values, present_mask). A field can be present
+            on some rows only when it is the target of a merge rule.
+        """
+        fields = {}
+        always = pd.Series(True, index=df.index)
+        
+        # Later columns win, like building the per-row dict
+        for position, col in enumerate(df.columns):
+            if col in mappings:
+                fields[mappings[col]] = (df.iloc[:, position].astype(object), always)
+        
+        for rule in merge_rules or []:
+            target = rule.get("target")
+            sources = rule.get("sources", [])
+            separator = rule.get("separator", " ")
+            
+            if not target or not sources:
+                continue
+            
+            parts = []
+            for source in sources:
+                if source not in fields:
+                    continue
+                values, present = fields[source]
+                stripped = self._text(values).str.strip()
+                parts.append((stripped, present & values.map(bool) & (stripped != '')))
+            
+            joined = self._join(parts, separator, df.index)
+            has_value = joined.notna()
+            
+            if target in fields:
+                values, present = fields[target]
+                fields[target] = (values.where(~has_value, joined), present | has_value)
+            else:
+                fields[target] = (joined, has_value)
+        
+        return fields
+    
+    def _normalize_name_column(
+        self,
+        fields: Dict[str, Tuple[pd.Series, pd.Series]],
+        index: pd.Index
+    ) -> Tuple[pd.Series, pd.Series]:
+        """
+        Vectorized ``normalize_name`` / ``merge_names`` selection.
+        
+        Returns:
+            Tuple of (full_name, key_present_mask)
+        """
+        never = pd.Series(False, index=index)
+        full_name = self._nones(index)
+        
+        name_present = never
+        if "full_name" in fields:
+            values, name_present = fields["full_name"]
+            codes, text = self._factorize(values)
+            name = self._collapse_title(text).where(text != '', None)
+            full_name = self._broadcast(codes, name, None, index)
+        
+        first_present = fields.get("first_name", (None, never))[1]
+        last_present = fields.get("last_name", (None, never))[1]
+        merge_mask = ~name_present & (first_present | last_present)
+        
+        if merge_mask.any():
+            parts = []
+            for part in ("first_name", "last_name"):
+                values = fields[part][0] if part in fields else self._nones(index)
+                codes, text = self._factorize(values)
+                parts.append(self._broadcast(codes, text, '', index))
+            first, last = parts
+            
+            joined = first.where(last == '', first + ' ' + last).where(first != '', last)
+            codes, text = self._factorize(joined)
+            merged = self._collapse_title(text).where(text != '', None)
+            full_name = full_name.where(~merge_mask, self._broadcast(codes, merged, None, index))
+        
+        name_key = name_present | merge_mask
+        return full_name.where(name_key, None), name_key
+    
+    def normalize_dataframe(
+        self,
+        df: pd.DataFrame,
+        mappings: Dict[str, str],
+        merge_rules: List[Dict] = None,
+        start_row: int = 2
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Columnar equivalent of ``normalize_data`` working on a DataFrame.
+        
+        Fields are normalized with vectorized string operations over their
+        distinct values and validated with boolean masks; per-row dicts are
+        only built for the output. Produces the same rows as
+        ``normalize_data`` on ``df.to_dict(orient='records')``.
+        
+        Args:
+            df: Raw data with normalized column names
+            mappings: Column name to CRM field mappings
+            merge_rules: Optional merge rules
+            start_row: Row number of the first row (2 = first data row of
+                a file; later chunks continue from there)
+            
+        Returns:
+            Tuple of (valid_rows, invalid_rows)
+        """
+        df = df.reset_index(drop=True)
+        index = df.index
+        fields = self._map_fields(df, mappings, merge_rules)
+        always = pd.Series(True, index=index)
+        
+        # Output columns as (name, values, key_present_mask)
+        columns = []
+        
+        # Full name
+        full_name, name_key = self._normalize_name_column(fields, index)
+        columns.append(("full_name", full_name, name_key))
+        name_error = full_name.isna()
+        
+        # Email
+        if "email" in fields:
+            email_values, _ = fields["email"]
+            codes, text = self._factorize(email_values)
+            email = (
+                text.str.lower()
+                .str.replace(' ', '', regex=False)
+                .str.replace('..', '.', regex=False)
+            )
+            valid = (text != '') & email.str.match(self.EMAIL_PATTERN.pattern).astype(bool)
+            error = ("Invalid email format: " + email).where(~valid, None)
+            error = error.where(text != '', "Email is required")
+            
+            email = self._broadcast(codes, email.where(valid, None), None, index)
+            email_error = self._broadcast(codes, error, "Email is required", index)
+            email_key = email.notna()
+        else:
+            email = self._nones(index)
+            email_error = pd.Series(["Email is required"] * len(index), index=index, dtype=object)
+            email_key = ~always
+        columns.append(("email", email, email_key))
+        
+        # Phone (optional)
+        if "phone" in fields:
+            phone_values, phone_present = fields["phone"]
+            codes, text = self._factorize(phone_values)
+            digits = text.str.replace(self.PHONE_CHARS_TO_REMOVE.pattern, '', regex=True)
+            add_plus = text.str.startswith('+') & ~digits.str.startswith('+')
+            digits = digits.where(~add_plus, '+' + digits)
+            phone = digits.where((text != '') & (digits.str.len() >= 7), None)
+            columns.append(("phone", self._broadcast(codes, phone, None, index), phone_present))
+        
+        # Company (optional)
+        if "company" in fields:
+            company_values, company_present = fields["company"]
+            codes, text = self._factorize(company_values)
+            company = self._broadcast(codes, text.where(text != '', None), None, index)
+            columns.append(("company", company, company_present))
+        
+        # Source
+        source = pd.Series([LeadSource.OTHER] * len(index), index=index, dtype=object)
+        if "source" in fields:
+            source_values, _ = fields["source"]
+            codes, text = self._factorize(source_values)
+            lookup = {**self.SOURCE_ALIASES, **self.VALID_SOURCES}
+            matched = text.str.lower().map(lookup)
+            # Assign through numpy: pandas would treat the str enum as a string
+            distinct = matched.to_numpy(dtype=object)
+            distinct[matched.isna().to_numpy()] = LeadSource.OTHER
+            source = self._broadcast(codes, pd.Series(distinct, dtype=object), LeadSource.OTHER, index)
+        columns.append(("source", source, always))
+        
+        # Notes (optional)
+        if "notes" in fields:
+            notes_values, notes_present = fields["notes"]
+            codes, text = self._factorize(notes_values)
+            notes = self._broadcast(codes, text.where(text != '', None), None, index)
+            columns.append(("notes", notes, notes_present))
+        
+        # Build row dicts
+        names = [name for name, _, _ in columns]
+        value_lists = [values.where(key, None).tolist() for _, values, key in columns]
+        partial = [
+            (position, key.tolist())
+            for position, (_, _, key) in enumerate(columns)
+            if not key.all()
+        ]
+        name_errors = name_error.tolist()
+        email_errors = email_error.tolist()
+        invalid_positions = (name_error | email_error.notna()).to_numpy().nonzero()[0]
+        originals = iter(df.iloc[invalid_positions].to_dict(orient='records'))
+        
+        valid_rows = []
+        invalid_rows = []
+        
+        for idx, row_values in enumerate(zip(*value_lists)):
+            row_num = idx + start_row
+            
+            normalized = dict(zip(names, row_values))
+            for position, key in partial:
+                if not key[idx]:
+                    del normalized[names[position]]
+            
+            if name_errors[idx] or email_errors[idx] is not None:
+                errors = []
+                if name_errors[idx]:
+                    errors.append({"field": "full_name", "error": "Name is required"})
+                if email_errors[idx] is not None:
+                    errors.append({"field": "email", "error": email_errors[idx]})
+                
+                invalid_rows.append({
+                    "row": row_num,
+                    "original": next(originals),
+                    "normalized": normalized,
+                    "errors": errors
+                })
+            else:
+                normalized["_row_num"] = row_num
+                valid_rows.append(normalized)
+        
+        return valid_rows, invalid_rows
@@ -1,13 +1,26 @@
 """
 Session Manager for tracking import workflow state.
 Handles ImportSession CRUD and state transitions.
+
+Uploaded files and normalized rows are kept in the import file spool;
+sessions only store their digests.
 """
-from typing import Optional, Dict, Any, List
+import io
+from itertools import islice
+from typing import Optional, Dict, Any, List, BinaryIO, Iterable, Iterator
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
+from app.core.config import settings
+from app.core.spool import SpoolStore
+from app.core.principal import Principal
 from app.models.import_session import ImportSession, ImportStatus
-from app.models.user import User
+from app.models.import_job import ImportJob
+
+
+# Import file spool shared by all sessions
+spool = SpoolStore(settings.IMPORT_SPOOL_DIR)
 
 
 class SessionManager:
@@ -18,28 +31,33 @@ class SessionManager:
     
     def create_session(
         self,
-        user: User,
+        user: Principal,
         file_name: str,
-        file_data: bytes,
+        file: BinaryIO,
         analysis_result: Dict[str, Any]
     ) -> ImportSession:
         """
         Create a new import session after file analysis.
         
         Args:
-            user: User who initiated import
+            user: Principal who initiated import
             file_name: Original filename
-            file_data: Raw file content
+            file: Uploaded file, stored in the spool from the start
             analysis_result: Output from AnalyzerService
             
         Returns:
             Created ImportSession
         """
+        file.seek(0)
+        file_sha256, file_size = spool.put(file)
+        file.seek(0)
+        
         session = ImportSession(
             user_id=user.id,
             status=ImportStatus.MAPPING,
             file_name=file_name,
-            file_data=file_data,
+            file_sha256=file_sha256,
+            file_size=file_size,
             detected_columns=analysis_result.get("detected_columns", []),
             suggested_mappings=analysis_result.get("suggested_mappings", {}),
             sample_rows=analysis_result.get("sample_rows", []),
@@ -52,7 +70,7 @@ class SessionManager:
         
         return session
     
-    def get_session(self, session_id: int, user: User) -> ImportSession:
+    def get_session(self, session_id: int, user: Principal) -> ImportSession:
         """
         Get import session by ID with access check.
         
@@ -117,23 +135,23 @@ class SessionManager:
     def update_normalized_data(
         self,
         session: ImportSession,
-        valid_rows: List[Dict],
-        invalid_rows: List[Dict]
+        valid_rows: Iterable[Dict],
+        invalid_rows: Iterable[Dict]
     ) -> ImportSession:
         """
-        Update session with normalized data.
+        Write normalized data to the spool and record it on the session.
         
         Args:
             session: Import session
-            valid_rows: Rows that passed validation
+            valid_rows: Rows that passed validation (may be a generator;
+                it is consumed before invalid_rows is read)
             invalid_rows: Rows with errors
             
         Returns:
             Updated ImportSession
         """
-        session.normalized_data = valid_rows
-        session.valid_rows = len(valid_rows)
-        session.validation_errors = invalid_rows
+        session.normalized_ref, session.valid_rows = spool.put_lines(valid_rows)
+        session.validation_errors_ref, session.invalid_rows = spool.put_lines(invalid_rows)
         session.status = ImportStatus.DEDUPLICATING
         
         self.db.commit()
@@ -240,9 +258,68 @@ class SessionManager:
         
         return session
     
+    # ========== Spooled Data ==========
+    
+    def open_file(self, session: ImportSession) -> BinaryIO:
+        """
+        Open the session's uploaded file (memory-mapped). Close when done.
+        """
+        if session.file_sha256:
+            return spool.open(session.file_sha256)
+        return io.BytesIO(session.file_data or b"")
+    
+    def iter_normalized_rows(
+        self,
+        session: ImportSession,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the session's normalized rows.
+        
+        Args:
+            session: Import session
+            limit: Stop after this many rows
+        """
+        if session.normalized_ref:
+            return spool.read_lines(session.normalized_ref, limit=limit)
+        return islice(session.normalized_data or [], limit)
+    
+    def get_normalized_rows(self, session: ImportSession) -> List[Dict[str, Any]]:
+        """All normalized rows of the session."""
+        return list(self.iter_normalized_rows(session))
+    
+    def get_validation_errors(self, session: ImportSession) -> List[Dict[str, Any]]:
+        """Rows of the session that failed validation."""
+        if session.validation_errors_ref:
+            return list(spool.read_lines(session.validation_errors_ref))
+        return session.validation_errors or []
+    
+    def get_invalid_count(self, session: ImportSession) -> int:
+        """Number of rows that failed validation."""
+        if session.validation_errors_ref:
+            return session.invalid_rows or 0
+        return len(session.validation_errors or [])
+    
+    def _release_spooled(self, digests: List[str]) -> None:
+        """Delete spool blobs no longer referenced by any session."""
+        for digest in set(filter(None, digests)):
+            in_use = self.db.query(ImportSession.id).filter(or_(
+                ImportSession.file_sha256 == digest,
+                ImportSession.normalized_ref == digest,
+                ImportSession.validation_errors_ref == digest
+            )).first()
+            if in_use is None:
+                spool.delete(digest)
+    
+    def get_latest_job(self, session: ImportSession) -> Optional[ImportJob]:
+        """Most recent background job of a session, if any."""
+        return self.db.query(ImportJob).filter(
+            ImportJob.session_id == session.id
+        ).order_by(ImportJob.id.desc()).first()
+    
     def get_user_sessions(
         self,
-        user: User,
+        user: Principal,
         status_filter: Optional[ImportStatus] = None,
         limit: int = 20
     ) -> List[ImportSession]:
@@ -267,6 +344,8 @@ class SessionManager:
         return query.order_by(ImportSession.created_at.desc()).limit(limit).all()
     
     def delete_session(self, session: ImportSession) -> None:
-        """Delete an import session."""
+        """Delete an import session and spooled data only it used."""
+        digests = [session.file_sha256, session.normalized_ref, session.validation_errors_ref]
         self.db.delete(session)
         self.db.commit()
+        self._release_spooled(digests)
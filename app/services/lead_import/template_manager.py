@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from app.models.mapping_template import MappingTemplate
-from app.models.user import User
+from app.core.principal import Principal
 
 
 class TemplateManager:
@@ -18,7 +18,7 @@ class TemplateManager:
     
     def create_template(
         self,
-        user: User,
+        user: Principal,
         name: str,
         mappings: dict,
         merge_rules: list = None,
@@ -8,7 +8,8 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status, UploadFile
 
 from app.models.lead import Lead, LeadStatus, LeadSource
-from app.models.user import User, UserRole
+from app.models.user import UserRole
+from app.core.principal import Principal
 from app.crud import lead as lead_crud
 from app.schemas.lead import LeadCreate
 
@@ -141,7 +142,7 @@ def check_duplicate(db: Session, email: str, phone: str = None) -> bool:
 def import_leads_from_file(
     db: Session,
     file: UploadFile,
-    current_user: User
+    current_user: Principal
 ) -> ImportResult:
     """
     Import leads from Excel/CSV file.
@@ -149,7 +150,7 @@ def import_leads_from_file(
     Args:
         db: Database session
         file: Uploaded file
-        current_user: User performing the import
+        current_user: Principal performing the import
         
     Returns:
         ImportResult with summary of import operation
@@ -255,7 +256,7 @@ def import_leads_from_file(
     return result
 
 
-def can_import_leads(user: User) -> bool:
+def can_import_leads(user: Principal) -> bool:
     """
     Check if user has permission to import leads.
     
@@ -1,16 +1,24 @@
 """
 Business logic for lead management.
 """
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
+from app.core.pagination import CountMode
+from app.core.principal import Principal
+from app.crud.rows import ResponseRows
 from app.models.lead import Lead
 from app.models.user import User, UserRole
 from app.crud import lead as lead_crud
-from app.schemas.lead import LeadCreate, LeadUpdate, LeadNoteCreate
+from app.schemas.common import BatchResponse
+from app.schemas.lead import LeadCreate, LeadUpdate, LeadNoteCreate, LeadBatchOperation
+from app.services import batch_service
 
 
-def can_user_access_lead(user: User, lead: Lead) -> bool:
+def can_user_access_lead(user: Principal, lead: Lead) -> bool:
     """
     Check if user can access a specific lead.
     
@@ -36,7 +44,7 @@ def can_user_access_lead(user: User, lead: Lead) -> bool:
     return False
 
 
-def can_user_modify_lead(user: User, lead: Lead) -> bool:
+def can_user_modify_lead(user: Principal, lead: Lead) -> bool:
     """
     Check if user can modify a specific lead.
     
@@ -54,7 +62,7 @@ def can_user_modify_lead(user: User, lead: Lead) -> bool:
     return can_user_access_lead(user, lead)
 
 
-def can_user_delete_lead(user: User) -> bool:
+def can_user_delete_lead(user: Principal) -> bool:
     """
     Check if user can delete leads.
     
@@ -71,7 +79,7 @@ def can_user_delete_lead(user: User) -> bool:
     return user.role in [UserRole.ADMIN, UserRole.MANAGER]
 
 
-def can_user_assign_lead(user: User) -> bool:
+def can_user_assign_lead(user: Principal) -> bool:
     """
     Check if user can assign leads.
     
@@ -88,21 +96,16 @@ def can_user_assign_lead(user: User) -> bool:
     return user.role in [UserRole.ADMIN, UserRole.MANAGER]
 
 
-def validate_lead_assignment(db: Session, assigned_to_id: int) -> None:
+def check_lead_assignee(user: Optional[User]) -> None:
     """
-    Validate that the user being assigned to has sales role.
+    Check that a loaded user can be assigned leads.
     
     Args:
-        db: Database session
-        assigned_to_id: User ID to assign to
+        user: User being assigned to, None if not found
         
     Raises:
         HTTPException: If user doesn't exist or doesn't have sales role
     """
-    from app.crud import user as user_crud
-    
-    user = user_crud.get_user(db, user_id=assigned_to_id)
-    
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -122,10 +125,26 @@ def validate_lead_assignment(db: Session, assigned_to_id: int) -> None:
         )
 
 
+def validate_lead_assignment(db: Session, assigned_to_id: int) -> None:
+    """
+    Validate that the user being assigned to has sales role.
+    
+    Args:
+        db: Database session
+        assigned_to_id: User ID to assign to
+        
+    Raises:
+        HTTPException: If user doesn't exist or doesn't have sales role
+    """
+    from app.crud import user as user_crud
+    
+    check_lead_assignee(user_crud.get_user(db, user_id=assigned_to_id))
+
+
 def create_lead_with_validation(
     db: Session,
     lead: LeadCreate,
-    current_user: User
+    current_user: Principal
 ) -> Lead:
     """
     Create a lead with business logic validation.
@@ -133,7 +152,7 @@ def create_lead_with_validation(
     Args:
         db: Database session
         lead: Lead creation data
-        current_user: User creating the lead
+        current_user: Principal creating the lead
         
     Returns:
         Created Lead object
@@ -149,14 +168,82 @@ def create_lead_with_validation(
     return lead_crud.create_lead(db, lead, created_by_id=current_user.id)
 
 
+def apply_lead_batch(
+    db: Session,
+    operations: List[LeadBatchOperation],
+    current_user: Principal
+) -> BatchResponse:
+    """
+    Apply a batch of lead operations in one transaction.
+    
+    Each operation gets the checks of its single-record endpoint (create,
+    update, assign, status), against leads and assignees loaded with one
+    query each. Rejected operations are reported and skipped.
+    
+    Args:
+        db: Database session
+        operations: Lead operations, applied in order
+        current_user: Principal running the batch
+        
+    Returns:
+        BatchResponse with per-operation results
+    """
+    leads = batch_service.fetch_by_ids(db, Lead, batch_service.referenced_ids(operations, "id"))
+    users = batch_service.fetch_by_ids(db, User, batch_service.referenced_ids(operations, "assigned_to_id"))
+    
+    def apply(operation):
+        if operation.op == "create":
+            if operation.data.assigned_to_id:
+                check_lead_assignee(users.get(operation.data.assigned_to_id))
+            
+            lead = lead_crud.build_lead(operation.data, created_by_id=current_user.id)
+            db.add(lead)
+            return lead
+        
+        if operation.op == "assign" and not can_user_assign_lead(current_user):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Admin or Manager access required. Your role: {current_user.role.value}"
+            )
+        
+        lead = batch_service.get_or_404(leads, operation.id, "Lead")
+        
+        if operation.op == "assign":
+            check_lead_assignee(users.get(operation.assigned_to_id))
+            lead.assigned_to_id = operation.assigned_to_id
+            return lead
+        
+        if not can_user_modify_lead(current_user, lead):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to modify this lead"
+            )
+        
+        if operation.op == "status":
+            lead.status = operation.status
+            return lead
+        
+        if operation.data.assigned_to_id is not None:
+            check_lead_assignee(users.get(operation.data.assigned_to_id))
+        
+        batch_service.apply_fields(lead, operation.data)
+        return lead
+    
+    return batch_service.run_batch(db, operations, apply)
+
+
 def get_leads_for_user(
     db: Session,
-    user: User,
+    user: Principal,
     skip: int = 0,
     limit: int = 100,
     status: str = None,
     source: str = None,
-    search: str = None
+    search: str = None,
+    cursor: str = None,
+    count_mode: CountMode = CountMode.EXACT,
+    options: tuple = (),
+    rows: ResponseRows = None
 ):
     """
     Get leads based on user permissions.
@@ -169,6 +256,10 @@ def get_leads_for_user(
         status: Filter by status
         source: Filter by source
         search: Search term
+        cursor: Keyset pagination cursor (replaces skip)
+        count_mode: How to compute the total
+        options: Loader options for the response schema
+        rows: Row selection (``response_rows``) to return rows instead of ORM objects
         
     Returns:
         Tuple of (leads, total)
@@ -181,7 +272,11 @@ def get_leads_for_user(
             limit=limit,
             status=status,
             source=source,
-            search=search
+            search=search,
+            cursor=cursor,
+            count_mode=count_mode,
+            options=options,
+            rows=rows
         )
     
     # Sales only see assigned leads
@@ -192,5 +287,67 @@ def get_leads_for_user(
         status=status,
         source=source,
         search=search,
+        cursor=cursor,
+        count_mode=count_mode,
+        options=options,
+        rows=rows,
         assigned_to_id=user.id
     )
+
+
+async def get_leads_for_user_async(db: AsyncSession, user: Principal, **filters):
+    """
+    ``get_leads_for_user`` on an async session, taking the same filters.
+    
+    Args:
+        db: Async database session
+        user: Current user
+        **filters: Pagination, filter and loader arguments of ``get_leads_for_user``
+        
+    Returns:
+        Tuple of (leads, total)
+    """
+    return await db.run_sync(get_leads_for_user, user, **filters)
+
+
+# Columns of lead exports, primary key first
+EXPORT_COLUMNS = (
+    Lead.id,
+    Lead.full_name,
+    Lead.email,
+    Lead.phone,
+    Lead.source,
+    Lead.status,
+    Lead.assigned_to_id,
+    Lead.created_by_id,
+    Lead.created_at,
+    Lead.updated_at
+)
+
+
+def get_leads_export_query(
+    db: Session,
+    user: Principal,
+    status: str = None,
+    source: str = None,
+    search: str = None
+):
+    """
+    Build the query of leads a user may export.
+    
+    Args:
+        db: Database session
+        user: Current user
+        status: Filter by status
+        source: Filter by source
+        search: Search term
+        
+    Returns:
+        Filtered lead query, limited to assigned leads for sales users
+    """
+    # Admin and Manager export all leads
+    if user.role in [UserRole.ADMIN, UserRole.MANAGER]:
+        return lead_crud.leads_query(db, status=status, source=source, search=search)
+    
+    # Sales only export assigned leads
+    return lead_crud.leads_query(db, status=status, source=source, search=search, assigned_to_id=user.id)
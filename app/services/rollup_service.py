@@ -0,0 +1,394 @@
+"""
+Daily metrics rollup service.
+
+Maintains the ``daily_metrics`` table incrementally from ORM flush events,
+provides a backfill command to rebuild it from the raw tables, and exposes
+read helpers used by the analytics service.
+
+Usage:
+    python -m app.services.rollup_service backfill
+"""
+import argparse
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, func, select, inspect
+from sqlalchemy.orm import Session
+
+from app.models.daily_metric import DailyMetric
+from app.models.lead import Lead
+from app.models.customer import Customer
+from app.models.deal import Deal, DealStage
+from app.models.task import Task
+
+
+# (metric_date, user_id, entity, dimension)
+MetricKey = Tuple[date, int, str, str]
+MetricRow = Tuple[MetricKey, int, Decimal]
+
+# Session.info key holding old contributions between before_flush and after_flush
+_PENDING_KEY = "rollup_pending"
+
+
+def _enum_value(value: Any) -> Any:
+    """Return the plain value of an enum member (or the value itself)."""
+    return value.value if hasattr(value, "value") else value
+
+
+def _as_date(value: Any) -> date:
+    """Convert a datetime/date/ISO string to a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+# ========== Metric Definitions ==========
+
+def _lead_metrics(get: Callable[[str], Any]) -> Iterable[MetricRow]:
+    day = _as_date(get("created_at"))
+    user_id = get("assigned_to_id") or 0
+    yield (day, user_id, "lead", f"source:{_enum_value(get('source'))}"), 1, Decimal(0)
+    yield (day, user_id, "lead", f"status:{_enum_value(get('status'))}"), 1, Decimal(0)
+
+
+def _customer_metrics(get: Callable[[str], Any]) -> Iterable[MetricRow]:
+    day = _as_date(get("created_at"))
+    user_id = get("assigned_to_id") or 0
+    yield (day, user_id, "customer", "created"), 1, Decimal(0)
+    if get("lead_id") is not None:
+        yield (day, user_id, "customer", "converted"), 1, Decimal(0)
+
+
+def _deal_metrics(get: Callable[[str], Any]) -> Iterable[MetricRow]:
+    user_id = get("owner_id") or 0
+    stage = _enum_value(get("stage"))
+    value = Decimal(str(get("value") or 0))
+    yield (_as_date(get("created_at")), user_id, "deal", f"stage:{stage}"), 1, value
+    # Revenue is reported by the day the deal was last updated (i.e. won)
+    if stage == DealStage.CLOSED_WON.value:
+        yield (_as_date(get("updated_at")), user_id, "deal", "won_revenue"), 1, value
+
+
+def _task_metrics(get: Callable[[str], Any]) -> Iterable[MetricRow]:
+    day = _as_date(get("created_at"))
+    user_id = get("assigned_to_id") or 0
+    yield (day, user_id, "task", f"status:{_enum_value(get('status'))}"), 1, Decimal(0)
+    yield (day, user_id, "task", f"priority:{_enum_value(get('priority'))}"), 1, Decimal(0)
+    related_type = get("related_type")
+    if related_type is not None:
+        yield (day, user_id, "task", f"related:{_enum_value(related_type)}"), 1, Decimal(0)
+
+
+# Tracked model -> (attributes the metrics depend on, metric function)
+TRACKED_MODELS: Dict[type, Tuple[Tuple[str, ...], Callable]] = {
+    Lead: (("created_at", "assigned_to_id", "source", "status"), _lead_metrics),
+    Customer: (("created_at", "assigned_to_id", "lead_id"), _customer_metrics),
+    Deal: (("created_at", "updated_at", "owner_id", "stage", "value"), _deal_metrics),
+    Task: (("created_at", "assigned_to_id", "status", "priority", "related_type"), _task_metrics),
+}
+
+
+# ========== Incremental Maintenance ==========
+
+def _committed_values(session: Session, obj: Any, attrs: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Get the values of ``attrs`` as they are currently stored in the database.
+
+    Uses attribute history where possible and falls back to a SELECT when
+    an attribute was overwritten without its previous value being loaded.
+    """
+    state = inspect(obj)
+    values = {}
+
+    for attr in attrs:
+        history = state.attrs[attr].history
+        if history.deleted:
+            values[attr] = history.deleted[0]
+        elif history.added:
+            model = type(obj)
+            row = session.connection().execute(
+                select(*[getattr(model, name) for name in attrs]).where(model.id == obj.id)
+            ).one()
+            return dict(row._mapping)
+        else:
+            values[attr] = getattr(obj, attr)
+
+    return values
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    """Capture the pre-flush contributions of changed and deleted records."""
+    pending = session.info.setdefault(_PENDING_KEY, [])
+
+    for obj in session.new:
+        if type(obj) in TRACKED_MODELS:
+            pending.append((obj, [], False))
+
+    for obj in session.dirty:
+        if type(obj) in TRACKED_MODELS and session.is_modified(obj):
+            attrs, metrics = TRACKED_MODELS[type(obj)]
+            old = _committed_values(session, obj, attrs)
+            pending.append((obj, list(metrics(old.get)), False))
+
+    for obj in session.deleted:
+        if type(obj) in TRACKED_MODELS:
+            attrs, metrics = TRACKED_MODELS[type(obj)]
+            old = _committed_values(session, obj, attrs)
+            pending.append((obj, list(metrics(old.get)), True))
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    """Apply the difference between old and new contributions to the rollup."""
+    pending = session.info.pop(_PENDING_KEY, [])
+    if not pending:
+        return
+
+    deltas: Dict[MetricKey, List] = defaultdict(lambda: [0, Decimal(0)])
+
+    for obj, old_rows, is_deleted in pending:
+        for key, count, value in old_rows:
+            deltas[key][0] -= count
+            deltas[key][1] -= value
+
+        if not is_deleted:
+            _, metrics = TRACKED_MODELS[type(obj)]
+            for key, count, value in metrics(lambda attr: getattr(obj, attr)):
+                deltas[key][0] += count
+                deltas[key][1] += value
+
+    apply_deltas(session.connection(), deltas)
+
+
+def _after_soft_rollback(session: Session, previous_transaction) -> None:
+    """Discard captured contributions if the flush did not complete."""
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_listeners() -> None:
+    """
+    Register the ORM session listeners that keep the rollup up to date.
+    Safe to call more than once.
+    """
+    listeners = (
+        ("before_flush", _before_flush),
+        ("after_flush", _after_flush),
+        ("after_soft_rollback", _after_soft_rollback),
+    )
+    for name, listener in listeners:
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
+
+
+def apply_deltas(connection, deltas: Dict[MetricKey, List]) -> None:
+    """
+    Add count/value deltas to the rollup using a single batched upsert.
+
+    Args:
+        connection: Connection participating in the current transaction
+        deltas: Mapping of metric key -> [count_delta, value_delta]
+    """
+    now = datetime.utcnow()
+    params = [
+        {
+            "metric_date": key[0],
+            "user_id": key[1],
+            "entity": key[2],
+            "dimension": key[3],
+            "count": count,
+            "value": value,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for key, (count, value) in deltas.items()
+        if count or value
+    ]
+    if not params:
+        return
+
+    table = DailyMetric.__table__
+    dialect = connection.dialect.name
+
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["metric_date", "user_id", "entity", "dimension"],
+            set_={
+                "count": table.c.count + stmt.excluded.count,
+                "value": table.c.value + stmt.excluded.value,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        connection.execute(stmt, params)
+        return
+
+    # Generic fallback: update existing buckets, insert missing ones
+    for row in params:
+        result = connection.execute(
+            table.update()
+            .where(
+                table.c.metric_date == row["metric_date"],
+                table.c.user_id == row["user_id"],
+                table.c.entity == row["entity"],
+                table.c.dimension == row["dimension"],
+            )
+            .values(
+                count=table.c.count + row["count"],
+                value=table.c.value + row["value"],
+                updated_at=now,
+            )
+        )
+        if result.rowcount == 0:
+            connection.execute(table.insert(), row)
+
+
+def record_inserted(connection, model: Any, rows: Iterable[Dict[str, Any]]) -> None:
+    """
+    Add the contributions of rows inserted without the ORM unit of work
+    (bulk inserts), which the flush listeners do not see.
+
+    Args:
+        connection: Connection participating in the current transaction
+        model: Tracked model class the rows were inserted into
+        rows: Inserted column values (must include the tracked attributes)
+    """
+    _, metrics = TRACKED_MODELS[model]
+    deltas: Dict[MetricKey, List] = defaultdict(lambda: [0, Decimal(0)])
+
+    for row in rows:
+        for key, count, value in metrics(row.get):
+            deltas[key][0] += count
+            deltas[key][1] += value
+
+    apply_deltas(connection, deltas)
+
+
+# ========== Backfill ==========
+
+def backfill(db: Session, batch_size: int = 5000) -> int:
+    """
+    Rebuild the rollup from the raw lead, customer, deal and task tables.
+
+    Args:
+        db: Database session
+        batch_size: Rows fetched per round-trip while streaming
+
+    Returns:
+        Number of metric buckets written
+    """
+    deltas: Dict[MetricKey, List] = defaultdict(lambda: [0, Decimal(0)])
+
+    for model, (attrs, metrics) in TRACKED_MODELS.items():
+        columns = [getattr(model, attr) for attr in attrs]
+        for row in db.query(*columns).yield_per(batch_size):
+            for key, count, value in metrics(row._mapping.get):
+                deltas[key][0] += count
+                deltas[key][1] += value
+
+    db.query(DailyMetric).delete(synchronize_session=False)
+    apply_deltas(db.connection(), deltas)
+    db.commit()
+
+    return len(deltas)
+
+
+# ========== Reads ==========
+
+def read_metrics(
+    db: Session,
+    entity: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    user_filter: Optional[int] = None
+) -> List[Tuple[date, str, int, Decimal]]:
+    """
+    Read daily buckets for an entity, summed across users unless filtered.
+
+    Args:
+        db: Database session
+        entity: Entity name (lead, customer, deal, task)
+        start_date: Optional first day (inclusive)
+        end_date: Optional last day (inclusive)
+        user_filter: Optional user ID to restrict to
+
+    Returns:
+        List of (metric_date, dimension, count, value) tuples
+    """
+    query = db.query(
+        DailyMetric.metric_date,
+        DailyMetric.dimension,
+        func.sum(DailyMetric.count),
+        func.sum(DailyMetric.value)
+    ).filter(DailyMetric.entity == entity)
+
+    if start_date:
+        query = query.filter(DailyMetric.metric_date >= start_date)
+    if end_date:
+        query = query.filter(DailyMetric.metric_date <= end_date)
+    if user_filter:
+        query = query.filter(DailyMetric.user_id == user_filter)
+
+    rows = query.group_by(DailyMetric.metric_date, DailyMetric.dimension).all()
+    return [(_as_date(day), dimension, count or 0, value or Decimal(0)) for day, dimension, count, value in rows]
+
+
+def summarize(
+    rows: List[Tuple[date, str, int, Decimal]],
+    prefix: str
+) -> Dict[str, Tuple[int, Decimal]]:
+    """
+    Collapse daily rows into per-bucket totals for dimensions starting with ``prefix``.
+
+    Returns:
+        Dict of bucket name (without prefix) -> (count, value), empty buckets omitted
+    """
+    totals: Dict[str, List] = defaultdict(lambda: [0, Decimal(0)])
+    for _, dimension, count, value in rows:
+        if dimension.startswith(prefix):
+            bucket = totals[dimension[len(prefix):]]
+            bucket[0] += count
+            bucket[1] += value
+    return {name: (count, value) for name, (count, value) in totals.items() if count}
+
+
+def summarize_monthly(
+    rows: List[Tuple[date, str, int, Decimal]],
+    prefix: str
+) -> Dict[str, Tuple[int, Decimal]]:
+    """
+    Collapse daily rows into per-month (YYYY-MM) totals for dimensions starting with ``prefix``.
+
+    Returns:
+        Dict of month -> (count, value), empty months omitted
+    """
+    totals: Dict[str, List] = defaultdict(lambda: [0, Decimal(0)])
+    for day, dimension, count, value in rows:
+        if dimension.startswith(prefix):
+            bucket = totals[day.strftime("%Y-%m")]
+            bucket[0] += count
+            bucket[1] += value
+    return {month: (count, value) for month, (count, value) in sorted(totals.items()) if count}
+
+
+if __name__ == "__main__":
+    from app.core.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Daily metrics rollup maintenance")
+    parser.add_argument("command", choices=["backfill"], help="Operation to run")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows fetched per round-trip")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        buckets = backfill(db, batch_size=args.batch_size)
+        print(f"Rollup rebuilt: {buckets} metric buckets written")
+    finally:
+        db.close()
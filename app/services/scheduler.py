@@ -0,0 +1,283 @@
+"""
+Scheduler for periodic maintenance jobs.
+
+Jobs are registered in code with an interval and checked by a scheduler
+thread in every application process. Each job has a row in
+``scheduled_jobs``: a process runs a due job only after an atomic update
+moves its ``next_run_at`` forward and takes its lease, so with several
+workers every run happens once. A run that outlives its lease (its
+process died) is released when the lease expires. Run metrics (duration,
+result, error, counts) are recorded on the same row.
+
+Usage:
+    python -m app.services.scheduler run <job_name>
+"""
+import argparse
+import os
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logging_config import get_logger
+from app.models.scheduled_job import ScheduledJob
+
+
+logger = get_logger(__name__)
+
+# Identifies this process as the holder of a lease
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+# Runs the job's work and commits it; the return value is kept as
+# last_result (e.g. number of rows updated)
+JobFunction = Callable[[Session], Optional[int]]
+
+
+@dataclass(frozen=True)
+class PeriodicJob:
+    """A registered job and how often it runs."""
+    name: str
+    interval: int
+    func: JobFunction
+
+
+_jobs: Dict[str, PeriodicJob] = {}
+
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_stopping = threading.Event()
+
+
+def register_job(name: str, interval: int, func: JobFunction) -> None:
+    """
+    Register a periodic job.
+
+    Args:
+        name: Unique job name (its row in scheduled_jobs)
+        interval: Seconds between runs
+        func: Called with a session; should commit its own work
+    """
+    _jobs[name] = PeriodicJob(name=name, interval=interval, func=func)
+
+
+def registered_jobs() -> List[str]:
+    """Names of the registered jobs."""
+    return sorted(_jobs)
+
+
+def _ensure_rows(db: Session) -> None:
+    """Create the scheduled_jobs rows of registered jobs (due immediately)."""
+    existing = {name for (name,) in db.query(ScheduledJob.name).all()}
+    for name in _jobs:
+        if name in existing:
+            continue
+        db.add(ScheduledJob(name=name, next_run_at=datetime.utcnow()))
+        try:
+            db.commit()
+        except IntegrityError:
+            # Created by another worker starting at the same time
+            db.rollback()
+
+
+def _claim(db: Session, job: PeriodicJob, now: datetime, due_only: bool = True) -> bool:
+    """
+    Take the job's lease if it is not running elsewhere (and, with
+    ``due_only``, is due), moving ``next_run_at`` one interval past ``now``.
+    """
+    conditions = [
+        ScheduledJob.name == job.name,
+        or_(ScheduledJob.locked_until.is_(None), ScheduledJob.locked_until < now)
+    ]
+    if due_only:
+        conditions.append(ScheduledJob.next_run_at <= now)
+
+    result = db.execute(
+        update(ScheduledJob)
+        .where(*conditions)
+        .values(
+            next_run_at=now + timedelta(seconds=job.interval),
+            locked_by=WORKER_ID,
+            locked_until=now + timedelta(seconds=settings.SCHEDULER_LEASE_SECONDS),
+            last_started_at=now,
+            updated_at=now
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def _record(db: Session, job: PeriodicJob, started: float, result: Optional[int], error: Optional[str]) -> None:
+    """Release the lease and record the run's metrics."""
+    values: Dict[str, Any] = {
+        "locked_by": None,
+        "locked_until": None,
+        "last_finished_at": datetime.utcnow(),
+        "last_duration_ms": int((time.monotonic() - started) * 1000),
+        "last_error": error,
+        "updated_at": datetime.utcnow(),
+    }
+    if error is None:
+        values["last_result"] = result
+        values["run_count"] = ScheduledJob.run_count + 1
+    else:
+        values["failure_count"] = ScheduledJob.failure_count + 1
+
+    db.execute(
+        update(ScheduledJob)
+        .where(ScheduledJob.name == job.name, ScheduledJob.locked_by == WORKER_ID)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def _run(db: Session, job: PeriodicJob) -> None:
+    started = time.monotonic()
+    result = None
+    error = None
+
+    try:
+        result = job.func(db)
+    except Exception as e:
+        db.rollback()
+        error = str(e)
+        logger.exception(f"Scheduled job {job.name} failed")
+
+    _record(db, job, started, result, error)
+    if error is None:
+        logger.info(
+            f"Scheduled job {job.name} finished",
+            extra={"job": job.name, "result": result, "duration_ms": int((time.monotonic() - started) * 1000)}
+        )
+
+
+def run_due() -> int:
+    """
+    Run the registered jobs that are due and not running elsewhere.
+
+    Returns:
+        Number of jobs run by this process
+    """
+    ran = 0
+    db = SessionLocal()
+    try:
+        _ensure_rows(db)
+        for job in list(_jobs.values()):
+            if _stopping.is_set():
+                break
+            if _claim(db, job, datetime.utcnow()):
+                _run(db, job)
+                ran += 1
+    finally:
+        db.close()
+    return ran
+
+
+def run_now(db: Session, name: str) -> Optional[int]:
+    """
+    Run a job immediately, ignoring its schedule (but not a running lease).
+
+    Args:
+        db: Database session
+        name: Registered job name
+
+    Returns:
+        The job's result
+
+    Raises:
+        KeyError: If no job is registered under ``name``
+        RuntimeError: If the job is running in another process
+    """
+    job = _jobs[name]
+    _ensure_rows(db)
+    # One UPDATE: a failed claim leaves the schedule as it was
+    if not _claim(db, job, datetime.utcnow(), due_only=False):
+        raise RuntimeError(f"Scheduled job {name} is running in another process")
+    _run(db, job)
+    return db.query(ScheduledJob.last_result).filter(ScheduledJob.name == name).scalar()
+
+
+def job_status(db: Session) -> List[Dict[str, Any]]:
+    """
+    Schedule and run metrics of every job with a scheduled_jobs row.
+
+    Args:
+        db: Database session
+
+    Returns:
+        List of dicts, one per job
+    """
+    return [
+        {
+            "name": job.name,
+            "next_run_at": job.next_run_at,
+            "running": job.locked_until is not None and job.locked_until > datetime.utcnow(),
+            "last_started_at": job.last_started_at,
+            "last_finished_at": job.last_finished_at,
+            "last_duration_ms": job.last_duration_ms,
+            "last_result": job.last_result,
+            "last_error": job.last_error,
+            "run_count": job.run_count,
+            "failure_count": job.failure_count,
+        }
+        for job in db.query(ScheduledJob).order_by(ScheduledJob.name).all()
+    ]
+
+
+def _loop() -> None:
+    while True:
+        try:
+            run_due()
+        except Exception:
+            logger.exception("Scheduler tick failed")
+        if _stopping.wait(settings.SCHEDULER_POLL_SECONDS):
+            return
+
+
+def start() -> None:
+    """Start the scheduler thread (no-op when disabled or already running)."""
+    global _thread
+    if not settings.SCHEDULER_ENABLED:
+        return
+
+    _stopping.clear()
+    with _lock:
+        if _thread is None or not _thread.is_alive():
+            _thread = threading.Thread(target=_loop, name="scheduler", daemon=True)
+            _thread.start()
+
+
+def shutdown() -> None:
+    """
+    Stop the scheduler thread after its current job.
+    An interrupted run is picked up again once its lease expires.
+    """
+    _stopping.set()
+
+
+if __name__ == "__main__":
+    # Jobs register with the imported module, not this __main__ copy
+    from app.services import scheduler, task_service
+
+    task_service.register_jobs()
+
+    parser = argparse.ArgumentParser(description="Periodic maintenance jobs")
+    parser.add_argument("command", choices=["run"], help="Operation to run")
+    parser.add_argument("name", choices=scheduler.registered_jobs(), help="Job to run now")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = scheduler.run_now(db, args.name)
+        print(f"{args.name}: {result}")
+    finally:
+        db.close()
@@ -0,0 +1,527 @@
+"""
+Full-text search over leads, customers and deals.
+
+Every record has one document in the ``search_index`` table: a title (the
+name) and a body (email, phone, company), plus the owner used for RBAC
+scoping. The storage depends on the database:
+
+- SQLite: an FTS5 virtual table ranked with bm25, with prefix indexes
+  for typeahead
+- PostgreSQL: a table with a weighted ``tsvector`` column (GIN index),
+  ranked with ts_rank, and a trigram index on the title for near matches
+
+Every query term matches as a word prefix, so "jo sm" finds "John Smith".
+Documents are kept current by ORM flush listeners; bulk writes call
+``index_records``. The index can be rebuilt with:
+
+    python -m app.services.search_service rebuild
+"""
+import argparse
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, event, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.base import Base
+from app.models.user import UserRole
+from app.core.principal import Principal
+from app.models.lead import Lead
+from app.models.customer import Customer
+from app.models.deal import Deal
+
+
+# (entity, entity_id, owner_id, title, body)
+SearchDocument = Tuple[str, int, Optional[int], str, str]
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+# Max terms used from a query
+MAX_TERMS = 8
+
+# Max IDs per IN (...) clause
+QUERY_CHUNK_SIZE = 500
+
+
+def _join(*values: Optional[str]) -> str:
+    return " ".join(value for value in values if value)
+
+
+def _lead_document(get: Callable[[str], Any]) -> Tuple[Optional[int], str, str]:
+    return get("assigned_to_id"), get("full_name") or "", _join(get("email"), get("phone"))
+
+
+def _customer_document(get: Callable[[str], Any]) -> Tuple[Optional[int], str, str]:
+    return (
+        get("assigned_to_id"),
+        get("full_name") or "",
+        _join(get("email"), get("phone"), get("company"))
+    )
+
+
+def _deal_document(get: Callable[[str], Any]) -> Tuple[Optional[int], str, str]:
+    return get("owner_id"), get("title") or "", ""
+
+
+# Indexed model -> (entity name, attributes read, document builder)
+TRACKED_MODELS: Dict[type, Tuple[str, Tuple[str, ...], Callable]] = {
+    Lead: ("lead", ("full_name", "email", "phone", "assigned_to_id"), _lead_document),
+    Customer: ("customer", ("full_name", "email", "phone", "company", "assigned_to_id"), _customer_document),
+    Deal: ("deal", ("title", "owner_id"), _deal_document),
+}
+
+ENTITY_MODELS = {entity: model for model, (entity, _, _) in TRACKED_MODELS.items()}
+
+
+def terms(query: str) -> List[str]:
+    """Lowercase word terms of a search query."""
+    return _TERM_PATTERN.findall(query.lower())[:MAX_TERMS]
+
+
+# ========== Backends ==========
+
+class SearchBackend:
+    """Storage and query interface for the search index."""
+
+    # Queries of one-letter terms only (the first keystroke of typeahead)
+    # match most of the index; they are ranked among their first matches
+    # in index order. Other queries rank every match.
+    CANDIDATE_LIMIT = 1000
+
+    @staticmethod
+    def _ranks_candidates(query_terms: List[str]) -> bool:
+        """Whether a query is ranked among its first CANDIDATE_LIMIT matches only."""
+        return all(len(term) == 1 for term in query_terms)
+
+    def create(self, connection: Connection) -> None:
+        """Create the index structures if they do not exist."""
+        raise NotImplementedError
+
+    def drop(self, connection: Connection) -> None:
+        """Drop the index structures."""
+        raise NotImplementedError
+
+    def clear(self, connection: Connection) -> None:
+        """Remove every document."""
+        connection.execute(text("DELETE FROM search_index"))
+
+    def delete(self, connection: Connection, entity: str, ids: Sequence[int]) -> None:
+        """Remove the documents of records."""
+        raise NotImplementedError
+
+    def insert(self, connection: Connection, documents: List[SearchDocument]) -> None:
+        """Add documents (existing ones must have been deleted)."""
+        raise NotImplementedError
+
+    def search(
+        self,
+        connection: Connection,
+        query_terms: List[str],
+        entities: Sequence[str],
+        owner_id: Optional[int],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Best matches for all terms, best first.
+
+        Returns:
+            List of dicts with entity, id, title, body and score
+        """
+        raise NotImplementedError
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    FTS5 virtual table. The rowid encodes (entity, entity_id) so documents
+    are replaced by rowid without a separate key index. Entity and owner
+    are stored as tokens so RBAC and entity filters are part of the full
+    text match instead of a scan over its results.
+    """
+
+    ENTITY_CODES = {"lead": 1, "customer": 2, "deal": 3}
+    CODE_SPACE = 8
+
+    # Ranking of the ``rank`` column, bm25 with column weights for entity,
+    # entity_id, owner, title, body
+    RANK = "bm25(0.0, 0.0, 0.0, 10.0, 1.0)"
+
+    def _rowid(self, entity: str, entity_id: int) -> int:
+        return entity_id * self.CODE_SPACE + self.ENTITY_CODES[entity]
+
+    @staticmethod
+    def _owner_token(owner_id: Optional[int]) -> str:
+        return f"u{owner_id or 0}"
+
+    def create(self, connection: Connection) -> None:
+        connection.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+            "entity, entity_id UNINDEXED, owner, title, body, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        ))
+
+    def drop(self, connection: Connection) -> None:
+        connection.execute(text("DROP TABLE IF EXISTS search_index"))
+
+    def delete(self, connection: Connection, entity: str, ids: Sequence[int]) -> None:
+        rowids = [self._rowid(entity, entity_id) for entity_id in ids]
+        statement = text("DELETE FROM search_index WHERE rowid IN :rowids").bindparams(
+            bindparam("rowids", expanding=True)
+        )
+        for start in range(0, len(rowids), QUERY_CHUNK_SIZE):
+            connection.execute(statement, {"rowids": rowids[start:start + QUERY_CHUNK_SIZE]})
+
+    def insert(self, connection: Connection, documents: List[SearchDocument]) -> None:
+        connection.execute(
+            text(
+                "INSERT INTO search_index (rowid, entity, entity_id, owner, title, body) "
+                "VALUES (:rowid, :entity, :entity_id, :owner, :title, :body)"
+            ),
+            [
+                {
+                    "rowid": self._rowid(entity, entity_id),
+                    "entity": entity,
+                    "entity_id": entity_id,
+                    "owner": self._owner_token(owner_id),
+                    "title": title,
+                    "body": body,
+                }
+                for entity, entity_id, owner_id, title, body in documents
+            ]
+        )
+
+    def search(self, connection, query_terms, entities, owner_id, limit):
+        match = "{title body} : (%s)" % " AND ".join(f'"{term}"*' for term in query_terms)
+        if set(entities) != set(self.ENTITY_CODES):
+            match += " AND entity : (%s)" % " OR ".join(f'"{entity}"' for entity in entities)
+        if owner_id is not None:
+            match += f' AND owner : "{self._owner_token(owner_id)}"'
+
+        sql = (
+            "SELECT entity, entity_id, title, body, rank FROM search_index "
+            "WHERE search_index MATCH :match AND rank MATCH :rank"
+        )
+        if self._ranks_candidates(query_terms):
+            sql = f"SELECT * FROM ({sql} LIMIT :candidates)"
+
+        rows = connection.execute(
+            text(f"{sql} ORDER BY rank LIMIT :limit"),
+            {"match": match, "rank": self.RANK, "candidates": self.CANDIDATE_LIMIT, "limit": limit}
+        )
+        return [
+            {"entity": entity, "id": entity_id, "title": title, "body": body, "score": round(-rank, 4)}
+            for entity, entity_id, title, body, rank in rows
+        ]
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Table with a generated, weighted tsvector (title A, body B) under a GIN
+    index, and a pg_trgm index on the title for misspelled names.
+    """
+
+    # Title similarity above which a document matches without all terms
+    SIMILARITY_THRESHOLD = 0.3
+
+    def create(self, connection: Connection) -> None:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        connection.execute(text(
+            "CREATE TABLE IF NOT EXISTS search_index ("
+            "entity VARCHAR(20) NOT NULL, "
+            "entity_id INTEGER NOT NULL, "
+            "owner_id INTEGER, "
+            "title TEXT NOT NULL DEFAULT '', "
+            "body TEXT NOT NULL DEFAULT '', "
+            "document TSVECTOR GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('simple', title), 'A') || "
+            "setweight(to_tsvector('simple', body), 'B')) STORED, "
+            "PRIMARY KEY (entity, entity_id))"
+        ))
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_search_index_document ON search_index USING gin (document)"
+        ))
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_search_index_title_trgm ON search_index "
+            "USING gin (title gin_trgm_ops)"
+        ))
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_search_index_owner_id ON search_index (owner_id)"
+        ))
+
+    def drop(self, connection: Connection) -> None:
+        connection.execute(text("DROP TABLE IF EXISTS search_index"))
+
+    def delete(self, connection: Connection, entity: str, ids: Sequence[int]) -> None:
+        statement = text(
+            "DELETE FROM search_index WHERE entity = :entity AND entity_id IN :ids"
+        ).bindparams(bindparam("ids", expanding=True))
+        for start in range(0, len(ids), QUERY_CHUNK_SIZE):
+            connection.execute(statement, {"entity": entity, "ids": list(ids[start:start + QUERY_CHUNK_SIZE])})
+
+    def insert(self, connection: Connection, documents: List[SearchDocument]) -> None:
+        connection.execute(
+            text(
+                "INSERT INTO search_index (entity, entity_id, owner_id, title, body) "
+                "VALUES (:entity, :entity_id, :owner_id, :title, :body)"
+            ),
+            [
+                {"entity": entity, "entity_id": entity_id, "owner_id": owner_id, "title": title, "body": body}
+                for entity, entity_id, owner_id, title, body in documents
+            ]
+        )
+
+    def search(self, connection, query_terms, entities, owner_id, limit):
+        sql = (
+            "SELECT entity, entity_id, title, body, "
+            "ts_rank(document, q) + similarity(title, :raw) AS score "
+            "FROM search_index, to_tsquery('simple', :tsquery) q "
+            "WHERE (document @@ q OR (title % :raw AND similarity(title, :raw) > :threshold)) "
+            "AND entity IN :entities"
+        )
+        params: Dict[str, Any] = {
+            "tsquery": " & ".join(f"{term}:*" for term in query_terms),
+            "raw": " ".join(query_terms),
+            "threshold": self.SIMILARITY_THRESHOLD,
+            "entities": list(entities),
+            "candidates": self.CANDIDATE_LIMIT,
+            "limit": limit,
+        }
+        if owner_id is not None:
+            sql += " AND owner_id = :owner_id"
+            params["owner_id"] = owner_id
+
+        if self._ranks_candidates(query_terms):
+            sql = f"SELECT * FROM ({sql} LIMIT :candidates) candidates"
+
+        rows = connection.execute(
+            text(f"{sql} ORDER BY score DESC LIMIT :limit").bindparams(bindparam("entities", expanding=True)),
+            params
+        )
+        return [
+            {"entity": entity, "id": entity_id, "title": title, "body": body, "score": round(float(score), 4)}
+            for entity, entity_id, title, body, score in rows
+        ]
+
+
+_BACKENDS = {
+    "sqlite": SQLiteSearchBackend(),
+    "postgresql": PostgresSearchBackend(),
+}
+
+
+def get_backend(connection: Connection) -> SearchBackend:
+    """
+    Search backend for a connection's database.
+
+    Raises:
+        NotImplementedError: If the database has no search backend
+    """
+    backend = _BACKENDS.get(connection.dialect.name)
+    if backend is None:
+        raise NotImplementedError(f"Full-text search is not supported on {connection.dialect.name}")
+    return backend
+
+
+def _after_create(target, connection: Connection, **kw) -> None:
+    """Create the index alongside the ORM tables (``metadata.create_all``)."""
+    backend = _BACKENDS.get(connection.dialect.name)
+    if backend is not None:
+        backend.create(connection)
+
+
+def _before_drop(target, connection: Connection, **kw) -> None:
+    """Drop the index with the ORM tables (``metadata.drop_all``)."""
+    backend = _BACKENDS.get(connection.dialect.name)
+    if backend is not None:
+        backend.drop(connection)
+
+
+# ========== Maintenance ==========
+
+def _write(connection: Connection, deleted: Dict[str, List[int]], documents: List[SearchDocument]) -> None:
+    """Remove deleted records' documents and replace the given ones."""
+    backend = _BACKENDS.get(connection.dialect.name)
+    if backend is None:
+        return
+
+    replaced: Dict[str, set] = {entity: set(ids) for entity, ids in deleted.items()}
+    for entity, entity_id, _, _, _ in documents:
+        replaced.setdefault(entity, set()).add(entity_id)
+
+    for entity, ids in replaced.items():
+        if ids:
+            backend.delete(connection, entity, sorted(ids))
+    if documents:
+        backend.insert(connection, documents)
+
+
+def _documents(model: type, rows: Iterable[Any]) -> List[SearchDocument]:
+    """Build documents from row mappings that include ``id``."""
+    entity, _, build = TRACKED_MODELS[model]
+    documents = []
+    for row in rows:
+        owner_id, title, body = build(row.get)
+        documents.append((entity, row["id"], owner_id, title, body))
+    return documents
+
+
+def index_records(connection: Connection, model: type, ids: Sequence[int]) -> int:
+    """
+    Re-index records written without the ORM unit of work (bulk writes),
+    which the flush listener does not see. IDs that no longer exist are
+    removed from the index.
+
+    Args:
+        connection: Connection participating in the current transaction
+        model: Lead, Customer or Deal
+        ids: Record IDs
+
+    Returns:
+        Number of documents written
+    """
+    entity, attrs, _ = TRACKED_MODELS[model]
+    columns = [model.id] + [getattr(model, attr) for attr in attrs]
+
+    documents = []
+    for start in range(0, len(ids), QUERY_CHUNK_SIZE):
+        chunk = list(ids[start:start + QUERY_CHUNK_SIZE])
+        rows = connection.execute(select(*columns).where(model.id.in_(chunk)))
+        documents.extend(_documents(model, (row._mapping for row in rows)))
+
+    _write(connection, {entity: list(ids)}, documents)
+    return len(documents)
+
+
+def rebuild(db: Session, batch_size: int = 5000) -> int:
+    """
+    Rebuild the whole index from the lead, customer and deal tables.
+
+    Args:
+        db: Database session
+        batch_size: Records fetched and written per batch
+
+    Returns:
+        Number of documents written
+    """
+    connection = db.connection()
+    backend = get_backend(connection)
+    backend.create(connection)
+    backend.clear(connection)
+
+    written = 0
+    for model, (_, attrs, _) in TRACKED_MODELS.items():
+        columns = [model.id] + [getattr(model, attr) for attr in attrs]
+        batch = []
+        for row in db.query(*columns).yield_per(batch_size):
+            batch.append(row._mapping)
+            if len(batch) >= batch_size:
+                backend.insert(connection, _documents(model, batch))
+                written += len(batch)
+                batch = []
+        if batch:
+            backend.insert(connection, _documents(model, batch))
+            written += len(batch)
+
+    db.commit()
+    return written
+
+
+# ========== Query ==========
+
+def search(
+    db: Session,
+    current_user: Principal,
+    query: str,
+    entities: Optional[Sequence[str]] = None,
+    limit: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Ranked search across leads, customers and deals.
+
+    Sales users only get records they own (assigned leads and customers,
+    deals they own), matching the list endpoints.
+
+    Args:
+        db: Database session
+        current_user: Principal searching
+        query: Search text; every word is matched as a prefix
+        entities: Entity names to search (default: all)
+        limit: Max results
+
+    Returns:
+        List of dicts with entity, id, title, body and score, best first
+    """
+    query_terms = terms(query)
+    if not query_terms:
+        return []
+
+    owner_id = current_user.id if current_user.role == UserRole.SALES else None
+    connection = db.connection()
+    return get_backend(connection).search(
+        connection,
+        query_terms,
+        list(entities or ENTITY_MODELS),
+        owner_id,
+        limit
+    )
+
+
+# ========== Incremental Maintenance ==========
+
+def _after_flush(session: Session, flush_context) -> None:
+    """Re-index records inserted, changed or deleted in this flush."""
+    deleted: Dict[str, List[int]] = {}
+    documents: List[SearchDocument] = []
+
+    changed = [obj for obj in session.new if type(obj) in TRACKED_MODELS]
+    for obj in session.dirty:
+        if type(obj) in TRACKED_MODELS:
+            state = inspect(obj)
+            attrs = TRACKED_MODELS[type(obj)][1]
+            if any(state.attrs[attr].history.has_changes() for attr in attrs):
+                changed.append(obj)
+
+    for obj in changed:
+        entity, _, build = TRACKED_MODELS[type(obj)]
+        owner_id, title, body = build(lambda attr: getattr(obj, attr))
+        documents.append((entity, obj.id, owner_id, title, body))
+
+    for obj in session.deleted:
+        tracked = TRACKED_MODELS.get(type(obj))
+        if tracked is not None:
+            deleted.setdefault(tracked[0], []).append(obj.id)
+
+    if deleted or documents:
+        _write(session.connection(), deleted, documents)
+
+
+def register_listeners() -> None:
+    """
+    Register the ORM session listener that keeps the index up to date, and
+    the metadata hooks that create and drop it with the other tables.
+    Safe to call more than once.
+    """
+    listeners = (
+        (Session, "after_flush", _after_flush),
+        (Base.metadata, "after_create", _after_create),
+        (Base.metadata, "before_drop", _before_drop),
+    )
+    for target, name, listener in listeners:
+        if not event.contains(target, name, listener):
+            event.listen(target, name, listener)
+
+
+if __name__ == "__main__":
+    from app.core.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Search index maintenance")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        written = rebuild(db, batch_size=args.batch_size)
+        print(f"Indexed {written} search documents")
+    finally:
+        db.close()
@@ -1,19 +1,43 @@
 """
 Business logic for task management.
 """
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
+from app.core.config import settings
+from app.core.pagination import CountMode
+from app.core.principal import Principal
+from app.crud.rows import ResponseRows
+from app.models.customer import Customer
+from app.models.deal import Deal
+from app.models.lead import Lead
 from app.models.task import Task, RelatedEntityType
 from app.models.user import User, UserRole
 from app.crud import task as task_crud
 from app.crud import lead as lead_crud
 from app.crud import customer as customer_crud
 from app.crud import deal as deal_crud
-from app.schemas.task import TaskCreate
+from app.services import batch_service, scheduler
+from app.schemas.common import BatchResponse
+from app.schemas.task import TaskCreate, TaskBatchOperation
+
+
+# Scheduler job marking pending past-due tasks overdue
+OVERDUE_SWEEP_JOB = "mark_overdue_tasks"
 
+# Models behind each related entity type
+RELATED_ENTITY_MODELS = {
+    RelatedEntityType.LEAD: Lead,
+    RelatedEntityType.CUSTOMER: Customer,
+    RelatedEntityType.DEAL: Deal
+}
 
-def can_user_access_task(user: User, task: Task) -> bool:
+
+def can_user_access_task(user: Principal, task: Task) -> bool:
     """
     Check if user can access a specific task.
     
@@ -39,7 +63,7 @@ def can_user_access_task(user: User, task: Task) -> bool:
     return False
 
 
-def can_user_modify_task(user: User, task: Task) -> bool:
+def can_user_modify_task(user: Principal, task: Task) -> bool:
     """
     Check if user can modify a specific task.
     
@@ -57,7 +81,7 @@ def can_user_modify_task(user: User, task: Task) -> bool:
     return can_user_access_task(user, task)
 
 
-def can_user_delete_task(user: User) -> bool:
+def can_user_delete_task(user: Principal) -> bool:
     """
     Check if user can delete tasks.
     
@@ -74,7 +98,7 @@ def can_user_delete_task(user: User) -> bool:
     return user.role in [UserRole.ADMIN, UserRole.MANAGER]
 
 
-def can_user_assign_task(user: User) -> bool:
+def can_user_assign_task(user: Principal) -> bool:
     """
     Check if user can assign tasks.
     
@@ -91,21 +115,16 @@ def can_user_assign_task(user: User) -> bool:
     return user.role in [UserRole.ADMIN, UserRole.MANAGER]
 
 
-def validate_task_assignee(db: Session, assigned_to_id: int) -> None:
+def check_task_assignee(user: Optional[User]) -> None:
     """
-    Validate that the task assignee exists and is active.
+    Check that a loaded user can be assigned tasks.
     
     Args:
-        db: Database session
-        assigned_to_id: User ID to assign task to
+        user: User to assign task to, None if not found
         
     Raises:
         HTTPException: If user doesn't exist or is inactive
     """
-    from app.crud import user as user_crud
-    
-    user = user_crud.get_user(db, user_id=assigned_to_id)
-    
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -119,6 +138,40 @@ def validate_task_assignee(db: Session, assigned_to_id: int) -> None:
         )
 
 
+def validate_task_assignee(db: Session, assigned_to_id: int) -> None:
+    """
+    Validate that the task assignee exists and is active.
+    
+    Args:
+        db: Database session
+        assigned_to_id: User ID to assign task to
+        
+    Raises:
+        HTTPException: If user doesn't exist or is inactive
+    """
+    from app.crud import user as user_crud
+    
+    check_task_assignee(user_crud.get_user(db, user_id=assigned_to_id))
+
+
+def check_related_entity(related_type: RelatedEntityType, entity: Optional[object]) -> None:
+    """
+    Check that a looked-up related entity exists.
+    
+    Args:
+        related_type: Type of related entity
+        entity: Related entity, None if not found
+        
+    Raises:
+        HTTPException: If entity doesn't exist
+    """
+    if not entity:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{RELATED_ENTITY_MODELS[related_type].__name__} not found"
+        )
+
+
 def validate_related_entity(db: Session, related_type: RelatedEntityType, related_id: int) -> None:
     """
     Validate that the related entity exists.
@@ -133,27 +186,38 @@ def validate_related_entity(db: Session, related_type: RelatedEntityType, relate
     """
     if related_type == RelatedEntityType.LEAD:
         entity = lead_crud.get_lead(db, lead_id=related_id)
-        entity_name = "Lead"
     elif related_type == RelatedEntityType.CUSTOMER:
         entity = customer_crud.get_customer(db, customer_id=related_id)
-        entity_name = "Customer"
     elif related_type == RelatedEntityType.DEAL:
         entity = deal_crud.get_deal(db, deal_id=related_id)
-        entity_name = "Deal"
     else:
         return
     
-    if not entity:
+    check_related_entity(related_type, entity)
+
+
+def check_related_pair(related_type: Optional[RelatedEntityType], related_id: Optional[int]) -> None:
+    """
+    Check that related_type and related_id are given together or not at all.
+    
+    Args:
+        related_type: Type of related entity
+        related_id: ID of related entity
+        
+    Raises:
+        HTTPException: If only one of them is given
+    """
+    if (related_type and not related_id) or (not related_type and related_id):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{entity_name} not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Both related_type and related_id must be provided together"
         )
 
 
 def create_task_with_validation(
     db: Session,
     task: TaskCreate,
-    current_user: User
+    current_user: Principal
 ) -> Task:
     """
     Create a task with business logic validation.
@@ -161,7 +225,7 @@ def create_task_with_validation(
     Args:
         db: Database session
         task: Task creation data
-        current_user: User creating the task
+        current_user: Principal creating the task
         
     Returns:
         Created Task object
@@ -173,28 +237,114 @@ def create_task_with_validation(
     validate_task_assignee(db, task.assigned_to_id)
     
     # Validate related entity if specified
+    check_related_pair(task.related_type, task.related_id)
     if task.related_type and task.related_id:
         validate_related_entity(db, task.related_type, task.related_id)
-    elif (task.related_type and not task.related_id) or (not task.related_type and task.related_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Both related_type and related_id must be provided together"
-        )
     
     # Create task
     return task_crud.create_task(db, task, created_by_id=current_user.id)
 
 
+def _fetch_related_entities(db: Session, operations: List[TaskBatchOperation]) -> Dict[RelatedEntityType, dict]:
+    """Load the entities referenced by batch operations, one query per type."""
+    ids = defaultdict(set)
+    
+    for operation in operations:
+        data = getattr(operation, "data", None)
+        if data is not None and data.related_type and data.related_id:
+            ids[data.related_type].add(data.related_id)
+    
+    return {
+        related_type: batch_service.fetch_by_ids(db, RELATED_ENTITY_MODELS[related_type], ids[related_type])
+        for related_type in RELATED_ENTITY_MODELS
+    }
+
+
+def apply_task_batch(
+    db: Session,
+    operations: List[TaskBatchOperation],
+    current_user: Principal
+) -> BatchResponse:
+    """
+    Apply a batch of task operations in one transaction.
+    
+    Each operation gets the checks of its single-record endpoint (create,
+    update, status, assign), against tasks, assignees and related entities
+    loaded with one query each. Rejected operations are reported and skipped.
+    
+    Args:
+        db: Database session
+        operations: Task operations, applied in order
+        current_user: Principal running the batch
+        
+    Returns:
+        BatchResponse with per-operation results
+    """
+    tasks = batch_service.fetch_by_ids(db, Task, batch_service.referenced_ids(operations, "id"))
+    users = batch_service.fetch_by_ids(db, User, batch_service.referenced_ids(operations, "assigned_to_id"))
+    related = _fetch_related_entities(db, operations)
+    
+    def apply(operation):
+        if operation.op == "create":
+            data = operation.data
+            check_task_assignee(users.get(data.assigned_to_id))
+            check_related_pair(data.related_type, data.related_id)
+            if data.related_type and data.related_id:
+                check_related_entity(data.related_type, related[data.related_type].get(data.related_id))
+            
+            task = task_crud.build_task(data, created_by_id=current_user.id)
+            db.add(task)
+            return task
+        
+        if operation.op == "assign" and not can_user_assign_task(current_user):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Admin or Manager access required. Your role: {current_user.role.value}"
+            )
+        
+        task = batch_service.get_or_404(tasks, operation.id, "Task")
+        
+        if operation.op == "assign":
+            check_task_assignee(users.get(operation.assigned_to_id))
+            task.assigned_to_id = operation.assigned_to_id
+            return task
+        
+        if not can_user_modify_task(current_user, task):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to modify this task"
+            )
+        
+        if operation.op == "status":
+            task.status = operation.status
+            return task
+        
+        data = operation.data
+        if data.assigned_to_id is not None:
+            check_task_assignee(users.get(data.assigned_to_id))
+        if data.related_type and data.related_id:
+            check_related_entity(data.related_type, related[data.related_type].get(data.related_id))
+        
+        batch_service.apply_fields(task, data)
+        return task
+    
+    return batch_service.run_batch(db, operations, apply)
+
+
 def get_tasks_for_user(
     db: Session,
-    user: User,
+    user: Principal,
     skip: int = 0,
     limit: int = 100,
     status: str = None,
     priority: str = None,
     related_type: str = None,
     related_id: int = None,
-    search: str = None
+    search: str = None,
+    cursor: str = None,
+    count_mode: CountMode = CountMode.EXACT,
+    options: tuple = (),
+    rows: ResponseRows = None
 ):
     """
     Get tasks based on user permissions.
@@ -209,13 +359,14 @@ def get_tasks_for_user(
         related_type: Filter by related entity type
         related_id: Filter by related entity ID
         search: Search term
+        cursor: Keyset pagination cursor (replaces skip)
+        count_mode: How to compute the total
+        options: Loader options for the response schema
+        rows: Row selection (``response_rows``) to return rows instead of ORM objects
         
     Returns:
         Tuple of (tasks, total)
     """
-    # Auto-update overdue tasks
-    task_crud.update_overdue_tasks(db)
-    
     # Admin and Manager see all tasks
     if user.role in [UserRole.ADMIN, UserRole.MANAGER]:
         return task_crud.get_tasks(
@@ -226,7 +377,11 @@ def get_tasks_for_user(
             priority=priority,
             related_type=related_type,
             related_id=related_id,
-            search=search
+            search=search,
+            cursor=cursor,
+            count_mode=count_mode,
+            options=options,
+            rows=rows
         )
     
     # Sales only see assigned tasks
@@ -239,5 +394,90 @@ def get_tasks_for_user(
         related_type=related_type,
         related_id=related_id,
         search=search,
+        cursor=cursor,
+        count_mode=count_mode,
+        options=options,
+        rows=rows,
         assigned_to_id=user.id
     )
+
+
+async def get_tasks_for_user_async(db: AsyncSession, user: Principal, **filters):
+    """
+    ``get_tasks_for_user`` on an async session, taking the same filters.
+    
+    Args:
+        db: Async database session
+        user: Current user
+        **filters: Pagination, filter and loader arguments of ``get_tasks_for_user``
+        
+    Returns:
+        Tuple of (tasks, total)
+    """
+    return await db.run_sync(get_tasks_for_user, user, **filters)
+
+
+# Columns of task exports, primary key first
+EXPORT_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.assigned_to_id,
+    Task.created_by_id,
+    Task.related_type,
+    Task.related_id,
+    Task.due_date,
+    Task.priority,
+    Task.status,
+    Task.created_at,
+    Task.updated_at
+)
+
+
+def get_tasks_export_query(
+    db: Session,
+    user: Principal,
+    status: str = None,
+    priority: str = None,
+    related_type: str = None,
+    related_id: int = None,
+    search: str = None
+):
+    """
+    Build the query of tasks a user may export.
+    
+    Args:
+        db: Database session
+        user: Current user
+        status: Filter by status
+        priority: Filter by priority
+        related_type: Filter by related entity type
+        related_id: Filter by related entity ID
+        search: Search term
+        
+    Returns:
+        Filtered task query, limited to assigned tasks for sales users
+    """
+    filters = dict(
+        status=status,
+        priority=priority,
+        related_type=related_type,
+        related_id=related_id,
+        search=search
+    )
+    
+    # Admin and Manager export all tasks
+    if user.role in [UserRole.ADMIN, UserRole.MANAGER]:
+        return task_crud.tasks_query(db, **filters)
+    
+    # Sales only export assigned tasks
+    return task_crud.tasks_query(db, assigned_to_id=user.id, **filters)
+
+
+def register_jobs() -> None:
+    """Register the periodic task maintenance jobs with the scheduler."""
+    scheduler.register_job(
+        OVERDUE_SWEEP_JOB,
+        settings.OVERDUE_SWEEP_INTERVAL_SECONDS,
+        task_crud.update_overdue_tasks
+    )
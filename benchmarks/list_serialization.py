@@ -0,0 +1,152 @@
+"""
+Benchmark of the lead list serialization paths.
+
+Builds the same page of leads two ways and times each:
+
+- ORM objects (with ``response_options``) validated through
+  ``LeadListResponse.model_validate`` and rendered by ``JSONResponse``,
+  as FastAPI does for an endpoint with a ``response_model``
+- row tuples from ``response_rows(Lead, LeadResponse)`` turned into dicts
+  by ``to_dicts`` and rendered by ``FastJSONResponse``, as ``GET /leads/``
+  does
+
+Both are timed with and without the SQL, and their JSON payloads must be
+equal. Runs on a throwaway SQLite database:
+
+    python -m benchmarks.list_serialization [--rows 500] [--repeat 50]
+"""
+import argparse
+import json
+import os
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+
+_db_dir = tempfile.mkdtemp(prefix="crm-benchmark-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/benchmark.db"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["LOG_LEVEL"] = "WARNING"
+
+from fastapi.responses import JSONResponse
+
+from app.core.database import SessionLocal, engine
+from app.core.pagination import CountMode
+from app.core.responses import FastJSONResponse
+from app.crud import lead as lead_crud
+from app.crud.loading import response_options
+from app.crud.rows import response_rows
+from app.models import Base, Lead, LeadSource, LeadStatus, User
+from app.models.user import UserRole
+from app.schemas.lead import LeadListResponse, LeadResponse
+
+
+def seed(rows: int) -> None:
+    """Create the schema, a few users and ``rows`` leads assigned among them."""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        users = [
+            User(full_name=f"User {i}", email=f"user{i}@example.com", hashed_password="-", role=UserRole.SALES)
+            for i in range(5)
+        ]
+        db.add_all(users)
+        db.flush()
+
+        sources, statuses = list(LeadSource), list(LeadStatus)
+        base = datetime(2025, 1, 1)
+        db.add_all(
+            Lead(
+                full_name=f"Lead {i}",
+                email=f"lead{i}@example.com",
+                phone=f"555{i:07d}",
+                source=sources[i % len(sources)],
+                status=statuses[i % len(statuses)],
+                assigned_to_id=users[i % len(users)].id if i % 3 else None,
+                created_by_id=users[0].id,
+                created_at=base + timedelta(minutes=i, microseconds=i)
+            )
+            for i in range(rows)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _page(leads: list, limit: int) -> dict:
+    return {"total": None, "count_mode": CountMode.NONE, "skip": 0, "limit": limit, "leads": leads, "next_cursor": None}
+
+
+def fetch_orm(db, limit: int) -> list:
+    """The page as ORM objects with their relationships loaded."""
+    leads, _ = lead_crud.get_leads(
+        db, limit=limit, count_mode=CountMode.NONE, options=response_options(Lead, LeadResponse)
+    )
+    return leads
+
+
+def render_orm(leads: list, limit: int) -> bytes:
+    """Validate ORM objects through the response model and render them."""
+    content = LeadListResponse.model_validate(_page(leads, limit)).model_dump(mode="json")
+    return JSONResponse(content).body
+
+
+def fetch_rows(db, limit: int) -> list:
+    """The page as row tuples of the response schema's columns."""
+    leads, _ = lead_crud.get_leads(
+        db, limit=limit, count_mode=CountMode.NONE, rows=response_rows(Lead, LeadResponse)
+    )
+    return leads
+
+
+def render_rows(leads: list, limit: int) -> bytes:
+    """Build response dicts from rows and render them with orjson."""
+    return FastJSONResponse(_page(response_rows(Lead, LeadResponse).to_dicts(leads), limit)).body
+
+
+def _best(run, repeat: int) -> float:
+    """Best time of one call, in milliseconds."""
+    return min(timeit.repeat(run, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=500, help="Leads per page")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed runs per path (best is reported)")
+    args = parser.parse_args()
+
+    seed(args.rows)
+    db = SessionLocal()
+    try:
+        orm_leads = fetch_orm(db, args.rows)
+        rows = fetch_rows(db, args.rows)
+        assert len(orm_leads) == len(rows) == args.rows
+
+        orm_payload = json.loads(render_orm(orm_leads, args.rows))
+        rows_payload = json.loads(render_rows(rows, args.rows))
+        assert orm_payload == rows_payload, "The two paths produced different JSON"
+
+        def orm_request():
+            db.expunge_all()
+            render_orm(fetch_orm(db, args.rows), args.rows)
+
+        def rows_request():
+            db.expunge_all()
+            render_rows(fetch_rows(db, args.rows), args.rows)
+
+        timings = [
+            ("serialization", _best(lambda: render_orm(orm_leads, args.rows), args.repeat),
+             _best(lambda: render_rows(rows, args.rows), args.repeat)),
+            ("query + serialization", _best(orm_request, args.repeat), _best(rows_request, args.repeat)),
+        ]
+    finally:
+        db.close()
+
+    print(f"{args.rows}-lead page, best of {args.repeat} runs; JSON payloads equal")
+    print(f"{'':<24}{'model_validate':>16}{'response_rows':>16}{'speedup':>10}")
+    for name, orm_ms, rows_ms in timings:
+        print(f"{name:<24}{orm_ms:>13.2f} ms{rows_ms:>13.2f} ms{orm_ms / rows_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Shared fixtures: a throwaway SQLite database, the app's TestClient and a
+seeded CRM data set.
+
+Settings and engines are created when ``app`` is imported, so the test
+environment is set up here, before any test module imports it.
+"""
+import os
+import random
+import tempfile
+from datetime import date, datetime, timedelta
+
+_test_dir = tempfile.mkdtemp(prefix="crm-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_test_dir}/test.db"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["IMPORT_SPOOL_DIR"] = os.path.join(_test_dir, "spool")
+os.environ["ENVIRONMENT"] = "test"
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["BCRYPT_ROUNDS"] = "4"  # bcrypt's minimum, keeps logins fast
+os.environ["LOG_LEVEL"] = "WARNING"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.database import SessionLocal, engine
+from app.core.security import hash_password
+from app.models import (
+    Base, User, Lead, LeadNote, LeadStatus, LeadSource, Customer, CustomerInteraction,
+    InteractionType, Deal, DealStage, Task, TaskPriority, TaskStatus, RelatedEntityType
+)
+from app.models.user import UserRole
+
+
+PASSWORD = "secret123"
+
+USERS = {
+    "admin": ("admin@example.com", UserRole.ADMIN),
+    "manager": ("manager@example.com", UserRole.MANAGER),
+    "sales": ("sales@example.com", UserRole.SALES),
+    "sales2": ("sales2@example.com", UserRole.SALES),
+}
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Engine of the test database, with all tables created."""
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture
+def db(db_engine):
+    """Session on the test database."""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def client(db_engine):
+    """TestClient for the app (without its lifespan: no background workers)."""
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def users(db_engine):
+    """One user per role: name -> user ID."""
+    db = SessionLocal()
+    try:
+        hashed = hash_password(PASSWORD)
+        created = {
+            name: User(full_name=name.title(), email=email, hashed_password=hashed, role=role)
+            for name, (email, role) in USERS.items()
+        }
+        db.add_all(created.values())
+        db.commit()
+        return {name: user.id for name, user in created.items()}
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client, users):
+    """Authorization headers of a test user by name, e.g. ``auth_headers("sales")``."""
+    tokens = {}
+
+    def headers(name: str) -> dict:
+        if name not in tokens:
+            response = client.post(
+                "/api/v1/auth/login",
+                json={"email": USERS[name][0], "password": PASSWORD}
+            )
+            assert response.status_code == 200, response.text
+            tokens[name] = response.json()["access_token"]
+        return {"Authorization": f"Bearer {tokens[name]}"}
+
+    return headers
+
+
+@pytest.fixture(scope="session")
+def crm_data(users):
+    """
+    Several hundred leads, customers, deals and tasks with their
+    relationships (owners, customers from leads, notes, interactions,
+    related entities), some of each owned by the sales users.
+    """
+    rng = random.Random(7)
+    owners = [users["manager"], users["sales"], users["sales2"]]
+    base = datetime(2025, 1, 1)
+    counts = {"leads": 400, "customers": 300, "deals": 400, "tasks": 400}
+    db = SessionLocal()
+
+    try:
+        leads = [
+            Lead(
+                full_name=f"Lead {i}",
+                email=f"lead{i}@example.com",
+                phone=f"555{i:07d}",
+                source=rng.choice(list(LeadSource)),
+                status=rng.choice(list(LeadStatus)),
+                assigned_to_id=rng.choice(owners + [None]),
+                created_by_id=users["admin"],
+                created_at=base + timedelta(hours=rng.randint(0, 8000))
+            )
+            for i in range(counts["leads"])
+        ]
+        db.add_all(leads)
+        db.flush()
+
+        db.add_all(
+            LeadNote(lead_id=lead.id, user_id=users["admin"], note_text=f"Note on {lead.full_name}")
+            for lead in leads[::4]
+        )
+
+        customers = [
+            Customer(
+                full_name=f"Customer {i}",
+                email=f"customer{i}@example.com",
+                company=f"Company {i % 40}",
+                lead_id=leads[i].id if i % 2 else None,
+                assigned_to_id=rng.choice(owners),
+                created_by_id=users["admin"],
+                created_at=base + timedelta(hours=rng.randint(0, 8000))
+            )
+            for i in range(counts["customers"])
+        ]
+        db.add_all(customers)
+        db.flush()
+
+        db.add_all(
+            CustomerInteraction(
+                customer_id=customer.id,
+                interaction_type=rng.choice(list(InteractionType)),
+                subject=f"Call with {customer.full_name}",
+                description="Discussed the renewal",
+                user_id=users["admin"]
+            )
+            for customer in customers[::3]
+        )
+
+        deals = [
+            Deal(
+                title=f"Deal {i}",
+                customer_id=rng.choice(customers).id,
+                owner_id=rng.choice(owners),
+                stage=rng.choice(list(DealStage)),
+                value=rng.randint(100, 100000) + 0.25,
+                probability=rng.randint(0, 100),
+                created_at=base + timedelta(hours=rng.randint(0, 8000))
+            )
+            for i in range(counts["deals"])
+        ]
+        db.add_all(deals)
+        db.flush()
+
+        related = (
+            [(RelatedEntityType.LEAD, lead.id) for lead in leads[:50]]
+            + [(RelatedEntityType.CUSTOMER, customer.id) for customer in customers[:50]]
+            + [(RelatedEntityType.DEAL, deal.id) for deal in deals[:50]]
+            + [(None, None)] * 50
+        )
+        for i in range(counts["tasks"]):
+            related_type, related_id = rng.choice(related)
+            db.add(Task(
+                title=f"Task {i}",
+                assigned_to_id=rng.choice(owners),
+                created_by_id=users["admin"],
+                due_date=date.today() + timedelta(days=rng.randint(-30, 30)) if i % 5 else None,
+                priority=rng.choice(list(TaskPriority)),
+                status=rng.choice(list(TaskStatus)),
+                related_type=related_type,
+                related_id=related_id,
+                created_at=base + timedelta(hours=rng.randint(0, 8000))
+            ))
+
+        db.commit()
+        return counts
+    finally:
+        db.close()
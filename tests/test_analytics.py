@@ -0,0 +1,16 @@
+"""
+Analytics endpoints under RBAC.
+"""
+import pytest
+
+
+@pytest.mark.parametrize("role", ["admin", "sales"])
+def test_sales_performance(client, auth_headers, users, crm_data, role):
+    response = client.get("/api/v1/analytics/sales-performance", headers=auth_headers(role))
+
+    assert response.status_code == 200, response.text
+    user_ids = [user["user_id"] for user in response.json()["users"]]
+    if role == "sales":
+        assert user_ids == [users["sales"]]
+    else:
+        assert users["sales"] in user_ids and users["admin"] not in user_ids
@@ -0,0 +1,78 @@
+"""
+CSV encoding detection and streaming in the import analyzer.
+"""
+import io
+
+import pandas as pd
+
+from app.services.lead_import.analyzer import AnalyzerService
+
+
+class CountingReader(io.BytesIO):
+    """BytesIO recording how many bytes were read."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def _rows(count: int, name: str = "Zoë", start: int = 0) -> str:
+    return "".join(f"{name} {i},person{start + i}@example.com\n" for i in range(count))
+
+
+def test_detect_encoding_reads_first_block_only():
+    data = ("name,email\n" + _rows(20000)).encode("utf-8")
+    assert len(data) > 4 * AnalyzerService.SNIFF_BYTES
+    source = CountingReader(data)
+
+    assert AnalyzerService.detect_encoding(source) == "utf-8"
+    assert source.bytes_read <= AnalyzerService.SNIFF_BYTES
+    assert source.tell() == 0
+
+
+def test_detect_encoding_ignores_character_cut_at_block_end():
+    # "ë" is two bytes in UTF-8; put its first byte last in the block
+    prefix = b"a" * (AnalyzerService.SNIFF_BYTES - 1)
+    data = prefix + "ë,x\n".encode("utf-8")
+    assert data[AnalyzerService.SNIFF_BYTES - 1:AnalyzerService.SNIFF_BYTES] == "ë".encode("utf-8")[:1]
+
+    assert AnalyzerService.detect_encoding(io.BytesIO(data)) == "utf-8"
+
+
+def test_detect_encoding_latin1():
+    data = ("name,email\n" + _rows(10)).encode("latin-1")
+    assert AnalyzerService.detect_encoding(io.BytesIO(data)) == "latin-1"
+
+
+def test_iter_chunks_utf8():
+    text = "name,email\n" + _rows(2500)
+    chunks = list(AnalyzerService.iter_chunks(io.BytesIO(text.encode("utf-8")), "csv", chunk_rows=1000))
+
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks),
+        pd.read_csv(io.StringIO(text), dtype=str)
+    )
+
+
+def test_iter_chunks_falls_back_to_latin1_after_sniffed_block():
+    # UTF-8 (ASCII) well past the sniffed block, then latin-1 rows
+    head = _rows(20000, name="Plain")
+    tail = _rows(30, name="Zoë", start=20000)
+    data = ("name,email\n" + head).encode("utf-8") + tail.encode("latin-1")
+    assert len(head) > 4 * AnalyzerService.SNIFF_BYTES
+
+    chunks = list(AnalyzerService.iter_chunks(io.BytesIO(data), "csv", chunk_rows=3000))
+    df = pd.concat(chunks, ignore_index=True)
+
+    assert len(df) == 20030
+    assert df["name"].iloc[0] == "Plain 0"
+    assert df["name"].iloc[19999] == "Plain 19999"
+    assert df["name"].iloc[20000] == "Zoë 0"
+    assert df["name"].iloc[-1] == "Zoë 29"
+    assert df["email"].is_unique
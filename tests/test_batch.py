@@ -0,0 +1,196 @@
+"""
+The /leads, /deals and /tasks batch endpoints.
+"""
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import Customer, Deal, DealStage, Lead, LeadStatus, Task, TaskStatus
+from app.services import batch_service
+
+
+@pytest.fixture
+def records(db_engine, users):
+    """
+    Fresh leads, a deal and a task of each sales user:
+    name -> ID, e.g. ``records["lead_sales"]``.
+    """
+    db = SessionLocal()
+    try:
+        customer = Customer(full_name="Batch Customer", email="batch@example.com", created_by_id=users["admin"])
+        db.add(customer)
+        db.flush()
+
+        created = {}
+        for owner in ("sales", "sales2"):
+            created[f"lead_{owner}"] = Lead(
+                full_name=f"Batch Lead {owner}",
+                email=f"batch.{owner}@example.com",
+                assigned_to_id=users[owner],
+                created_by_id=users["admin"]
+            )
+            created[f"deal_{owner}"] = Deal(
+                title=f"Batch Deal {owner}",
+                customer_id=customer.id,
+                owner_id=users[owner],
+                value=1000
+            )
+            created[f"task_{owner}"] = Task(
+                title=f"Batch Task {owner}",
+                assigned_to_id=users[owner],
+                created_by_id=users["admin"]
+            )
+        for i in range(3):
+            created[f"lead_{i}"] = Lead(
+                full_name=f"Batch Lead {i}",
+                email=f"batch{i}@example.com",
+                created_by_id=users["admin"]
+            )
+
+        db.add_all(created.values())
+        db.commit()
+        return {name: record.id for name, record in created.items()}
+    finally:
+        db.close()
+
+
+def _batch(client, headers, entity, operations):
+    return client.post(f"/api/v1/{entity}/batch", json={"operations": operations}, headers=headers)
+
+
+def _results(response):
+    assert response.status_code == 200, response.text
+    return [(result["status_code"], result["success"]) for result in response.json()["results"]]
+
+
+# ========== Per-operation Results ==========
+
+def test_mixed_valid_and_invalid_operations(client, auth_headers, db, users, records):
+    response = _batch(client, auth_headers("admin"), "leads", [
+        {"op": "create", "data": {"full_name": "Batch Created", "email": "created@example.com"}},
+        {"op": "status", "id": records["lead_0"], "status": "Contacted"},
+        {"op": "update", "id": 999999, "data": {"full_name": "Missing"}},
+        {"op": "assign", "id": records["lead_1"], "assigned_to_id": users["admin"]},
+        {"op": "assign", "id": records["lead_1"], "assigned_to_id": 999999},
+        {"op": "update", "id": records["lead_2"], "data": {"full_name": "Renamed", "assigned_to_id": users["sales"]}},
+    ])
+
+    assert _results(response) == [
+        (201, True),
+        (200, True),
+        (404, False),
+        (400, False),
+        (404, False),
+        (200, True),
+    ]
+    body = response.json()
+    assert (body["total"], body["succeeded"], body["failed"]) == (6, 3, 3)
+
+    created = db.get(Lead, body["results"][0]["id"])
+    assert created.full_name == "Batch Created"
+    assert created.created_by_id == users["admin"]
+    assert db.get(Lead, records["lead_0"]).status == LeadStatus.CONTACTED
+    assert db.get(Lead, records["lead_1"]).assigned_to_id is None
+    renamed = db.get(Lead, records["lead_2"])
+    assert (renamed.full_name, renamed.assigned_to_id) == ("Renamed", users["sales"])
+
+
+@pytest.mark.parametrize("error,status_code", [
+    (ValueError("Invalid value"), 422),
+    (OperationalError("SELECT 1", {}, Exception("database is locked")), 500),
+])
+def test_unexpected_error_reported_without_partial_changes(
+    client, auth_headers, db, records, monkeypatch, error, status_code
+):
+    apply_fields = batch_service.apply_fields
+
+    def failing_apply_fields(record, update):
+        apply_fields(record, update)
+        if record.full_name == "Fails":
+            raise error
+
+    monkeypatch.setattr(batch_service, "apply_fields", failing_apply_fields)
+
+    response = _batch(client, auth_headers("admin"), "leads", [
+        {"op": "create", "data": {"full_name": "Before Failure", "email": "before@example.com"}},
+        {"op": "update", "id": records["lead_0"], "data": {"full_name": "First"}},
+        {"op": "update", "id": records["lead_1"], "data": {"full_name": "Fails", "status": "Lost"}},
+        {"op": "update", "id": records["lead_2"], "data": {"full_name": "After"}},
+    ])
+
+    assert _results(response) == [(201, True), (200, True), (status_code, False), (200, True)]
+    assert db.get(Lead, response.json()["results"][0]["id"]).full_name == "Before Failure"
+    assert db.get(Lead, records["lead_0"]).full_name == "First"
+    failed = db.get(Lead, records["lead_1"])
+    assert (failed.full_name, failed.status) == ("Batch Lead 1", LeadStatus.NEW)
+    assert db.get(Lead, records["lead_2"]).full_name == "After"
+
+
+# ========== Permissions ==========
+
+@pytest.mark.parametrize("entity,operation,model,field,unchanged", [
+    ("leads", {"op": "status", "status": "Contacted"}, Lead, "status", LeadStatus.NEW),
+    ("deals", {"op": "stage", "stage": "Proposal"}, Deal, "stage", DealStage.PROSPECTING),
+    ("tasks", {"op": "status", "status": "Completed"}, Task, "status", TaskStatus.PENDING),
+])
+def test_sales_user_only_modifies_own_records(
+    client, auth_headers, db, records, entity, operation, model, field, unchanged
+):
+    prefix = entity[:-1]
+    own, other = records[f"{prefix}_sales"], records[f"{prefix}_sales2"]
+
+    response = _batch(client, auth_headers("sales"), entity, [
+        {**operation, "id": other},
+        {**operation, "id": own},
+    ])
+
+    assert _results(response) == [(403, False), (200, True)]
+    assert getattr(db.get(model, other), field) == unchanged
+    assert getattr(db.get(model, own), field) != unchanged
+
+
+@pytest.mark.parametrize("entity,field", [
+    ("leads", "assigned_to_id"),
+    ("deals", "owner_id"),
+    ("tasks", "assigned_to_id"),
+])
+def test_sales_user_cannot_assign(client, auth_headers, users, records, entity, field):
+    operation = {"op": "assign", "id": records[f"{entity[:-1]}_sales"], field: users["sales2"]}
+
+    response = _batch(client, auth_headers("sales"), entity, [operation])
+
+    assert _results(response) == [(403, False)]
+
+
+# ========== Transaction ==========
+
+def test_conflict_rolls_back_every_operation(client, auth_headers, db, records):
+    response = _batch(client, auth_headers("admin"), "leads", [
+        {"op": "create", "data": {"full_name": "Never Created", "email": "never@example.com"}},
+        {"op": "status", "id": records["lead_0"], "status": "Contacted"},
+        # Passes the checks, rejected by the NOT NULL constraint on flush
+        {"op": "update", "id": records["lead_1"], "data": {"full_name": None}},
+    ])
+
+    assert response.status_code == 409, response.text
+    assert db.get(Lead, records["lead_0"]).status == LeadStatus.NEW
+    assert db.get(Lead, records["lead_1"]).full_name == "Batch Lead 1"
+    assert db.query(Lead).filter(Lead.full_name == "Never Created").count() == 0
+
+
+@pytest.mark.parametrize("entity", ["leads", "deals", "tasks"])
+def test_batch_size_limit(client, auth_headers, records, entity):
+    prefix = entity[:-1]
+    operation = {
+        "leads": {"op": "status", "status": "Contacted"},
+        "deals": {"op": "stage", "stage": "Proposal"},
+        "tasks": {"op": "status", "status": "Completed"},
+    }[entity]
+    operations = [{**operation, "id": records[f"{prefix}_sales"]}] * (settings.BATCH_MAX_OPERATIONS + 1)
+
+    response = _batch(client, auth_headers("admin"), entity, operations)
+    assert response.status_code == 422
+
+    response = _batch(client, auth_headers("admin"), entity, [])
+    assert response.status_code == 422
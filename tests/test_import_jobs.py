@@ -0,0 +1,107 @@
+"""
+Resuming lead import preparation after an interrupted run.
+"""
+import io
+
+import pytest
+
+from app.models.import_job import ImportJob, JobStatus
+from app.models.import_session import ImportSession, ImportStatus
+from app.services.job_runner import JobContext
+from app.services.lead_import import import_jobs
+from app.services.lead_import.analyzer import AnalyzerService
+from app.services.lead_import.normalizer import NormalizerService
+from app.services.lead_import.session_manager import SessionManager, spool
+
+
+ROWS = 35
+CHUNK_ROWS = 10
+
+
+class Interrupted(Exception):
+    """Stands in for a worker dying mid-job."""
+
+
+def _csv() -> bytes:
+    lines = ["Name,Email,Phone"]
+    for i in range(ROWS):
+        email = f"import{i}@example.com" if i % 7 else f"not-an-email-{i}"
+        lines.append(f"Person {i},{email},555-010-{i:04d}")
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _prepare_job(db, user_id: int) -> ImportJob:
+    digest, size = spool.put(io.BytesIO(_csv()))
+    session = ImportSession(
+        user_id=user_id,
+        status=ImportStatus.NORMALIZING,
+        file_name="leads.csv",
+        file_sha256=digest,
+        file_size=size,
+        total_rows=ROWS,
+        user_mappings={"name": "full_name", "email": "email", "phone": "phone"}
+    )
+    db.add(session)
+    db.flush()
+
+    job = ImportJob(
+        session_id=session.id,
+        kind=import_jobs.PREPARE_JOB,
+        status=JobStatus.RUNNING,
+        attempts=1
+    )
+    db.add(job)
+    db.commit()
+    return job
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(AnalyzerService, "CHUNK_ROWS", CHUNK_ROWS)
+
+
+def _output(db, job: ImportJob):
+    session = db.get(ImportSession, job.session_id)
+    manager = SessionManager(db)
+    return session.status, manager.get_normalized_rows(session), manager.get_validation_errors(session)
+
+
+def test_prepare_resumes_after_last_committed_chunk(db, users, small_chunks, monkeypatch):
+    reference = _prepare_job(db, users["admin"])
+    import_jobs.run_prepare(JobContext(db, reference))
+    expected = _output(db, reference)
+    assert expected[0] == ImportStatus.READY
+    assert len(expected[1]) + len(expected[2]) == ROWS
+
+    job = _prepare_job(db, users["admin"])
+    normalized = []
+    original = NormalizerService.normalize_dataframe
+
+    def normalize_dataframe(self, df, *args, **kwargs):
+        if len(normalized) == 2 and not resumed:
+            raise Interrupted()
+        normalized.append(len(df))
+        return original(self, df, *args, **kwargs)
+
+    monkeypatch.setattr(NormalizerService, "normalize_dataframe", normalize_dataframe)
+
+    # First run dies while normalizing the third chunk
+    resumed = False
+    with pytest.raises(Interrupted):
+        import_jobs.run_prepare(JobContext(db, job))
+    db.rollback()
+
+    db.refresh(job)
+    assert job.phase == "normalizing"
+    assert job.processed == 2 * CHUNK_ROWS
+    chunks = job.checkpoint["chunks"]
+    assert len(chunks) == 2
+
+    # The restarted run only normalizes the rows after the checkpoint
+    resumed = True
+    normalized.clear()
+    import_jobs.run_prepare(JobContext(db, job))
+
+    assert normalized == [CHUNK_ROWS, ROWS - 3 * CHUNK_ROWS]
+    assert _output(db, job) == expected
+    assert not any(spool.exists(digest) for digest in chunks)
@@ -0,0 +1,144 @@
+"""
+Index usage of the owner-scoped list and analytics queries.
+
+Runs the real crud and analytics functions against the test schema,
+captures the statements they execute and checks SQLite's plan for each.
+A ``SCAN <table>`` reads the whole table: without an index when a filter
+column lost its index, or in the order of the sort index when a composite
+index lost its filter columns (see migrations e5a9c2d7b3f1 and
+f2b7d4e9a1c6). Only covering index scans, e.g. the unscoped pipeline
+totals, are expected.
+"""
+import re
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.core.pagination import encode_cursor
+from app.core.principal import Principal
+from app.crud import deal as deal_crud
+from app.crud import lead as lead_crud
+from app.crud import task as task_crud
+from app.models import Base, DealStage, LeadStatus, TaskStatus
+from app.models.user import UserRole
+from app.services import analytics_service
+from app.services.lead_import.deduplicator import DeduplicatorService
+
+
+TABLES = set(Base.metadata.tables)
+
+SCAN = re.compile(r"\bSCAN (\w+)")
+
+
+@contextmanager
+def captured_selects(db):
+    """Collect (statement, parameters) of the SELECTs run on the session's engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _table_scans(db, statement, parameters):
+    """Plan rows of a statement that read a whole table (other than a covering index)."""
+    plan = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    scans = []
+    for row in plan:
+        detail = row[-1]
+        match = SCAN.search(detail)
+        if match and match.group(1) in TABLES and "USING COVERING INDEX" not in detail:
+            scans.append(detail)
+    return scans
+
+
+def _assert_indexed(db, run):
+    with captured_selects(db) as statements:
+        run()
+
+    assert statements
+    for statement, parameters in statements:
+        scans = _table_scans(db, statement, parameters)
+        assert not scans, f"{scans} in plan of:\n{statement}"
+
+
+@pytest.fixture
+def sales(users):
+    return Principal(id=users["sales"], email="sales@example.com", role=UserRole.SALES, is_active=True)
+
+
+# ========== Lists ==========
+
+@pytest.mark.parametrize("status", [None, LeadStatus.NEW])
+def test_lead_list_by_owner(db, crm_data, users, status):
+    _assert_indexed(db, lambda: lead_crud.get_leads(db, assigned_to_id=users["sales"], status=status))
+
+
+def test_lead_list_by_status(db, crm_data):
+    _assert_indexed(db, lambda: lead_crud.get_leads(db, status=LeadStatus.NEW))
+
+
+@pytest.mark.parametrize("status", [None, LeadStatus.NEW])
+def test_lead_keyset_page_by_owner(db, crm_data, users, status):
+    cursor = encode_cursor([datetime(2025, 6, 1), 200])
+    _assert_indexed(db, lambda: lead_crud.get_leads(
+        db, assigned_to_id=users["sales"], status=status, cursor=cursor
+    ))
+
+
+@pytest.mark.parametrize("stage", [None, DealStage.PROPOSAL])
+def test_deal_list_by_owner(db, crm_data, users, stage):
+    _assert_indexed(db, lambda: deal_crud.get_deals(db, owner_id=users["sales"], stage=stage))
+
+
+def test_deal_keyset_page_by_stage(db, crm_data):
+    cursor = encode_cursor([datetime(2025, 6, 1), 200])
+    _assert_indexed(db, lambda: deal_crud.get_deals(db, stage=DealStage.PROPOSAL, cursor=cursor))
+
+
+@pytest.mark.parametrize("owned", [False, True])
+def test_pipeline_view(db, crm_data, users, owned):
+    owner_id = users["sales"] if owned else None
+    _assert_indexed(db, lambda: deal_crud.get_pipeline_view(db, owner_id=owner_id))
+
+
+@pytest.mark.parametrize("status", [None, TaskStatus.PENDING])
+def test_task_list_by_assignee(db, crm_data, users, status):
+    _assert_indexed(db, lambda: task_crud.get_tasks(db, assigned_to_id=users["sales"], status=status))
+
+
+@pytest.mark.parametrize("status", [None, TaskStatus.PENDING])
+def test_task_keyset_page_by_assignee(db, crm_data, users, status):
+    cursor = encode_cursor([date.today(), datetime(2025, 6, 1), 200])
+    _assert_indexed(db, lambda: task_crud.get_tasks(
+        db, assigned_to_id=users["sales"], status=status, cursor=cursor
+    ))
+
+
+def test_existing_leads_by_phone(db, crm_data):
+    rows = [{"_row_num": i, "email": "", "phone": f"555{i:07d}"} for i in range(50)]
+    _assert_indexed(db, lambda: DeduplicatorService.find_existing_duplicates(db, rows))
+
+
+# ========== Analytics ==========
+
+@pytest.mark.parametrize("report", [
+    analytics_service.get_dashboard_overview,
+    analytics_service.get_lead_analytics,
+    analytics_service.get_deal_analytics,
+    analytics_service.get_sales_performance,
+    analytics_service.get_task_analytics,
+])
+def test_sales_user_analytics(db, crm_data, sales, monkeypatch, report):
+    monkeypatch.setattr(analytics_service.settings, "ANALYTICS_ROLLUP_ENABLED", False)
+    # Bypass the response cache so the queries run
+    _assert_indexed(db, lambda: report.__wrapped__(db, sales))
@@ -0,0 +1,89 @@
+"""
+Smart duplicate matching through the lead name blocking index.
+"""
+import pytest
+
+from app.core.database import SessionLocal
+from app.models import Customer, Lead
+from app.models.lead_match_key import LeadMatchKey
+from app.services.lead_import.deduplicator import DeduplicatorService
+from app.services.lead_import.match_index import MatchIndexService
+
+
+COMMON_NAME = "Zebulon Quartermaine"
+
+
+@pytest.fixture(scope="module")
+def common_name_leads(db_engine, users):
+    """More leads named COMMON_NAME than a block may return."""
+    db = SessionLocal()
+    try:
+        count = MatchIndexService.MAX_BLOCK_SIZE + 100
+        db.add_all(
+            Lead(full_name=COMMON_NAME, email=f"zq{i}@example.com", created_by_id=users["admin"])
+            for i in range(count)
+        )
+        db.commit()
+        return count
+    finally:
+        db.close()
+
+
+def _row(full_name: str) -> dict:
+    return {"_row_num": 2, "full_name": full_name, "email": "new@example.com", "company": "Acme"}
+
+
+@pytest.mark.parametrize("name,similarity", [
+    (COMMON_NAME, 100.0),
+    ("Zebulon Quartermain", 97.4),
+])
+def test_matches_name_with_oversized_blocks(db, common_name_leads, name, similarity):
+    matches = DeduplicatorService.find_smart_matches(db, [_row(name)], [])
+
+    assert len(matches) == 1
+    assert matches[0]["existing_lead"]["full_name"] == COMMON_NAME
+    assert matches[0]["similarity"] == similarity
+
+
+def test_oversized_blocks_bounded_per_key(db, common_name_leads):
+    name_key = f"nm:{COMMON_NAME.lower()}"
+    assert db.query(LeadMatchKey).filter(LeadMatchKey.key == name_key).count() == common_name_leads
+
+    candidates = MatchIndexService.find_candidates(db, {0: COMMON_NAME})
+
+    keys = MatchIndexService.probe_keys(COMMON_NAME)
+    assert name_key in keys
+    assert 0 < len(candidates[0]) <= MatchIndexService.MAX_BLOCK_SIZE * len(keys)
+
+
+def test_first_use_build_joins_callers_transaction(db, users, common_name_leads):
+    cleared = SessionLocal()
+    try:
+        cleared.query(LeadMatchKey).delete()
+        cleared.commit()
+    finally:
+        cleared.close()
+
+    # Pending work of the caller (e.g. an import job) must not be committed
+    db.add(Customer(full_name="Pending Person", email="pending@example.com", created_by_id=users["admin"]))
+    db.flush()
+    MatchIndexService.ensure_built(db)
+    assert db.query(LeadMatchKey).count() > 0
+    db.rollback()
+
+    check = SessionLocal()
+    try:
+        assert check.query(Customer).filter(Customer.full_name == "Pending Person").count() == 0
+        assert check.query(LeadMatchKey).count() == 0
+    finally:
+        check.close()
+
+    # Committed with the caller's transaction
+    MatchIndexService.ensure_built(db)
+    db.commit()
+
+    check = SessionLocal()
+    try:
+        assert check.query(LeadMatchKey).count() > 0
+    finally:
+        check.close()
@@ -0,0 +1,147 @@
+"""
+Parity of the columnar import normalizer with the per-row path.
+
+``NormalizerService.normalize_dataframe`` must produce exactly what
+``normalize_data`` produces on ``df.to_dict(orient='records')``; these tests
+compare both on generated frames mixing the cell types a CSV/Excel read can
+produce (1 / 1.0 / True, NaN / None, padded and unicode strings, invalid
+emails) with merge rules and the row numbering of later chunks.
+"""
+import math
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.lead_import.normalizer import NormalizerService
+
+
+CELLS = [
+    None, np.nan, "", "   ", 1, 1.0, True, False, 0, 0.0, 42.5,
+    "alice", "  alice  ", "ALICE", "bob  van   der berg", "Ünïcødé Nämé", "李 小龙", "o'neil",
+    "a@b.co", " A@B.CO ", "a@b.co", "a..b@example.com", "first last@example.com", "bad@", "@x.com", "x@y",
+    "+1 (555) 123-4567", "555-1234", "555-12", "+44 20 7946 0958", "(020) 7946-0958 ext. 12",
+    "website", "Web", " REFERRAL ", "ads", "cold", "trade show", "Campaign",
+    "Acme Inc", "  Acme Inc  ", "note\nwith newline",
+]
+
+# Columns of one type only, as pandas reads them from a file
+TYPED_COLUMNS = [
+    [1, 2, 3, None],  # float64 with NaN
+    [True, False, True, True],  # bool
+    ["x@y.com", "A@B.CO", "bad", "  z@z.io "],  # str
+    [5551234567, 4420794609, 1, 0],  # int64
+]
+
+FIELDS = ["full_name", "first_name", "last_name", "email", "phone", "company", "source", "notes"]
+
+MERGE_RULES = [
+    [{"target": "full_name", "sources": ["first_name", "last_name"], "separator": " "}],
+    [{"target": "notes", "sources": ["company", "source"], "separator": " | "}],
+    [{"target": "company", "sources": ["notes"]}],
+    [{"target": "first_name", "sources": ["first_name", "last_name"], "separator": "-"}],
+    [
+        {"target": "full_name", "sources": ["first_name", "missing"], "separator": " "},
+        {"target": "notes", "sources": ["full_name", "email"], "separator": "; "},
+    ],
+    [{"target": "", "sources": ["email"]}, {"target": "notes", "sources": []}],
+]
+
+
+def _canonical(value):
+    """Make results comparable: NaN != NaN, and numpy scalars vs Python ones."""
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    if isinstance(value, float) and math.isnan(value):
+        return "<nan>"
+    if isinstance(value, np.generic):
+        return _canonical(value.item())
+    return value
+
+
+def _random_case(seed: int):
+    """A frame, its mappings and merge rules drawn from ``seed``."""
+    rng = random.Random(seed)
+    rows = rng.randint(1, 40)
+    data = {}
+
+    for position in range(rng.randint(1, 8)):
+        column = f"col_{position}"
+        if rng.random() < 0.2:
+            typed = rng.choice(TYPED_COLUMNS)
+            data[column] = [typed[rng.randrange(len(typed))] for _ in range(rows)]
+        else:
+            # Few distinct values per column, like real imports
+            pool = rng.sample(CELLS, rng.randint(1, 6))
+            data[column] = [rng.choice(pool) for _ in range(rows)]
+
+    df = pd.DataFrame(data)
+    # Some columns unmapped, several may map to the same field (last wins)
+    mappings = {
+        column: rng.choice(FIELDS)
+        for column in df.columns
+        if rng.random() < 0.85
+    }
+    merge_rules = rng.choice(MERGE_RULES) if rng.random() < 0.4 else None
+    return df, mappings, merge_rules
+
+
+def _assert_parity(df, mappings, merge_rules, start_row=2):
+    normalizer = NormalizerService()
+    expected_valid, expected_invalid = normalizer.normalize_data(
+        df.to_dict(orient="records"), mappings, merge_rules
+    )
+    offset = start_row - 2
+    for row in expected_valid:
+        row["_row_num"] += offset
+    for row in expected_invalid:
+        row["row"] += offset
+
+    valid, invalid = normalizer.normalize_dataframe(df, mappings, merge_rules, start_row=start_row)
+
+    assert _canonical(valid) == _canonical(expected_valid)
+    assert _canonical(invalid) == _canonical(expected_invalid)
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_matches_per_row_path(seed):
+    _assert_parity(*_random_case(seed))
+
+
+@pytest.mark.parametrize("seed", range(0, 300, 30))
+def test_later_chunks_continue_row_numbers(seed):
+    df, mappings, merge_rules = _random_case(seed)
+    split = len(df) // 2
+
+    # A later chunk, with the index pandas gives it when reading in chunks
+    _assert_parity(df.iloc[split:], mappings, merge_rules, start_row=split + 2)
+
+
+def test_all_fields_mapped():
+    df = pd.DataFrame({
+        "name": ["  jane   DOE ", None, "x", 1.0],
+        "mail": [" Jane@Example.COM ", "bob@example.com", "nope", True],
+        "tel": ["+1 (555) 123-4567", 5551234567, "12", None],
+        "org": ["  Acme  ", "", np.nan, 0],
+        "src": ["Web", "referral", "unknown", None],
+        "memo": ["note", "   ", None, 1],
+    })
+    mappings = {
+        "name": "full_name", "mail": "email", "tel": "phone",
+        "org": "company", "src": "source", "memo": "notes",
+    }
+    _assert_parity(df, mappings, None)
+    _assert_parity(df, mappings, None, start_row=1002)
+
+
+def test_first_and_last_name_merge():
+    df = pd.DataFrame({
+        "first": ["  ann", None, "", 1, "ÉMILE"],
+        "last": ["lee  ", "solo", None, 1.0, "zola"],
+        "email": ["a@b.co"] * 5,
+    })
+    _assert_parity(df, {"first": "first_name", "last": "last_name", "email": "email"}, None)
+    _assert_parity(df, {"first": "first_name", "email": "email"}, MERGE_RULES[0])
@@ -0,0 +1,101 @@
+"""
+SQL statement budgets of the list endpoints.
+
+Every list endpoint must serve a page of several hundred records, with
+their relationships, in at most LIST_QUERY_BUDGET statements. A page that
+lazy-loads a relationship per row (a dropped ``response_options`` or
+``response_rows`` join) runs one statement per distinct related record
+and fails here.
+"""
+import pytest
+
+from app.api.deps import LIST_QUERY_BUDGET
+from app.core.database import SessionLocal
+from app.core.query_counter import count_queries
+from app.models import Customer, CustomerInteraction, InteractionType, Lead, LeadNote
+
+
+LIST_REQUESTS = [
+    ("/api/v1/leads/", {"limit": 500}),
+    ("/api/v1/leads/", {"limit": 100, "status": "New", "count": "estimate"}),
+    ("/api/v1/leads/", {"search": "Lead 1", "count": "none"}),
+    ("/api/v1/customers/", {"limit": 500}),
+    ("/api/v1/customers/", {"search": "Customer 2"}),
+    ("/api/v1/deals/", {"limit": 500}),
+    ("/api/v1/deals/", {"stage": "Proposal", "count": "none"}),
+    ("/api/v1/deals/pipeline", {}),
+    ("/api/v1/tasks/", {"limit": 500}),
+    ("/api/v1/tasks/", {"status": "Pending", "related_type": "deal"}),
+    ("/api/v1/search/", {"q": "lead", "limit": 100}),
+]
+
+LIST_KEYS = ("leads", "customers", "deals", "tasks", "results", "pipeline")
+
+
+def _get_within_budget(client, path, params, headers):
+    with count_queries() as counter:
+        response = client.get(path, params=params, headers=headers)
+
+    assert response.status_code == 200, response.text
+    assert counter.count <= LIST_QUERY_BUDGET, (
+        f"{path} {params} ran {counter.count} statements (budget {LIST_QUERY_BUDGET})"
+    )
+    return response.json()
+
+
+def _items(body):
+    if isinstance(body, list):
+        return body
+    return next(body[key] for key in LIST_KEYS if key in body)
+
+
+@pytest.mark.parametrize("role", ["admin", "sales"])
+@pytest.mark.parametrize("path,params", LIST_REQUESTS)
+def test_list_within_budget(client, auth_headers, crm_data, role, path, params):
+    body = _get_within_budget(client, path, params, auth_headers(role))
+    # A page without rows would pass any budget
+    assert _items(body)
+
+
+@pytest.mark.parametrize("path", ["/api/v1/leads/", "/api/v1/customers/", "/api/v1/deals/", "/api/v1/tasks/"])
+def test_cursor_page_within_budget(client, auth_headers, crm_data, path):
+    headers = auth_headers("admin")
+    first = client.get(path, params={"limit": 100}, headers=headers).json()
+    assert first["next_cursor"]
+
+    body = _get_within_budget(client, path, {"limit": 100, "cursor": first["next_cursor"]}, headers)
+    assert len(_items(body)) == 100
+
+
+@pytest.fixture(scope="module")
+def busy_records(db_engine, users, crm_data):
+    """A lead with notes and a customer with interactions by every user."""
+    db = SessionLocal()
+    try:
+        lead = db.query(Lead).order_by(Lead.id).first()
+        customer = db.query(Customer).order_by(Customer.id).first()
+        for i in range(40):
+            user_id = list(users.values())[i % len(users)]
+            db.add(LeadNote(lead_id=lead.id, user_id=user_id, note_text=f"Note {i}"))
+            db.add(CustomerInteraction(
+                customer_id=customer.id,
+                user_id=user_id,
+                interaction_type=InteractionType.CALL,
+                description=f"Interaction {i}"
+            ))
+        db.commit()
+        return lead.id, customer.id
+    finally:
+        db.close()
+
+
+def test_lead_notes_within_budget(client, auth_headers, busy_records):
+    lead_id, _ = busy_records
+    notes = _get_within_budget(client, f"/api/v1/leads/{lead_id}/notes", {}, auth_headers("admin"))
+    assert len({note["user"]["id"] for note in notes}) > 1
+
+
+def test_customer_interactions_within_budget(client, auth_headers, busy_records):
+    _, customer_id = busy_records
+    interactions = _get_within_budget(client, f"/api/v1/customers/{customer_id}/interactions", {}, auth_headers("admin"))
+    assert len({interaction["user"]["id"] for interaction in interactions}) > 1
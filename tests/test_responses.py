@@ -0,0 +1,41 @@
+"""
+Parity of the fast list responses with their response models.
+
+List endpoints build dicts from ``response_rows`` and render them with
+``FastJSONResponse``; the JSON must be what validating the same ORM page
+through the response schema would produce (see
+``benchmarks/list_serialization.py`` for the timings).
+"""
+import pytest
+
+from app.core.pagination import CountMode
+from app.crud import customer as customer_crud
+from app.crud import deal as deal_crud
+from app.crud import lead as lead_crud
+from app.crud import task as task_crud
+from app.crud.loading import response_options
+from app.models import Customer, Deal, Lead, Task
+from app.schemas.customer import CustomerResponse
+from app.schemas.deal import DealResponse
+from app.schemas.lead import LeadResponse
+from app.schemas.task import TaskResponse
+
+
+LIMIT = 500
+
+
+@pytest.mark.parametrize("path,key,get_page,model,schema", [
+    ("/api/v1/leads/", "leads", lead_crud.get_leads, Lead, LeadResponse),
+    ("/api/v1/customers/", "customers", customer_crud.get_customers, Customer, CustomerResponse),
+    ("/api/v1/deals/", "deals", deal_crud.get_deals, Deal, DealResponse),
+    ("/api/v1/tasks/", "tasks", task_crud.get_tasks, Task, TaskResponse),
+])
+def test_list_matches_response_model(client, auth_headers, db, crm_data, path, key, get_page, model, schema):
+    response = client.get(path, params={"limit": LIMIT, "count": "none"}, headers=auth_headers("admin"))
+    assert response.status_code == 200, response.text
+
+    records, _ = get_page(db, limit=LIMIT, count_mode=CountMode.NONE, options=response_options(model, schema))
+    expected = [schema.model_validate(record).model_dump(mode="json") for record in records]
+
+    assert len(expected) >= crm_data[key]
+    assert response.json()[key] == expected
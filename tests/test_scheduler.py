@@ -0,0 +1,63 @@
+"""
+Single-runner leases of the periodic job scheduler.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.models.scheduled_job import ScheduledJob
+from app.services import scheduler
+
+
+INTERVAL = 60
+
+
+@pytest.fixture
+def job(db):
+    """A registered job with its scheduled_jobs row, due now."""
+    name = "test_job"
+    scheduler.register_job(name, INTERVAL, lambda session: 7)
+    scheduler._ensure_rows(db)
+    yield scheduler._jobs[name]
+    scheduler._jobs.pop(name)
+    db.query(ScheduledJob).filter(ScheduledJob.name == name).delete()
+    db.commit()
+
+
+def _row(db, job) -> ScheduledJob:
+    db.expire_all()
+    return db.query(ScheduledJob).filter(ScheduledJob.name == job.name).one()
+
+
+def test_lease_held_until_it_expires(db, job):
+    now = datetime.utcnow()
+    assert scheduler._claim(db, job, now)
+
+    # Due again after one interval, but the first run still holds the lease
+    assert not scheduler._claim(db, job, now)
+    assert not scheduler._claim(db, job, now + timedelta(seconds=INTERVAL + 1))
+
+    expired = now + timedelta(seconds=settings.SCHEDULER_LEASE_SECONDS + 1)
+    assert scheduler._claim(db, job, expired)
+    assert _row(db, job).locked_until == expired + timedelta(seconds=settings.SCHEDULER_LEASE_SECONDS)
+
+
+def test_run_now_while_running_keeps_schedule(db, job):
+    assert scheduler._claim(db, job, datetime.utcnow())
+    next_run_at = _row(db, job).next_run_at
+
+    with pytest.raises(RuntimeError):
+        scheduler.run_now(db, job.name)
+
+    assert _row(db, job).next_run_at == next_run_at
+
+
+def test_run_now_ignores_schedule(db, job):
+    assert scheduler._claim(db, job, datetime.utcnow())
+    scheduler._record(db, job, 0.0, 1, None)
+    assert _row(db, job).next_run_at > datetime.utcnow()
+
+    assert scheduler.run_now(db, job.name) == 7
+    row = _row(db, job)
+    assert (row.locked_until, row.run_count) == (None, 2)
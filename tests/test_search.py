@@ -0,0 +1,59 @@
+"""
+Ranking of full-text search results.
+"""
+import pytest
+
+from app.core.database import SessionLocal
+from app.models import Lead
+from app.services.search_service import SearchBackend
+
+
+@pytest.fixture(scope="module")
+def many_matches(db_engine, users):
+    """
+    More than CANDIDATE_LIMIT leads matching "quokka" in their body
+    (email), then one matching it in the title (name), indexed last.
+    """
+    db = SessionLocal()
+    try:
+        count = SearchBackend.CANDIDATE_LIMIT + 200
+        db.add_all(
+            Lead(full_name=f"Member {i}", email=f"quokka.{i}@example.com", created_by_id=users["admin"])
+            for i in range(count)
+        )
+        db.flush()
+        best = Lead(full_name="Quokka Wallaby", email="qw@example.com", created_by_id=users["admin"])
+        db.add(best)
+        db.commit()
+        return best.id
+    finally:
+        db.close()
+
+
+def _search(client, headers, q, limit=5):
+    response = client.get("/api/v1/search/", params={"q": q, "limit": limit}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["results"]
+
+
+def test_best_match_ranked_among_all_matches(client, auth_headers, many_matches):
+    results = _search(client, auth_headers("admin"), "quokka")
+
+    assert results[0]["entity"] == "lead"
+    assert results[0]["id"] == many_matches
+    scores = [result["score"] for result in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_every_term_must_match(client, auth_headers, many_matches):
+    results = _search(client, auth_headers("admin"), "quok walla")
+
+    assert [result["id"] for result in results] == [many_matches]
+
+
+def test_one_letter_query_returns_ranked_candidates(client, auth_headers, many_matches):
+    results = _search(client, auth_headers("admin"), "q", limit=20)
+
+    assert len(results) == 20
+    scores = [result["score"] for result in results]
+    assert scores == sorted(scores, reverse=True)